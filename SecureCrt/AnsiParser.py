@@ -0,0 +1,238 @@
+import re
+from typing import List, Tuple
+
+# 记号类型
+TEXT = "text"          # (TEXT, 文本)
+CONTROL = "control"    # (CONTROL, 控制字符)，如 "\r"、"\n"、"\b"
+ESC = "esc"            # (ESC, 中间字符, 结束字符)，如 ESC 7、ESC ( B
+CSI = "csi"            # (CSI, 私有前缀, 参数元组, 中间字符, 结束字符)，如 ESC [ ? 25 h
+OSC = "osc"            # (OSC, 内容)，如 ESC ] 0 ; title BEL
+STRING = "string"      # (STRING, 引导字符, 内容)，DCS、SOS、PM、APC 字符串
+
+# 解析器状态
+_GROUND = 0
+_ESCAPE = 1
+_ESCAPE_INTERMEDIATE = 2
+_CSI_ENTRY = 3
+_CSI_PARAM = 4
+_CSI_INTERMEDIATE = 5
+_CSI_IGNORE = 6
+_OSC_STRING = 7
+_SOS_PM_APC_STRING = 8
+
+# 动作
+_NONE = 0
+_EXECUTE = 1
+_COLLECT = 2
+_PARAM = 3
+_PREFIX = 4
+_ESC_DISPATCH = 5
+_CSI_DISPATCH = 6
+_PUT = 7
+_STRING_END = 8
+_CLEAR = 9
+_STRING_START = 10
+
+_HIGH = 0xA0  # 所有 >= 0xA0 的字符归为同一类
+
+
+def _build_tables():
+    tables = []
+    for state in range(9):
+        table = [(_NONE, state)] * (_HIGH + 1)
+
+        def put(chars, action, next_state):
+            for code in chars:
+                table[code] = (action, next_state)
+
+        c0 = [code for code in range(0x20) if code not in (0x18, 0x1A, 0x1B)]
+        if state in (_OSC_STRING, _SOS_PM_APC_STRING):
+            put(range(0x20), _NONE, state)
+            put(range(0x20, 0x80), _PUT, state)
+            put([_HIGH], _PUT, state)
+            put(range(0x80, 0xA0), _PUT, state)
+            put([0x07], _STRING_END, _GROUND)
+        elif state == _GROUND:
+            put(c0, _EXECUTE, _GROUND)
+            put(range(0x20, 0x80), _NONE, _GROUND)
+        elif state in (_ESCAPE, _ESCAPE_INTERMEDIATE):
+            put(c0, _EXECUTE, state)
+            put(range(0x20, 0x30), _COLLECT, _ESCAPE_INTERMEDIATE)
+            put(range(0x30, 0x7F), _ESC_DISPATCH, _GROUND)
+            if state == _ESCAPE:
+                put([0x5B], _CLEAR, _CSI_ENTRY)
+                put([0x5D], _STRING_START, _OSC_STRING)
+                put([0x50, 0x58, 0x5E, 0x5F], _STRING_START, _SOS_PM_APC_STRING)
+        else:
+            put(c0, _EXECUTE, state)
+            if state == _CSI_IGNORE:
+                put(range(0x20, 0x40), _NONE, _CSI_IGNORE)
+                put(range(0x40, 0x7F), _NONE, _GROUND)
+            else:
+                put(range(0x40, 0x7F), _CSI_DISPATCH, _GROUND)
+                put(range(0x20, 0x30), _COLLECT, _CSI_INTERMEDIATE)
+                if state == _CSI_INTERMEDIATE:
+                    put(range(0x30, 0x40), _NONE, _CSI_IGNORE)
+                else:
+                    put(range(0x30, 0x3C), _PARAM, _CSI_PARAM)
+                    put(range(0x3C, 0x40), _PREFIX if state == _CSI_ENTRY else _NONE,
+                        _CSI_PARAM if state == _CSI_ENTRY else _CSI_IGNORE)
+            put([0x7F, _HIGH], _NONE, state)
+        # 在任何状态下都有效的转移
+        if state not in (_OSC_STRING, _SOS_PM_APC_STRING):
+            put([0x18, 0x1A], _EXECUTE, _GROUND)
+            put([0x9B], _CLEAR, _CSI_ENTRY)
+            put([0x9D], _STRING_START, _OSC_STRING)
+            put([0x90, 0x98, 0x9E, 0x9F], _STRING_START, _SOS_PM_APC_STRING)
+            put([0x9C], _NONE, _GROUND)
+        else:
+            put([0x18, 0x1A], _STRING_END, _GROUND)
+            put([0x9C], _STRING_END, _GROUND)
+        put([0x1B], _CLEAR if state not in (_OSC_STRING, _SOS_PM_APC_STRING) else _STRING_END, _ESCAPE)
+        tables.append(table)
+    return tables
+
+
+_TABLES = _build_tables()
+_SPECIAL = re.compile("[\x00-\x1f\x7f-\x9f]")
+_KEEP_CONTROLS = "\b\t\n\r"
+
+
+class AnsiParser:
+    """
+    AnsiParser 是一个增量式、表驱动的 VT/ANSI 转义序列解析器。
+
+    当 Screen.IgnoreEscape 为 False 时，ReadString 返回的数据中包含 CSI、OSC 等转义序列。
+    AnsiParser 按照 DEC VT 解析器的状态机，对每个字符查一次状态转移表，
+    单遍处理数据且不回溯；普通文本则整段复制。
+    解析状态在数据块之间保持，转义序列可以跨越 ReadString 返回的多个数据块。
+
+    Feed 返回记号列表，Strip 只返回去除转义序列后的文本。
+
+    示例：
+    parser = AnsiParser()
+    while True:
+        text = parser.Strip(crt.Screen.ReadString(["\\n"], 5))
+    """
+    __slots__ = ("_state", "_prefix", "_params", "_intermediates", "_string", "_introducer")
+
+    def __init__(self):
+        """
+        初始化 AnsiParser 对象
+        """
+        self.Reset()
+
+    def Reset(self) -> None:
+        """
+        丢弃未完成的转义序列，回到初始状态。
+        """
+        self._state = _GROUND
+        self._clear()
+
+    def _clear(self):
+        self._prefix = ""
+        self._params = []
+        self._intermediates = ""
+        self._string = []
+        self._introducer = ""
+
+    def _params_tuple(self) -> Tuple[int, ...]:
+        text = "".join(self._params)
+        if not text:
+            return ()
+        return tuple(int(value) if value else 0 for value in text.replace(":", ";").split(";"))
+
+    def Feed(self, data: str) -> List[tuple]:
+        """
+        解析一个数据块并返回其中完整的记号。
+
+        未完成的转义序列保存在解析器中，在后续数据块到达时继续解析。
+
+        Args:
+            data (str): 从 ReadString 读取的数据
+
+        Returns:
+            List[tuple]: 记号列表，记号格式见模块中的 TEXT、CONTROL、ESC、CSI、OSC、STRING 说明
+        """
+        tokens = []
+        self._run(data, tokens, False)
+        return tokens
+
+    def Strip(self, data: str) -> str:
+        """
+        去除数据块中的转义序列，只返回文本。
+
+        保留 \\b、\\t、\\n、\\r 控制字符，丢弃其他控制字符。
+
+        Args:
+            data (str): 从 ReadString 读取的数据
+
+        Returns:
+            str: 去除转义序列后的文本
+        """
+        parts = []
+        self._run(data, parts, True)
+        return "".join(parts)
+
+    def _run(self, data, out, strip):
+        tables = _TABLES
+        search = _SPECIAL.search
+        state = self._state
+        length = len(data)
+        position = 0
+        while position < length:
+            if state == _GROUND:
+                match = search(data, position)
+                end = match.start() if match else length
+                if end > position:
+                    out.append(data[position:end] if strip else (TEXT, data[position:end]))
+                    position = end
+                    if position >= length:
+                        break
+            char = data[position]
+            code = ord(char)
+            action, next_state = tables[state][code if code < _HIGH else _HIGH]
+            position += 1
+            if action == _NONE:
+                pass
+            elif action == _EXECUTE:
+                if strip:
+                    if char in _KEEP_CONTROLS:
+                        out.append(char)
+                else:
+                    out.append((CONTROL, char))
+            elif action == _COLLECT:
+                self._intermediates += char
+            elif action == _PARAM:
+                self._params.append(char)
+            elif action == _PREFIX:
+                self._prefix += char
+            elif action == _CLEAR:
+                self._clear()
+            elif action == _ESC_DISPATCH:
+                if not strip:
+                    out.append((ESC, self._intermediates, char))
+                self._clear()
+            elif action == _CSI_DISPATCH:
+                if not strip:
+                    out.append((CSI, self._prefix, self._params_tuple(), self._intermediates, char))
+                self._clear()
+            elif action == _STRING_START:
+                self._clear()
+                self._introducer = char
+            elif action == _PUT:
+                # 字符串内容整段收集，直到遇到结束字符
+                match = search(data, position)
+                end = match.start() if match else length
+                self._string.append(data[position - 1:end])
+                position = end
+            elif action == _STRING_END:
+                if not strip:
+                    content = "".join(self._string)
+                    if self._introducer in ("]", "\x9d"):
+                        out.append((OSC, content))
+                    else:
+                        out.append((STRING, self._introducer, content))
+                self._clear()
+            state = next_state
+        self._state = state
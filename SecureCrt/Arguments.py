@@ -14,6 +14,8 @@ class Arguments:
     hostname = crt.Arguments.GetArg(0)  # 或 crt.Arguments[0]
     port = crt.Arguments.GetArg(1)      # 或 crt.Arguments[1]
     """
+    __slots__ = ("crt",)
+
     def __init__(self, crt):
         self.crt = crt
 
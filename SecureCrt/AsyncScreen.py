@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+from typing import List, Optional
+from .Expect import ExpectMatch
+from .CommandResult import CommandResult
+
+class AsyncScreen:
+    """
+    AsyncScreen 是 Screen 对象的 asyncio 适配器。
+
+    WaitForString、WaitForStrings、ReadString 会阻塞脚本，一次只能等待一个选项卡。
+    AsyncScreen 改为在事件循环中用只等待 1 毫秒的 ReadString 进行短轮询
+    （不带参数的 ReadString() 在没有数据时会一直阻塞，不能用于轮询）：
+    有数据时交给 ExpectMatcher 匹配，没有数据时通过 asyncio.sleep 让出控制权，
+    因此多个选项卡上的等待可以在同一个事件循环中并发进行，超时也能按时生效。
+
+    所有 COM 调用都在事件循环所在的线程中进行；
+    如果在创建 AsyncScreen 的线程之外调用，将引发 RuntimeError。
+    为避免错过数据，等待期间应将对应 Screen 的 Synchronous 设置为 True。
+
+    示例：
+    async def main():
+        tabs = [AsyncTab(crt.GetTab(i)) for i in range(1, crt.GetTabCount() + 1)]
+        matches = await asyncio.gather(*(tab.Expect(["#", ">"], 10) for tab in tabs))
+    asyncio.run(main())
+    """
+    __slots__ = ("screen", "poll_interval", "_owner")
+
+    def __init__(self, screen, poll_interval: float = 0.01):
+        """
+        初始化 AsyncScreen 对象
+
+        Args:
+            screen: Screen 对象
+            poll_interval (float, optional): 没有数据时两次轮询之间的秒数。默认为0.01
+        """
+        self.screen = screen
+        self.poll_interval = poll_interval
+        self._owner = threading.get_ident()
+
+    def _check_thread(self) -> None:
+        if threading.get_ident() != self._owner:
+            raise RuntimeError("COM objects must be used from the thread that created them")
+
+    async def _wait(self, wait, deadline: Optional[float]):
+        # 与 Screen._wait 相同，但在没有数据时让出事件循环
+        self._check_thread()
+        while True:
+            received = wait.Collect(1)
+            if wait.match is not None or (deadline is not None and time.monotonic() >= deadline):
+                return wait
+            await asyncio.sleep(0 if received else self.poll_interval)
+
+    async def Expect(self, patterns, timeout: float = 0, bCaseInsensitive: bool = False) -> Optional[ExpectMatch]:
+        """
+        异步等待字符串或正则表达式模式中的一个出现在输入中，语义与 Screen.Expect 相同。
+
+        Args:
+            patterns: 字符串或已编译正则表达式，或它们的列表
+            timeout (float, optional): 等待超时秒数。默认为0，表示无超时
+            bCaseInsensitive (bool, optional): 是否忽略大小写。默认为False
+
+        Returns:
+            Optional[ExpectMatch]: 匹配结果，如果超时则返回None
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        return (await self._wait(self.screen._begin_expect(patterns, bCaseInsensitive), deadline)).match
+
+    async def WaitForString(self, string: str, timeout: float = 0, bCaseInsensitive: bool = False) -> bool:
+        """
+        异步等待指定字符串出现在输入中。
+
+        Args:
+            string (str): 要等待的字符串
+            timeout (float, optional): 等待超时秒数。默认为0，表示无超时
+            bCaseInsensitive (bool, optional): 是否忽略大小写。默认为False
+
+        Returns:
+            bool: 如果找到指定字符串，返回True；如果超时，返回False
+        """
+        return await self.Expect([string], timeout, bCaseInsensitive) is not None
+
+    async def WaitForStrings(self, strings: List[str], timeout: float = 0, bCaseInsensitive: bool = False) -> int:
+        """
+        异步等待多个字符串中的一个出现在输入中。
+
+        Args:
+            strings (List[str]): 要等待的字符串列表
+            timeout (float, optional): 等待超时秒数。默认为0，表示无超时
+            bCaseInsensitive (bool, optional): 是否忽略大小写。默认为False
+
+        Returns:
+            int: 找到的字符串在列表中的索引（从1开始），如果超时则返回0
+        """
+        match = await self.Expect(strings, timeout, bCaseInsensitive)
+        return match.Index if match is not None else 0
+
+    async def ReadString(self, strings=None, timeout: float = 0, bCaseInsensitive: bool = False) -> str:
+        """
+        异步捕获从远程接收的数据，语义与 Screen.ReadString 相同。
+
+        不指定 strings 时，等待并返回下一段可用数据；
+        指定 strings 时，返回匹配的字符串之前的数据，超时返回空字符串。
+
+        Args:
+            strings: 要等待的字符串或字符串列表
+            timeout (float, optional): 等待超时秒数。默认为0，表示无超时
+            bCaseInsensitive (bool, optional): 是否忽略大小写。默认为False
+
+        Returns:
+            str: 捕获的数据字符串，如果超时则返回空字符串
+        """
+        if strings is None:
+            self._check_thread()
+            deadline = time.monotonic() + timeout if timeout else None
+            while True:
+                data = self.screen._read_chunk(timeout_ms=1)
+                if data or (deadline is not None and time.monotonic() >= deadline):
+                    return data
+                await asyncio.sleep(self.poll_interval)
+        match = await self.Expect(strings, timeout, bCaseInsensitive)
+        return match.Before if match is not None else ""
+
+    async def Run(self, cmd: str, prompt, timeout: float = 30) -> CommandResult:
+        """
+        异步执行一条命令并等待提示符，语义与 Screen.Run 相同。
+
+        Args:
+            cmd (str): 要执行的命令，不包含行尾的回车
+            prompt: 命令执行完成后出现的提示符，字符串或已编译的正则表达式
+            timeout (float, optional): 等待提示符的超时秒数。默认为30，0表示无超时
+
+        Returns:
+            CommandResult: 命令输出及延迟统计
+        """
+        self._check_thread()
+        wait = self.screen._begin_command(cmd, prompt)
+        try:
+            await self._wait(wait, wait.start + timeout if timeout else None)
+            return wait.Result()
+        finally:
+            wait.Restore()
+
+
+class AsyncTab:
+    """
+    AsyncTab 是 Tab 对象的 asyncio 适配器，提供选项卡上的异步等待方法。
+
+    示例：
+    tab = AsyncTab(crt.GetTab(2))
+    match = await tab.Expect("login:", 10)
+    """
+    __slots__ = ("tab", "Screen")
+
+    def __init__(self, tab, poll_interval: float = 0.01):
+        """
+        初始化 AsyncTab 对象
+
+        Args:
+            tab: Tab 对象
+            poll_interval (float, optional): 没有数据时两次轮询之间的秒数。默认为0.01
+        """
+        self.tab = tab
+        self.Screen = AsyncScreen(tab.Screen, poll_interval)
+
+    @property
+    def Session(self):
+        """
+        返回与选项卡关联的 Session 对象。
+
+        Returns:
+            Session: 与选项卡关联的 Session 对象
+        """
+        return self.tab.Session
+
+    async def Expect(self, patterns, timeout: float = 0, bCaseInsensitive: bool = False) -> Optional[ExpectMatch]:
+        """
+        异步等待选项卡屏幕上出现指定模式，等价于 AsyncTab.Screen.Expect。
+        """
+        return await self.Screen.Expect(patterns, timeout, bCaseInsensitive)
+
+    async def Run(self, cmd: str, prompt, timeout: float = 30) -> CommandResult:
+        """
+        在选项卡上异步执行一条命令，等价于 AsyncTab.Screen.Run。
+        """
+        return await self.Screen.Run(cmd, prompt, timeout)
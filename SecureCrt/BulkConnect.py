@@ -0,0 +1,165 @@
+import time
+from typing import List, Sequence
+
+class ConnectReport:
+    """
+    ConnectReport 对象记录 BulkConnect 中一个主机的连接结果。
+
+    Attributes:
+        Target (str): 连接信息字符串，如 "/s mysession" 或 "/ssh2 myhost"
+        Tab (Tab): 连接成功时的选项卡，失败时为None
+        Connected (bool): 是否连接成功
+        Attempts (int): 尝试连接的次数
+        Elapsed (float): 最后一次尝试从发起连接到连接成功（或放弃）的秒数
+        Error (str): 最后一次失败的原因，成功时为空字符串
+    """
+    __slots__ = ("Target", "Tab", "Connected", "Attempts", "Elapsed", "Error")
+
+    def __init__(self, target: str):
+        self.Target = target
+        self.Tab = None
+        self.Connected = False
+        self.Attempts = 0
+        self.Elapsed = 0.0
+        self.Error = ""
+
+    def __repr__(self):
+        return (f"ConnectReport(Target={self.Target!r}, Connected={self.Connected}, "
+                f"Attempts={self.Attempts}, Elapsed={self.Elapsed:.2f}, Error={self.Error!r})")
+
+
+class BulkConnect:
+    """
+    BulkConnect 以非阻塞方式批量建立连接，并限制同时进行的连接数。
+
+    Session.ConnectInTab 在 bWaitForAuthToComplete=True 时会逐个等待认证完成，
+    打开数百个主机非常慢。BulkConnect 以 bWaitForAuthToComplete=False 发起连接，
+    同时进行的连接数不超过 concurrency，通过轮询 Session.Connected 判断连接是否完成，
+    超时或失败的连接会关闭其选项卡，等待 retry_delay 秒后重试，之后每次重试的等待时间加倍，
+    以免主机暂时不可达或认证服务繁忙时立即重试，期间先连接其他主机。
+    连接时禁止弹出错误对话框，因此每次 ConnectInTab 之后检查 GetLastError，
+    立即失败的连接（如会话不存在、主机名无法解析）直接记录错误，不会等到超时。
+
+    示例：
+    reports = BulkConnect(crt, concurrency=20).Connect(["/s Routers/R1", "/ssh2 admin@10.0.0.2"])
+    failed = [report.Target for report in reports if not report.Connected]
+    """
+    __slots__ = ("crt", "concurrency", "timeout", "retries", "poll_interval", "retry_delay")
+
+    def __init__(self, crt, concurrency: int = 16, timeout: float = 30, retries: int = 1,
+                 poll_interval: float = 0.2, retry_delay: float = 5):
+        """
+        初始化 BulkConnect 对象
+
+        Args:
+            crt: CRT 对象
+            concurrency (int, optional): 同时进行的连接数上限。默认为16
+            timeout (float, optional): 每次连接尝试的超时秒数。默认为30
+            retries (int, optional): 每个主机失败后的重试次数。默认为1
+            poll_interval (float, optional): 两次轮询 Session.Connected 之间的秒数。默认为0.2
+            retry_delay (float, optional): 第一次重试前等待的秒数，之后每次加倍。默认为5
+        """
+        self.crt = crt
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retries = retries
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+
+    def _close(self, tab, script_index: int) -> None:
+        # 不关闭脚本所在的选项卡，ConnectInTab 失败时可能返回它
+        try:
+            if tab.Index != script_index:
+                tab.Close()
+        except Exception:
+            pass
+
+    def _last_error(self) -> str:
+        # 禁止弹出对话框时，ConnectInTab 的失败只记录在 GetLastError 中
+        try:
+            code = self.crt.GetLastError()
+            if not code:
+                return ""
+            message = self.crt.GetLastErrorMessage() or f"error {code}"
+            self.crt.ClearLastError()
+            return message
+        except Exception:
+            return ""
+
+    def _retry(self, report: ConnectReport, queue: List[ConnectReport], not_before: dict) -> None:
+        # 重试放到队列最后，并记录最早可以重试的时间
+        if report.Attempts <= self.retries:
+            not_before[report] = time.monotonic() + self.retry_delay * 2 ** (report.Attempts - 1)
+            queue.insert(0, report)
+
+    def _next(self, queue: List[ConnectReport], not_before: dict):
+        # 从队列末尾取出第一个已经可以连接的目标，没有时返回 None
+        now = time.monotonic()
+        for index in range(len(queue) - 1, -1, -1):
+            if not_before.get(queue[index], 0) <= now:
+                return queue.pop(index)
+        return None
+
+    def Connect(self, targets: Sequence[str]) -> List[ConnectReport]:
+        """
+        连接所有目标并返回每个目标的连接结果。
+
+        Args:
+            targets (Sequence[str]): 连接信息字符串列表，格式与 Session.ConnectInTab 的参数相同
+
+        Returns:
+            List[ConnectReport]: 与 targets 顺序相同的连接结果
+        """
+        reports = [ConnectReport(target) for target in targets]
+        queue = list(reports)
+        queue.reverse()
+        # 失败的目标最早可以重试的时间
+        not_before = {}
+        active = []
+        session = self.crt.Session
+        script_index = self.crt.GetScriptTab().Index
+        while queue or active:
+            while queue and len(active) < self.concurrency:
+                report = self._next(queue, not_before)
+                if report is None:
+                    break
+                report.Attempts += 1
+                start = time.monotonic()
+                tab = None
+                try:
+                    self.crt.ClearLastError()
+                    tab = session.ConnectInTab(report.Target, False, True)
+                    error = self._last_error()
+                except Exception as e:
+                    error = str(e)
+                if error:
+                    report.Error = error
+                    report.Elapsed = time.monotonic() - start
+                    if tab is not None:
+                        self._close(tab, script_index)
+                    self._retry(report, queue, not_before)
+                    continue
+                active.append((report, tab, start))
+            time.sleep(self.poll_interval)
+            still_active = []
+            for report, tab, start in active:
+                now = time.monotonic()
+                try:
+                    connected = tab.Session.Connected
+                except Exception as e:
+                    connected = False
+                    report.Error = str(e)
+                if connected:
+                    report.Connected = True
+                    report.Tab = tab
+                    report.Error = ""
+                    report.Elapsed = now - start
+                elif now - start >= self.timeout:
+                    report.Error = report.Error or "timed out"
+                    report.Elapsed = now - start
+                    self._close(tab, script_index)
+                    self._retry(report, queue, not_before)
+                else:
+                    still_active.append((report, tab, start))
+            active = still_active
+        return reports
@@ -8,14 +8,36 @@ from .CommandWindow import CommandWindow
 from .Clipboard import Clipboard
 from .Arguments import Arguments
 from .FileTransfer import FileTransfer
+from .FanOut import FanOut
+from .TabIndex import TabIndex
+from .SessionSnapshot import SessionSnapshotCache
 
 class CRT:
+    __slots__ = ("crt", "_config", "_arguments", "_clipboard", "_dialog", "_file_transfer",
+                 "_screen", "_session", "_window", "_command_window", "_tab_index",
+                 "_session_snapshots")
+
     def __init__(self, crt):
         self.crt = crt
+        # 包装对象按需创建后缓存。crt.Screen、crt.Session 始终指向脚本所在选项卡，
+        # 其余对象在脚本生命周期内也不会改变，因此缓存无需失效。
+        self._config = None
+        self._arguments = None
+        self._clipboard = None
+        self._dialog = None
+        self._file_transfer = None
+        self._screen = None
+        self._session = None
+        self._window = None
+        self._command_window = None
+        self._tab_index = None
+        self._session_snapshots = None
 
     @property
     def Config(self):
-        return GlobalConfiguration(self.crt.Config)
+        if self._config is None:
+            self._config = GlobalConfiguration(self.crt.Config)
+        return self._config
 
     @property
     def ActivePrinter(self):
@@ -27,23 +49,33 @@ class CRT:
 
     @property
     def Arguments(self):
-        return Arguments(self.crt)
+        if self._arguments is None:
+            self._arguments = Arguments(self.crt)
+        return self._arguments
 
     @property
     def Clipboard(self):
-        return Clipboard(self.crt)
+        if self._clipboard is None:
+            self._clipboard = Clipboard(self.crt)
+        return self._clipboard
 
     @property
     def Dialog(self):
-        return Dialog(self.crt)
+        if self._dialog is None:
+            self._dialog = Dialog(self.crt)
+        return self._dialog
 
     @property
     def FileTransfer(self):
-        return FileTransfer(self.crt)
+        if self._file_transfer is None:
+            self._file_transfer = FileTransfer(self.crt)
+        return self._file_transfer
 
     @property
     def Screen(self):
-        return Screen(self.crt.Screen)
+        if self._screen is None:
+            self._screen = Screen(self.crt.Screen)
+        return self._screen
 
     @property
     def ScriptFullName(self):
@@ -51,7 +83,21 @@ class CRT:
 
     @property
     def Session(self):
-        return Session(self.crt.Session)
+        if self._session is None:
+            self._session = Session(self.crt.Session)
+        return self._session
+
+    @property
+    def SessionSnapshots(self):
+        if self._session_snapshots is None:
+            self._session_snapshots = SessionSnapshotCache(self)
+        return self._session_snapshots
+
+    @property
+    def TabIndex(self):
+        if self._tab_index is None:
+            self._tab_index = TabIndex(self)
+        return self._tab_index
 
     @property
     def Version(self):
@@ -59,15 +105,27 @@ class CRT:
 
     @property
     def Window(self):
-        return Window(self.crt.Window)
+        if self._window is None:
+            self._window = Window(self.crt.Window)
+        return self._window
 
     @property
     def CommandWindow(self):
-        return CommandWindow(self.crt)
+        if self._command_window is None:
+            self._command_window = CommandWindow(self.crt)
+        return self._command_window
 
     def ClearLastError(self):
         return self.crt.ClearLastError()
 
+    def FanOut(self, cmd: str, prompt, tabs=None, timeout: float = 30):
+        # 默认在除脚本选项卡以外的所有已连接选项卡上执行
+        if tabs is None:
+            script_index = self.GetScriptTab().Index
+            tabs = [tab for tab in (self.GetTab(i) for i in range(1, self.GetTabCount() + 1))
+                    if tab.Index != script_index and tab.Session.Connected]
+        return FanOut(tabs, prompt, timeout).Run(cmd)
+
     def GetActiveTab(self):
         tab_obj = self.crt.GetActiveTab()
         return Tab(tab_obj)
@@ -8,6 +8,8 @@ class Clipboard:
     
     SecureCRT 的 Clipboard 对象通过顶级对象的 Clipboard 属性访问。
     """
+    __slots__ = ("crt",)
+
     def __init__(self, crt):
         """
         初始化 Clipboard 对象
@@ -0,0 +1,52 @@
+from typing import Optional
+
+class CommandResult:
+    """
+    CommandResult 对象保存 Screen.Run 执行一条命令的结果。
+
+    Attributes:
+        Command (str): 执行的命令
+        Output (str): 去除命令回显和提示符之后的输出
+        FirstByteLatency (Optional[float]): 从发送命令到收到第一个字节的秒数，未收到任何数据时为None
+        PromptLatency (float): 从发送命令到出现提示符（或超时）的秒数
+        TimedOut (bool): 是否在出现提示符之前超时
+    """
+    __slots__ = ("Command", "Output", "FirstByteLatency", "PromptLatency", "TimedOut")
+
+    def __init__(self, command: str, received: str, first_byte_latency: Optional[float],
+                 prompt_latency: float, timed_out: bool):
+        """
+        初始化 CommandResult 对象
+
+        Args:
+            command (str): 执行的命令
+            received (str): 发送命令后到提示符之前收到的全部数据，包括命令回显
+            first_byte_latency (Optional[float]): 从发送命令到收到第一个字节的秒数
+            prompt_latency (float): 从发送命令到出现提示符的秒数
+            timed_out (bool): 是否超时
+        """
+        self.Command = command
+        self.Output = self._strip_echo(command, received)
+        self.FirstByteLatency = first_byte_latency
+        self.PromptLatency = prompt_latency
+        self.TimedOut = timed_out
+
+    @staticmethod
+    def _strip_echo(command: str, received: str) -> str:
+        # 回显是第一行中包含命令的部分；去掉它以及输出末尾提示符之前的换行
+        newline = received.find("\n")
+        first_line = received if newline < 0 else received[:newline]
+        if command.strip() and command.strip() in first_line:
+            received = "" if newline < 0 else received[newline + 1:]
+        if received.endswith("\r\n"):
+            received = received[:-2]
+        elif received.endswith("\n"):
+            received = received[:-1]
+        return received
+
+    def __str__(self):
+        return self.Output
+
+    def __repr__(self):
+        return (f"CommandResult(Command={self.Command!r}, FirstByteLatency={self.FirstByteLatency}, "
+                f"PromptLatency={self.PromptLatency:.3f}, TimedOut={self.TimedOut})")
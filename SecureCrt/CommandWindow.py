@@ -9,6 +9,8 @@ class CommandWindow:
     
     SecureCRT 的 CommandWindow 对象通过顶级对象的 CommandWindow 属性访问。
     """
+    __slots__ = ("crt",)
+
     def __init__(self, crt):
         """
         初始化 CommandWindow 对象
@@ -1,4 +1,6 @@
 class Configuration:
+    __slots__ = ("obj",)
+
     def __init__(self, obj):
         self.obj = obj
     
@@ -11,7 +13,12 @@ class Configuration:
     def SetOption(self, OptionName: str, Value: str):
         self.obj.SetOption(OptionName, Value)
 
+    def Cached(self):
+        return CachedConfiguration(self.obj)
+
 class SessionConfiguration(Configuration):
+    __slots__ = ()
+
     def __init__(self, obj):
         super(SessionConfiguration, self).__init__(obj)
         self.obj = obj
@@ -20,6 +27,89 @@ class SessionConfiguration(Configuration):
         from .Tab import Tab
         return Tab(self.obj.ConnectInTab())
 
+    def Cached(self):
+        return CachedSessionConfiguration(self.obj)
+
 class GlobalConfiguration(Configuration):
+    __slots__ = ()
+
     def __init__(self, crt):
-        super(GlobalConfiguration, self).__init__(crt)
\ No newline at end of file
+        super(GlobalConfiguration, self).__init__(crt)
+
+class CachedConfiguration(Configuration):
+    """
+    CachedConfiguration 在 Configuration 之上缓存选项并延迟写入。
+
+    GetOption 只在第一次读取某个选项时调用 COM，SetOption 只在本地记录修改，
+    Save 先写入所有修改过的选项再调用一次 Save；没有修改时不调用 Save。
+    设置为与缓存值相同的值不会产生写入。ComCalls 记录实际发生的 COM 调用次数。
+
+    示例：
+    config = crt.OpenSessionConfiguration("Routers/R1").Cached()
+    if config.GetOption("Port") != 22:
+        config.SetOption("Port", 22)
+    config.Save()
+    """
+    __slots__ = ("ComCalls", "_values", "_dirty", "_unsaved")
+
+    def __init__(self, obj):
+        super(CachedConfiguration, self).__init__(obj)
+        self.ComCalls = 0
+        self._values = {}
+        self._dirty = {}
+        self._unsaved = False
+
+    @property
+    def Dirty(self):
+        return dict(self._dirty)
+
+    def GetOption(self, OptionName: str):
+        try:
+            return self._values[OptionName]
+        except KeyError:
+            pass
+        value = self.obj.GetOption(OptionName)
+        self.ComCalls += 1
+        self._values[OptionName] = value
+        return value
+
+    def SetOption(self, OptionName: str, Value: str):
+        if OptionName in self._values and OptionName not in self._dirty and self._values[OptionName] == Value:
+            return
+        self._values[OptionName] = Value
+        self._dirty[OptionName] = Value
+
+    def Flush(self):
+        for name, value in self._dirty.items():
+            self.obj.SetOption(name, value)
+            self.ComCalls += 1
+        if self._dirty:
+            self._unsaved = True
+        self._dirty.clear()
+
+    def Save(self, SessionPath: str = ""):
+        self.Flush()
+        # 另存为新路径时即使没有修改也要保存
+        if self._unsaved or SessionPath:
+            self.obj.Save(SessionPath)
+            self.ComCalls += 1
+            self._unsaved = False
+
+    def Discard(self):
+        self._values.clear()
+        self._dirty.clear()
+
+    def Cached(self):
+        return self
+
+class CachedSessionConfiguration(CachedConfiguration, SessionConfiguration):
+    """
+    CachedSessionConfiguration 是会话配置的 CachedConfiguration，保留 ConnectInTab。
+
+    ConnectInTab 之前先写入所有修改过的选项，新选项卡使用修改后的配置连接。
+    """
+    __slots__ = ()
+
+    def ConnectInTab(self):
+        self.Flush()
+        return super(CachedSessionConfiguration, self).ConnectInTab()
@@ -35,6 +35,8 @@ class Dialog:
     IDYES = 6            # 是按钮被点击
     IDNO = 7             # 否按钮被点击
     
+    __slots__ = ("crt",)
+
     def __init__(self, crt):
         """
         初始化Dialog对象
@@ -0,0 +1,327 @@
+import re
+from functools import lru_cache
+from typing import Optional, Pattern, Sequence, Tuple, Union
+
+try:
+    from re import _parser as _sre_parse
+except ImportError:  # Python 3.10 及更早版本
+    import sre_parse as _sre_parse
+
+class ExpectMatch:
+    """
+    ExpectMatch 对象描述一次 Expect 匹配的结果。
+
+    Attributes:
+        Index (int): 匹配的模式在列表中的索引，从1开始，与 Screen.MatchIndex 的约定相同
+        Pattern: 匹配的模式（字符串或已编译的正则表达式）
+        Text (str): 匹配到的文本
+        Groups (tuple): 正则表达式的分组，字符串模式为空元组
+        Before (str): 匹配之前收到的文本
+    """
+    __slots__ = ("Index", "Pattern", "Text", "Groups", "Before")
+
+    def __init__(self, index: int, pattern, text: str, groups: tuple, before: str):
+        self.Index = index
+        self.Pattern = pattern
+        self.Text = text
+        self.Groups = groups
+        self.Before = before
+
+    def __repr__(self):
+        return f"ExpectMatch(Index={self.Index}, Text={self.Text!r}, Groups={self.Groups!r})"
+
+
+class _Automaton:
+    """
+    字符串模式的 Aho-Corasick 自动机。
+    """
+    __slots__ = ("goto", "fail", "out")
+
+    def __init__(self, literals: Sequence[Tuple[int, str]]):
+        goto = [{}]
+        out = [None]
+        for index, literal in literals:
+            state = 0
+            for char in literal:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    out.append(None)
+                state = next_state
+            # 同一位置结束的多个模式取索引最小的一个
+            if out[state] is None or index < out[state][0]:
+                out[state] = (index, len(literal))
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                target = fail[state]
+                while target and char not in goto[target]:
+                    target = fail[target]
+                fail[next_state] = goto[target].get(char, 0)
+                inherited = out[fail[next_state]]
+                if inherited is not None and (out[next_state] is None or inherited[0] < out[next_state][0]):
+                    out[next_state] = inherited
+        self.goto = goto
+        self.fail = fail
+        self.out = out
+
+
+# 不能匹配换行符的字符类别；其他类别（如 \s、\W、\D）都可能匹配换行符
+_SINGLE_LINE_CATEGORIES = {_sre_parse.CATEGORY_DIGIT, _sre_parse.CATEGORY_NOT_SPACE,
+                           _sre_parse.CATEGORY_WORD, _sre_parse.CATEGORY_NOT_LINEBREAK}
+_REPEATS = {_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT, getattr(_sre_parse, "POSSESSIVE_REPEAT", None)}
+
+
+def _set_matches_newline(items) -> bool:
+    negate = bool(items) and items[0][0] is _sre_parse.NEGATE
+    found = False
+    for op, av in items[negate:]:
+        if op is _sre_parse.LITERAL:
+            found = av == 10
+        elif op is _sre_parse.RANGE:
+            found = av[0] <= 10 <= av[1]
+        elif op is _sre_parse.CATEGORY:
+            found = av not in _SINGLE_LINE_CATEGORIES
+        else:
+            return True
+        if found:
+            break
+    return found != negate
+
+
+def _matches_newline(items, flags: int) -> bool:
+    # 保守地判断正则表达式（包括其中的前瞻）是否可能匹配换行符，无法确定时返回 True
+    for op, av in items:
+        if op is _sre_parse.LITERAL:
+            if av == 10:
+                return True
+        elif op is _sre_parse.NOT_LITERAL:
+            if av != 10:
+                return True
+        elif op is _sre_parse.ANY:
+            if flags & re.DOTALL:
+                return True
+        elif op is _sre_parse.IN:
+            if _set_matches_newline(av):
+                return True
+        elif op in _REPEATS:
+            if _matches_newline(av[2], flags):
+                return True
+        elif op is _sre_parse.SUBPATTERN:
+            if _matches_newline(av[3], (flags | av[1]) & ~av[2]):
+                return True
+        elif op is _sre_parse.BRANCH:
+            if any(_matches_newline(branch, flags) for branch in av[1]):
+                return True
+        elif op in (_sre_parse.ASSERT, _sre_parse.ASSERT_NOT):
+            # 后顾只检查匹配起点之前的字符，不影响匹配能否跨行
+            if av[0] >= 0 and _matches_newline(av[1], flags):
+                return True
+        elif op is _sre_parse.GROUPREF_EXISTS:
+            if _matches_newline(av[1], flags) or (av[2] is not None and _matches_newline(av[2], flags)):
+                return True
+        elif op is getattr(_sre_parse, "ATOMIC_GROUP", None):
+            if _matches_newline(av, flags):
+                return True
+        elif op not in (_sre_parse.AT, _sre_parse.GROUPREF):
+            return True
+    return False
+
+
+def _looks_ahead(items) -> bool:
+    # 是否包含可能因为后续数据而改变结果的前瞻（(?=...) 或 \B）
+    for op, av in items:
+        if op is _sre_parse.ASSERT and av[0] >= 0:
+            return True
+        if op is _sre_parse.AT and av is _sre_parse.AT_NON_BOUNDARY:
+            return True
+        for value in (av if isinstance(av, (tuple, list)) else (av,)):
+            if isinstance(value, _sre_parse.SubPattern) and _looks_ahead(value):
+                return True
+            if isinstance(value, list) and any(isinstance(branch, _sre_parse.SubPattern) and _looks_ahead(branch)
+                                                for branch in value):
+                return True
+    return False
+
+
+def _reach(regex: Pattern) -> Tuple[bool, Optional[int]]:
+    # 返回 (匹配是否一定不跨行, 匹配的最大长度)。最大长度不确定或包含前瞻时为 None
+    try:
+        parsed = _sre_parse.parse(regex.pattern, regex.flags)
+    except Exception:
+        return False, None
+    width = parsed.getwidth()[1]
+    bounded = width < _sre_parse.MAXREPEAT and not _looks_ahead(parsed)
+    return not _matches_newline(parsed, regex.flags), width if bounded else None
+
+
+class _Fold(dict):
+    # str.translate 使用的逐字符小写映射。str.lower() 可能改变长度（如 "İ" 变为两个字符），
+    # 会使匹配位置与原始数据错位，因此小写形式不是单个字符的字符保持不变
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        lower = char.lower()
+        folded = self[code] = lower if len(lower) == 1 else char
+        return folded
+
+
+_FOLD = _Fold()
+
+
+@lru_cache(maxsize=64)
+def _build(patterns: tuple, bCaseInsensitive: bool):
+    literals = []
+    regexes = []
+    for index, pattern in enumerate(patterns, 1):
+        if isinstance(pattern, str):
+            if not pattern:
+                raise ValueError("empty string pattern")
+            literals.append((index, pattern.translate(_FOLD) if bCaseInsensitive else pattern))
+        else:
+            if bCaseInsensitive and not pattern.flags & re.IGNORECASE:
+                pattern = re.compile(pattern.pattern, pattern.flags | re.IGNORECASE)
+            regexes.append((index, pattern) + _reach(pattern))
+    return _Automaton(literals), regexes
+
+
+class ExpectMatcher:
+    """
+    ExpectMatcher 在流式数据上同时匹配多个字符串和正则表达式模式。
+
+    字符串模式编译为一个 Aho-Corasick 自动机，其状态在数据块之间保持，
+    因此每个字符只被扫描一次。正则表达式模式只从仍可能开始一个匹配的最早位置搜索：
+    不能匹配换行符的模式从最后一个换行符之后开始，最大长度确定的模式从新数据之前该长度处开始，
+    其他模式最多回看 lookback 个字符，不会重新扫描整个累积缓冲区。
+    因此正则表达式匹配的文本长度不应超过 lookback。
+
+    当多个模式都能匹配时，返回结束位置最靠前的匹配；结束位置相同时取索引较小的模式。
+
+    示例：
+    matcher = ExpectMatcher(["Password:", re.compile(r"(\\S+)[#>]\\s*$")])
+    for chunk in chunks:
+        match = matcher.Feed(chunk)
+        if match:
+            break
+    """
+    __slots__ = ("patterns", "lookback", "_case_insensitive", "_automaton", "_regexes",
+                 "_state", "_chunks", "_length", "_tail", "Remainder")
+
+    def __init__(self, patterns: Sequence[Union[str, Pattern]], bCaseInsensitive: bool = False,
+                 lookback: int = 1024):
+        """
+        初始化 ExpectMatcher 对象
+
+        Args:
+            patterns: 字符串或已编译正则表达式的列表
+            bCaseInsensitive (bool, optional): 是否忽略大小写。默认为False
+            lookback (int, optional): 正则表达式向前回看的最大字符数。默认为1024
+        """
+        if isinstance(patterns, (str, re.Pattern)):
+            patterns = [patterns]
+        self.patterns = tuple(patterns)
+        if not self.patterns:
+            raise ValueError("at least one pattern is required")
+        self.lookback = lookback
+        self._case_insensitive = bCaseInsensitive
+        self._automaton, self._regexes = _build(self.patterns, bCaseInsensitive)
+        self.Reset()
+
+    def Reset(self) -> None:
+        """
+        丢弃所有已接收的数据和匹配状态。
+        """
+        self._state = 0
+        self._chunks = []
+        self._length = 0
+        self._tail = ""
+        self.Remainder = ""
+
+    @property
+    def Buffer(self) -> str:
+        """
+        返回自上一次匹配（或 Reset）以来已接收但尚未匹配的数据。
+
+        Returns:
+            str: 已接收的数据
+        """
+        return "".join(self._chunks) + self.Remainder
+
+    def Feed(self, chunk: str) -> Optional[ExpectMatch]:
+        """
+        输入一个新的数据块，如果有模式匹配则返回匹配结果。
+
+        匹配之后剩余的数据保存在 Remainder 属性中，并在下一次调用 Feed 时优先处理。
+        匹配成功后，匹配之前和匹配本身的数据都被丢弃。
+
+        Args:
+            chunk (str): 新收到的数据
+
+        Returns:
+            Optional[ExpectMatch]: 匹配结果，没有匹配时返回None
+        """
+        data = self.Remainder + chunk if self.Remainder else chunk
+        self.Remainder = ""
+        if not data:
+            return None
+
+        best = None
+        scanned = len(data)
+        if self._automaton.goto[0]:
+            goto = self._automaton.goto
+            fail = self._automaton.fail
+            out = self._automaton.out
+            state = self._state
+            text = data.translate(_FOLD) if self._case_insensitive else data
+            for position, char in enumerate(text):
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+                hit = out[state]
+                if hit is not None:
+                    end = self._length + position + 1
+                    best = (end, hit[0], end - hit[1], None)
+                    scanned = position + 1
+                    break
+            self._state = state
+
+        if self._regexes:
+            tail = self._tail
+            window = tail + data[:scanned]
+            offset = self._length - len(tail)
+            # 新的匹配必须延伸到新数据中，起点之前的 tail 仍保留在 window 中，供后顾断言和 \b 使用
+            earliest = max(len(tail) - self.lookback, 0)
+            line_start = tail.rfind("\n", earliest) + 1
+            for index, regex, single_line, width in self._regexes:
+                position = earliest
+                if single_line:
+                    position = max(position, line_start)
+                if width is not None:
+                    position = max(position, len(tail) - width + 1)
+                found = regex.search(window, position)
+                if found is None:
+                    continue
+                end = offset + found.end()
+                if best is None or (end, index) < best[:2]:
+                    best = (end, index, offset + found.start(), found)
+
+        if best is None:
+            self._chunks.append(data)
+            self._length += len(data)
+            if self._regexes:
+                # tail 只追加新数据，超过 lookback 的两倍时才截断，避免每个数据块都重建
+                self._tail = window if len(window) <= 2 * self.lookback else window[len(window) - self.lookback:]
+            return None
+
+        end, index, start, found = best
+        self._chunks.append(data)
+        buffer = "".join(self._chunks)
+        pattern = self.patterns[index - 1]
+        match = ExpectMatch(index, pattern, buffer[start:end], found.groups() if found else (), buffer[:start])
+        remainder = buffer[end:]
+        self.Reset()
+        self.Remainder = remainder
+        return match
@@ -0,0 +1,77 @@
+import time
+from typing import Iterator, List, Tuple
+from .CommandResult import CommandResult
+
+class FanOut:
+    """
+    FanOut 在多个选项卡上并发执行同一条命令。
+
+    逐个选项卡执行命令并等待提示符时，总耗时是所有设备延迟之和。
+    FanOut 先向每个选中的选项卡发送命令，然后在一个协作式循环中轮询所有选项卡，
+    哪个选项卡先出现提示符就先收集哪个选项卡的输出，
+    总耗时接近最慢设备的延迟。每个选项卡的结果都带有独立的延迟统计。
+
+    示例：
+    fan_out = FanOut([crt.GetTab(i) for i in range(2, crt.GetTabCount() + 1)], "#")
+    for tab, result in fan_out.Iterate("show clock"):
+        crt.Dialog.MessageBox(f"{tab.Caption}: {result.Output}")
+    """
+    __slots__ = ("tabs", "prompt", "timeout", "poll_interval")
+
+    def __init__(self, tabs: List, prompt, timeout: float = 30, poll_interval: float = 0.01):
+        """
+        初始化 FanOut 对象
+
+        Args:
+            tabs (List[Tab]): 要执行命令的选项卡列表
+            prompt: 命令执行完成后出现的提示符，字符串或已编译的正则表达式
+            timeout (float, optional): 等待提示符的超时秒数。默认为30，0表示无超时
+            poll_interval (float, optional): 所有选项卡都没有数据时两次轮询之间的秒数。默认为0.01
+        """
+        self.tabs = list(tabs)
+        self.prompt = prompt
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+    def Iterate(self, cmd: str) -> Iterator[Tuple[object, CommandResult]]:
+        """
+        在所有选项卡上执行命令，按完成顺序依次返回每个选项卡的结果。
+
+        Args:
+            cmd (str): 要执行的命令，不包含行尾的回车
+
+        Returns:
+            Iterator[Tuple[Tab, CommandResult]]: 选项卡及其命令结果，每个选项卡在出现提示符或自身超时时返回
+        """
+        active = []
+        try:
+            for tab in self.tabs:
+                active.append((tab, tab.Screen._begin_command(cmd, self.prompt)))
+            while active:
+                received = False
+                for item in list(active):
+                    tab, wait = item
+                    # 每次只等待1毫秒，一个没有输出的选项卡不会拖住其他选项卡
+                    if wait.Collect(1):
+                        received = True
+                    if wait.match is not None or \
+                            (self.timeout and time.monotonic() - wait.start >= self.timeout):
+                        active.remove(item)
+                        yield tab, wait.Result()
+                if active and not received:
+                    time.sleep(self.poll_interval)
+        finally:
+            for _, wait in active:
+                wait.Restore()
+
+    def Run(self, cmd: str) -> List[Tuple[object, CommandResult]]:
+        """
+        在所有选项卡上执行命令，返回所有结果。
+
+        Args:
+            cmd (str): 要执行的命令，不包含行尾的回车
+
+        Returns:
+            List[Tuple[Tab, CommandResult]]: 按完成顺序排列的选项卡及其命令结果
+        """
+        return list(self.Iterate(cmd))
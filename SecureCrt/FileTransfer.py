@@ -10,6 +10,8 @@ class FileTransfer:
     SecureCRT 的 FileTransfer 对象通过顶级对象的 FileTransfer 属性访问。
     注意：FileTransfer 对象不支持使用 TN3270 模拟的会话。
     """
+    __slots__ = ("crt",)
+
     def __init__(self, crt):
         """
         初始化 FileTransfer 对象
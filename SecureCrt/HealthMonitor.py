@@ -0,0 +1,247 @@
+import heapq
+import random
+import time
+from typing import Callable, List, Optional
+
+CONNECTED = "connect"
+DISCONNECTED = "disconnect"
+RECONNECTING = "reconnect"
+CLOSED = "closed"
+
+class HealthEvent:
+    """
+    HealthEvent 对象记录 HealthMonitor 观察到的一次状态变化。
+
+    Attributes:
+        Time (float): 事件发生时的时间戳（time.time()）
+        Tab (Tab): 发生变化的选项卡
+        Kind (str): "connect"、"disconnect"、"reconnect"（发起重连）或 "closed"（选项卡已关闭）
+        Attempt (int): 本次断开以来的重连次数
+        Error (str): 重连失败时的错误信息
+    """
+    __slots__ = ("Time", "Tab", "Kind", "Attempt", "Error")
+
+    def __init__(self, tab, kind: str, attempt: int = 0, error: str = ""):
+        self.Time = time.time()
+        self.Tab = tab
+        self.Kind = kind
+        self.Attempt = attempt
+        self.Error = error
+
+    def __repr__(self):
+        return (f"HealthEvent({time.strftime('%H:%M:%S', time.localtime(self.Time))} {self.Kind}, "
+                f"Attempt={self.Attempt}, Error={self.Error!r})")
+
+
+class _Watched:
+    __slots__ = ("tab", "connected", "interval", "attempts", "pending", "connecting_since", "removed")
+
+    def __init__(self, tab, connected: bool, interval: float):
+        self.tab = tab
+        self.connected = connected
+        self.interval = interval
+        self.attempts = 0
+        self.pending = False
+        self.connecting_since = None
+        self.removed = False
+
+
+class HealthMonitor:
+    """
+    HealthMonitor 以自适应间隔检查会话连接状态，并在断开后自动重连。
+
+    每秒轮询所有选项卡的 Session.Connected 会浪费大量 COM 调用。
+    HealthMonitor 为每个选项卡维护独立的检查间隔：刚断开或刚重连的选项卡按 min_interval 检查，
+    每次检查状态未变时间隔乘以 backoff，直到 max_interval。
+    所有选项卡按下一次检查时间放在一个堆中，每次只检查到期的选项卡。
+
+    断开的会话用 Session.Connect("", False, True) 以非阻塞方式重连，并禁止弹出错误对话框，
+    以免无人值守时一次失败的重连阻塞整个监视循环；失败原因从 GetLastError 取得并记录在事件中。
+    第 n 次重连前等待 [0, min(retry_max, retry_base * 2**n)] 内的随机秒数（full jitter），避免大量会话同时重连。
+    发起重连之后，在连接成功或超过 connect_timeout 秒之前不会再次发起重连，避免对同一会话重叠调用 Connect。
+
+    示例：
+    monitor = HealthMonitor(crt=crt)
+    for index in range(1, crt.GetTabCount() + 1):
+        monitor.Add(crt.GetTab(index))
+    monitor.Run(3600, lambda event: crt.Session.SetStatusText(repr(event)))
+    """
+    __slots__ = ("min_interval", "max_interval", "backoff", "reconnect", "retry_base", "retry_max",
+                 "max_attempts", "connect_timeout", "crt", "Events", "_heap", "_watched", "_sequence")
+
+    def __init__(self, min_interval: float = 1, max_interval: float = 60, backoff: float = 2,
+                 reconnect: bool = True, retry_base: float = 1, retry_max: float = 60,
+                 max_attempts: Optional[int] = None, connect_timeout: float = 30, crt=None):
+        """
+        初始化 HealthMonitor 对象
+
+        Args:
+            min_interval (float, optional): 最短检查间隔秒数。默认为1
+            max_interval (float, optional): 最长检查间隔秒数。默认为60
+            backoff (float, optional): 状态未变时检查间隔的增长倍数。默认为2
+            reconnect (bool, optional): 断开后是否自动重连。默认为True
+            retry_base (float, optional): 重连等待时间的基数秒数。默认为1
+            retry_max (float, optional): 重连等待时间的上限秒数。默认为60
+            max_attempts (int, optional): 每次断开后的最大重连次数。默认为None，表示不限
+            connect_timeout (float, optional): 等待一次重连完成的秒数，超过后才发起下一次重连。默认为30
+            crt (optional): CRT 对象，用于读取重连失败的错误信息。默认为None，只记录异常信息
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.reconnect = reconnect
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.max_attempts = max_attempts
+        self.connect_timeout = connect_timeout
+        self.crt = crt
+        self.Events = []
+        self._heap = []
+        # 被监视的选项卡。crt.GetTab 每次返回新的包装对象，按 COM 对象比较，不能按 id() 查找
+        self._watched = []
+        self._sequence = 0
+
+    def _schedule(self, watched: _Watched, delay: float) -> None:
+        self._sequence += 1
+        heapq.heappush(self._heap, (time.monotonic() + delay, self._sequence, watched))
+
+    def _same(self, a, b) -> bool:
+        # pywin32 的 COM 对象按底层 IUnknown 比较相等
+        return a is b or getattr(a, "obj", a) == getattr(b, "obj", b)
+
+    def _find(self, tab) -> Optional[_Watched]:
+        for watched in self._watched:
+            if self._same(watched.tab, tab):
+                return watched
+        return None
+
+    def Add(self, tab) -> None:
+        """
+        开始监视一个选项卡。已在监视的选项卡（包括包装同一选项卡的其他 Tab 对象）不会重复添加。
+
+        Args:
+            tab (Tab): 要监视的选项卡
+        """
+        if self._find(tab) is not None:
+            return
+        watched = _Watched(tab, bool(tab.Session.Connected), self.min_interval)
+        self._watched.append(watched)
+        self._schedule(watched, self.min_interval)
+
+    def Remove(self, tab) -> None:
+        """
+        停止监视一个选项卡。
+
+        Args:
+            tab (Tab): 要停止监视的选项卡，可以是包装同一选项卡的其他 Tab 对象
+        """
+        watched = self._find(tab)
+        if watched is not None:
+            self._watched.remove(watched)
+            watched.removed = True
+
+    def _last_error(self) -> str:
+        # 禁止弹出对话框时，Connect 的失败只记录在 GetLastError 中
+        if self.crt is None:
+            return ""
+        try:
+            code = self.crt.GetLastError()
+            if not code:
+                return ""
+            message = self.crt.GetLastErrorMessage() or f"error {code}"
+            self.crt.ClearLastError()
+            return message
+        except Exception:
+            return ""
+
+    def _retry_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.retry_max, self.retry_base * 2 ** attempt))
+
+    def _check(self, watched: _Watched, events: List[HealthEvent]) -> None:
+        tab = watched.tab
+        try:
+            connected = bool(tab.Session.Connected)
+        except Exception:
+            self.Remove(tab)
+            events.append(HealthEvent(tab, CLOSED))
+            return
+        if connected != watched.connected:
+            watched.connected = connected
+            events.append(HealthEvent(tab, CONNECTED if connected else DISCONNECTED, watched.attempts))
+            if connected:
+                watched.attempts = 0
+                watched.connecting_since = None
+            watched.interval = self.min_interval
+        elif connected or not self.reconnect:
+            watched.interval = min(self.max_interval, watched.interval * self.backoff)
+        if connected or not self.reconnect:
+            self._schedule(watched, watched.interval)
+            return
+        # 断开状态：先等待抖动退避时间，到期后发起非阻塞重连，下一次检查确认结果
+        if watched.connecting_since is not None:
+            # 上一次重连仍在进行中，直到连接成功或超时之前不再发起新的重连
+            if time.monotonic() - watched.connecting_since < self.connect_timeout:
+                self._schedule(watched, self.min_interval)
+                return
+            watched.connecting_since = None
+        if watched.pending:
+            watched.pending = False
+            try:
+                if self.crt is not None:
+                    self.crt.ClearLastError()
+                tab.Session.Connect("", False, True)
+                error = self._last_error()
+            except Exception as e:
+                error = self._last_error() or str(e)
+            if not error:
+                watched.connecting_since = time.monotonic()
+            events.append(HealthEvent(tab, RECONNECTING, watched.attempts, error))
+            self._schedule(watched, self.min_interval)
+            return
+        if self.max_attempts is not None and watched.attempts >= self.max_attempts:
+            self._schedule(watched, self.max_interval)
+            return
+        watched.attempts += 1
+        watched.pending = True
+        self._schedule(watched, self._retry_delay(watched.attempts - 1))
+
+    def Poll(self) -> List[HealthEvent]:
+        """
+        检查所有到期的选项卡，必要时发起重连。
+
+        Returns:
+            List[HealthEvent]: 本次检查产生的事件，同时追加到 Events
+        """
+        events = []
+        now = time.monotonic()
+        while self._heap and self._heap[0][0] <= now:
+            watched = heapq.heappop(self._heap)[2]
+            if not watched.removed:
+                self._check(watched, events)
+        self.Events.extend(events)
+        return events
+
+    def Run(self, duration: Optional[float] = None,
+            on_event: Optional[Callable[[HealthEvent], None]] = None) -> None:
+        """
+        持续监视，直到超过 duration 秒或没有被监视的选项卡。
+
+        每次休眠到最近一个选项卡的检查时间，不会空转。
+
+        Args:
+            duration (float, optional): 监视的秒数。默认为None，表示一直监视
+            on_event (Callable, optional): 每个事件的回调函数。默认为None
+        """
+        end = None if duration is None else time.monotonic() + duration
+        while self._watched:
+            for event in self.Poll():
+                if on_event is not None:
+                    on_event(event)
+            if not self._heap:
+                return
+            wake = self._heap[0][0]
+            if end is not None:
+                if time.monotonic() >= end:
+                    return
+                wake = min(wake, end)
+            time.sleep(max(0.0, wake - time.monotonic()))
@@ -0,0 +1,141 @@
+import time
+from typing import List, Sequence
+
+# 等待提示符超时之后，读取迟到的提示符时等待的毫秒数
+_DRAIN_MILLISECONDS = 200
+
+class SendLinesReport:
+    """
+    SendLinesReport 对象记录一次批量发送的统计结果。
+
+    Attributes:
+        Lines (int): 成功发送并确认回显的行数
+        Batches (int): 发送的批次数（包括重传批次）
+        Retransmitted (int): 因未收到回显或提示符而重传的行数
+        Failed (List[str]): 重传次数用尽后停止发送时，未确认的行及其后所有未发送的行
+        Elapsed (float): 总耗时（秒）
+    """
+    __slots__ = ("Lines", "Batches", "Retransmitted", "Failed", "Elapsed")
+
+    def __init__(self):
+        self.Lines = 0
+        self.Batches = 0
+        self.Retransmitted = 0
+        self.Failed = []
+        self.Elapsed = 0.0
+
+    @property
+    def LinesPerSecond(self) -> float:
+        """
+        返回每秒确认的行数。
+
+        Returns:
+            float: 每秒行数
+        """
+        return self.Lines / self.Elapsed if self.Elapsed else 0.0
+
+    def __repr__(self):
+        return (f"SendLinesReport(Lines={self.Lines}, Batches={self.Batches}, "
+                f"Retransmitted={self.Retransmitted}, Failed={len(self.Failed)}, "
+                f"LinesPerSecond={self.LinesPerSecond:.1f})")
+
+
+class LineSender:
+    """
+    LineSender 以批次方式向远程设备发送大量命令行。
+
+    每个批次的行数不超过 batch_size，字符数不超过 buffer_size（设备输入缓冲区能容纳的大小），
+    整个批次通过一次 Screen.Send 发出，然后逐行等待提示符，
+    并检查提示符之前的输出中是否包含该行的回显。
+    某一行未收到回显或等待提示符超时时，从该行开始重传本批次的剩余行，
+    以保持行的执行顺序；同一行最多重传 retries 次，仍失败则停止发送。
+
+    批次大小按丢包情况自适应调整：出现丢失时减半，之后每个完整确认的批次增加一行，
+    直到 batch_size。这样在设备缓冲区小于一个批次时，不会反复以相同大小重传而导致大部分行被重传。
+    出现丢失时，先读掉本批次其余已执行行的提示符，避免后续的确认匹配到过时的提示符。
+
+    注意：重传可能导致同一行被执行两次，适用于配置命令等幂等的行。
+    """
+    __slots__ = ("screen", "prompt", "batch_size", "buffer_size", "timeout", "retries", "check_echo")
+
+    def __init__(self, screen, prompt, batch_size: int = 50, buffer_size: int = 1024,
+                 timeout: int = 10, retries: int = 2, check_echo: bool = True):
+        """
+        初始化 LineSender 对象
+
+        Args:
+            screen: Screen 对象
+            prompt: 每行执行完成后出现的提示符，字符串或已编译的正则表达式
+            batch_size (int, optional): 每批次最多发送的行数。默认为50
+            buffer_size (int, optional): 每批次最多发送的字符数。默认为1024
+            timeout (int, optional): 等待每行提示符的超时秒数。默认为10
+            retries (int, optional): 每行最多重传次数。默认为2
+            check_echo (bool, optional): 是否检查每行的回显。默认为True
+        """
+        self.screen = screen
+        self.prompt = prompt
+        self.batch_size = max(1, batch_size)
+        self.buffer_size = max(1, buffer_size)
+        self.timeout = timeout
+        self.retries = retries
+        self.check_echo = check_echo
+
+    def _next_batch(self, pending: List[str], limit: int) -> List[str]:
+        batch = []
+        size = 0
+        for line in pending:
+            if batch and (len(batch) >= limit or size + len(line) + 1 > self.buffer_size):
+                break
+            batch.append(line)
+            size += len(line) + 1
+        return batch
+
+    def Send(self, lines: Sequence[str]) -> SendLinesReport:
+        """
+        发送所有行并返回统计结果。
+
+        Args:
+            lines (Sequence[str]): 要发送的命令行，不包含行尾的回车
+
+        Returns:
+            SendLinesReport: 发送统计结果
+        """
+        report = SendLinesReport()
+        start = time.monotonic()
+        pending = list(lines)
+        attempts = [0] * len(pending)
+        sent = 0
+        limit = self.batch_size
+        while sent < len(pending):
+            batch = self._next_batch(pending[sent:], limit)
+            report.Batches += 1
+            self.screen.Send("".join(line + "\r" for line in batch))
+            for position, line in enumerate(batch):
+                match = self.screen.Expect(self.prompt, self.timeout)
+                if match is not None and (not self.check_echo or line.strip() in match.Before):
+                    report.Lines += 1
+                    continue
+                # 从第一个未确认的行开始重传整个批次的剩余部分，以保持行的执行顺序。
+                # 先读掉本批次其余行（超时时包括本行）迟到的提示符，避免干扰后续的确认。
+                # 超时说明设备已经 timeout 秒没有输出，只需短暂等待已在途的提示符
+                drain = 1000 if match is not None else _DRAIN_MILLISECONDS
+                for _ in batch[position + (match is not None):]:
+                    if self.screen.Expect(self.prompt, drain, bMilliseconds=True) is None:
+                        break
+                # 丢失说明批次超出了设备的处理能力，减半后再重传
+                limit = max(1, len(batch) // 2)
+                index = sent + position
+                attempts[index] += 1
+                if attempts[index] > self.retries:
+                    report.Failed = pending[index:]
+                    report.Elapsed = time.monotonic() - start
+                    return report
+                report.Retransmitted += len(batch) - position
+                sent = index
+                break
+            else:
+                sent += len(batch)
+                if len(batch) >= limit:
+                    limit = min(self.batch_size, limit + 1)
+        report.Elapsed = time.monotonic() - start
+        return report
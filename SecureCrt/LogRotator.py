@@ -0,0 +1,226 @@
+import gzip
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+from typing import List, Optional
+
+_TOKEN = re.compile(r"%(.)")
+
+class _ManagedLog:
+    __slots__ = ("session", "path", "raw", "started", "error")
+
+    def __init__(self, session, path: str, raw: bool):
+        self.session = session
+        self.path = path
+        self.raw = raw
+        self.started = time.monotonic()
+        self.error = ""
+
+
+def _expand(session, path: str) -> str:
+    # SecureCRT 在打开日志时才替换 LogFileName 中的 %H、%S、%Y 等参数，
+    # 磁盘上不存在名为原样模板的文件，因此先展开为固定路径再管理
+    if "%" not in path:
+        return path
+    now = time.time()
+    session_path = session.Path.replace("\\", "/")
+
+    def connected(name: str) -> str:
+        try:
+            return str(getattr(session, name)) if session.Connected else ""
+        except Exception:
+            return ""
+
+    values = {
+        "%": "%",
+        "Y": time.strftime("%Y", time.localtime(now)),
+        "M": time.strftime("%m", time.localtime(now)),
+        "D": time.strftime("%d", time.localtime(now)),
+        "h": time.strftime("%H", time.localtime(now)),
+        "m": time.strftime("%M", time.localtime(now)),
+        "s": time.strftime("%S", time.localtime(now)),
+        "t": f"{int(now * 1000) % 1000:03d}",
+        "S": session_path.rpartition("/")[2],
+        "F": session_path.rpartition("/")[0],
+        "H": connected("RemoteAddress"),
+        "P": connected("RemotePort"),
+    }
+
+    def replace(match):
+        try:
+            return values[match.group(1)]
+        except KeyError:
+            raise ValueError(f"unsupported log file name parameter %{match.group(1)} in {path!r}") from None
+    return _TOKEN.sub(replace, path)
+
+
+class LogRotator:
+    """
+    LogRotator 按大小或时间轮转会话日志，并在后台线程中压缩已关闭的日志段。
+
+    会话日志由 SecureCRT 直接写入磁盘，长期运行的会话日志会增长到数十 GB。
+    Check 只对每个日志文件调用一次 os.stat，超过 max_bytes 或 max_age 时
+    停止 Session.Log，把文件改名为带时间戳的日志段，再以相同文件名重新开始记录。
+    日志段交给唯一的后台线程用 gzip 压缩，脚本和各选项卡的日志记录都不会等待压缩完成。
+
+    示例：
+    rotator = LogRotator(max_bytes=512 * 1024 * 1024, max_age=24 * 3600)
+    for index in range(1, crt.GetTabCount() + 1):
+        rotator.Add(crt.GetTab(index).Session)
+    while True:
+        rotator.Check()
+        crt.Sleep(10000)
+
+    Attributes:
+        Errors (List[str]): 读取大小、改名或压缩失败时的错误信息
+    """
+    __slots__ = ("max_bytes", "max_age", "compress", "Errors", "_logs", "_queue", "_worker")
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, max_age: Optional[float] = None,
+                 compress: bool = True):
+        """
+        初始化 LogRotator 对象
+
+        Args:
+            max_bytes (int, optional): 日志文件的最大字节数，为0表示不按大小轮转。默认为256MB
+            max_age (float, optional): 日志段的最长记录秒数。默认为None，表示不按时间轮转
+            compress (bool, optional): 是否用 gzip 压缩已关闭的日志段。默认为True
+        """
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.compress = compress
+        self.Errors = []
+        self._logs = []
+        self._queue = queue.Queue()
+        self._worker = None
+
+    def Add(self, session, path: Optional[str] = None, append: bool = True, raw: bool = False) -> str:
+        """
+        开始管理一个会话的日志。如果会话尚未记录日志，则开始记录。
+
+        路径中的 SecureCRT 替换参数（%S、%H、%Y 等）在此时展开一次，
+        之后会话固定记录到展开后的文件，轮转时才能找到并改名该文件。
+
+        Args:
+            session (Session): Session 对象
+            path (str, optional): 日志文件路径。默认为None，使用 Session.LogFileName
+            append (bool, optional): 开始记录时是否追加到已有文件。默认为True
+            raw (bool, optional): 是否记录原始字符。默认为False
+
+        Returns:
+            str: 被管理的日志文件路径
+
+        Raises:
+            ValueError: 如果路径包含无法展开的替换参数
+        """
+        path = _expand(session, session.LogFileName if path is None else path)
+        if path != session.LogFileName:
+            if session.Logging:
+                session.Log(False)
+            session.LogFileName = path
+        if not session.Logging:
+            session.Log(True, append, raw)
+        self._logs.append(_ManagedLog(session, path, raw))
+        return path
+
+    def _segment_name(self, path: str) -> str:
+        root, ext = os.path.splitext(path)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        name = f"{root}.{stamp}{ext}"
+        counter = 1
+        while os.path.exists(name) or os.path.exists(name + ".gz"):
+            name = f"{root}.{stamp}-{counter}{ext}"
+            counter += 1
+        return name
+
+    def _rotate(self, log: _ManagedLog) -> Optional[str]:
+        session = log.session
+        session.Log(False)
+        try:
+            segment = self._segment_name(log.path)
+            os.replace(log.path, segment)
+        except OSError as e:
+            self.Errors.append(f"{log.path}: {e}")
+            segment = None
+        finally:
+            # 无论改名是否成功都恢复记录；改名失败时必须以追加方式打开，否则会清空原日志
+            session.Log(True, segment is None, log.raw)
+            log.started = time.monotonic()
+        if segment is not None and self.compress:
+            self._submit(segment)
+        return segment
+
+    def Check(self) -> List[str]:
+        """
+        检查所有被管理的日志，轮转超过大小或时间阈值的日志。
+
+        Returns:
+            List[str]: 本次轮转产生的日志段路径，压缩完成后文件名会加上 ".gz"
+        """
+        now = time.monotonic()
+        segments = []
+        for log in self._logs:
+            expired = self.max_age is not None and now - log.started >= self.max_age
+            if not expired and self.max_bytes:
+                try:
+                    expired = os.stat(log.path).st_size >= self.max_bytes
+                    log.error = ""
+                except OSError as e:
+                    # 同一个错误只报告一次，避免每次 Check 都追加
+                    if str(e) != log.error:
+                        log.error = str(e)
+                        self.Errors.append(f"{log.path}: {e}")
+                    continue
+            if expired:
+                segment = self._rotate(log)
+                if segment is not None:
+                    segments.append(segment)
+        return segments
+
+    def _submit(self, segment: str) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._compress_loop, name="LogRotator", daemon=True)
+            self._worker.start()
+        self._queue.put(segment)
+
+    def _compress_loop(self) -> None:
+        while True:
+            segment = self._queue.get()
+            try:
+                if segment is None:
+                    return
+                temporary = segment + ".gz.tmp"
+                with open(segment, "rb") as source, gzip.open(temporary, "wb", compresslevel=6) as target:
+                    shutil.copyfileobj(source, target, 1024 * 1024)
+                os.replace(temporary, segment + ".gz")
+                os.remove(segment)
+            except OSError as e:
+                self.Errors.append(f"{segment}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def Flush(self) -> None:
+        """
+        等待所有已提交的日志段压缩完成。
+        """
+        if self._worker is not None:
+            self._queue.join()
+
+    def Close(self, stop_logging: bool = False) -> None:
+        """
+        等待压缩完成并停止后台线程。
+
+        Args:
+            stop_logging (bool, optional): 是否同时停止被管理会话的日志记录。默认为False
+        """
+        if stop_logging:
+            for log in self._logs:
+                log.session.Log(False)
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+        self._logs = []
@@ -0,0 +1,172 @@
+import codecs
+import os
+import time
+from typing import Iterator, Optional
+
+class LogTail:
+    """
+    LogTail 按偏移量增量读取会话日志文件。
+
+    启用 Session.Log(True) 并设置 Session.LogFileName 后，日志文件中已包含会话收到的全部数据。
+    脚本可以直接从磁盘读取输出，而不必进行大量 ReadString COM 调用。
+    LogTail 记住上一次读取的位置，每次以最多 read_size 字节的大块读取新增内容，
+    并用增量解码器处理跨块的多字节字符。
+
+    两次读取之间不保持文件打开：Windows 上打开的文件不能被重命名，
+    一直打开日志文件会使 SecureCRT 或其他程序的日志轮转失败。
+    每次读取前用 os.stat 比较文件的 (st_dev, st_ino) 和大小，只在有新内容时打开文件。
+    文件变短（被截断或以覆盖方式重新开始记录）时从头读取；
+    文件被轮转（路径指向了新文件）时从新文件开头读取，
+    旧文件在最后一次读取之后、被重命名之前写入的内容不再读取。
+
+    示例：
+    crt.Session.Log(True)
+    tail = LogTail.FromSession(crt.Session)
+    for line in tail.Lines(timeout=30):
+        if "%LINK-3-UPDOWN" in line:
+            ...
+    """
+    __slots__ = ("path", "read_size", "max_line", "_encoding", "_errors", "_identity",
+                 "_offset", "_decoder", "_partial")
+
+    def __init__(self, path: str, start_at_end: bool = False, read_size: int = 1024 * 1024,
+                 encoding: str = "utf-8", errors: str = "replace", max_line: int = 64 * 1024):
+        """
+        初始化 LogTail 对象
+
+        Args:
+            path (str): 日志文件路径
+            start_at_end (bool, optional): 是否从文件当前末尾开始读取。默认为False，从头读取
+            read_size (int, optional): 每次读取的最大字节数。默认为1MB
+            encoding (str, optional): 日志文件编码。默认为 "utf-8"
+            errors (str, optional): 解码错误的处理方式。默认为 "replace"
+            max_line (int, optional): Lines 中单行的最大字符数，超过后按此长度切分。默认为65536
+        """
+        self.path = path
+        self.read_size = read_size
+        self.max_line = max_line
+        self._encoding = encoding
+        self._errors = errors
+        # 正在读取的文件的 (st_dev, st_ino)，尚未读取时为 None
+        self._identity = None
+        self._offset = 0
+        self._partial = ""
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors)
+        if start_at_end:
+            stat = self._stat()
+            if stat is not None:
+                self._identity = (stat.st_dev, stat.st_ino)
+                self._offset = stat.st_size
+
+    @classmethod
+    def FromSession(cls, session, **kwargs) -> "LogTail":
+        """
+        为会话的当前日志文件创建 LogTail 对象。
+
+        Args:
+            session (Session): 已启用日志记录的 Session 对象
+            **kwargs: 传给 LogTail 构造函数的其他参数
+
+        Returns:
+            LogTail: 跟踪 Session.LogFileName 的 LogTail 对象
+        """
+        return cls(session.LogFileName, **kwargs)
+
+    @property
+    def Offset(self) -> int:
+        """
+        返回下一次读取的字节偏移量。
+
+        Returns:
+            int: 字节偏移量
+        """
+        return self._offset
+
+    def _stat(self) -> Optional[os.stat_result]:
+        try:
+            return os.stat(self.path)
+        except OSError:
+            return None
+
+    def _read_block(self, identity) -> str:
+        try:
+            with open(self.path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                if (stat.st_dev, stat.st_ino) != identity:
+                    # stat 之后文件又被轮转，下一次读取时再处理
+                    return ""
+                f.seek(self._offset)
+                data = f.read(self.read_size)
+        except OSError:
+            return ""
+        self._offset += len(data)
+        return self._decoder.decode(data) if data else ""
+
+    def Read(self) -> str:
+        """
+        读取自上一次读取以来新增的内容，每次最多读取 read_size 字节。
+
+        每次调用 os.stat 检查文件的标识和大小，只在有新内容时短暂打开文件，读完立即关闭。
+
+        Returns:
+            str: 新增的文本，没有新内容时返回空字符串
+        """
+        stat = self._stat()
+        if stat is None:
+            return ""
+        identity = (stat.st_dev, stat.st_ino)
+        tail = ""
+        if identity != self._identity:
+            # 第一次读取或文件已被轮转，从新文件开头读取
+            if self._identity is not None:
+                tail = self._decoder.decode(b"", final=True)
+            self._identity = identity
+            self._offset = 0
+            self._decoder.reset()
+        elif stat.st_size < self._offset:
+            # 文件被截断，从头开始读取
+            self._offset = 0
+            self._decoder.reset()
+        if stat.st_size == self._offset:
+            return tail
+        return tail + self._read_block(identity)
+
+    def Lines(self, timeout: Optional[float] = None, poll_interval: float = 0.2) -> Iterator[str]:
+        """
+        持续返回日志中新增的完整行（不包含行尾换行符）。
+
+        只在内存中保留最后一个不完整的行，超过 max_line 个字符时按该长度切分返回，
+        因此内存占用有上限。超过 timeout 秒没有新内容时结束。
+
+        Args:
+            timeout (float, optional): 空闲超时秒数。默认为None，表示一直等待
+            poll_interval (float, optional): 没有新内容时两次读取之间的秒数。默认为0.2
+
+        Returns:
+            Iterator[str]: 新增的行
+        """
+        idle_since = time.monotonic()
+        while True:
+            data = self.Read()
+            if data:
+                idle_since = time.monotonic()
+                lines = (self._partial + data).split("\n")
+                self._partial = lines.pop()
+                for line in lines:
+                    yield line[:-1] if line.endswith("\r") else line
+                while len(self._partial) > self.max_line:
+                    yield self._partial[:self.max_line]
+                    self._partial = self._partial[self.max_line:]
+                continue
+            if timeout is not None and time.monotonic() - idle_since >= timeout:
+                return
+            time.sleep(poll_interval)
+
+    def Close(self) -> None:
+        """
+        结束读取，丢弃尚未组成完整行的数据。
+
+        LogTail 在两次读取之间不保持文件打开，不需要释放文件句柄。
+        """
+        self._partial = ""
+        self._decoder.reset()
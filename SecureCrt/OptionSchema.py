@@ -0,0 +1,461 @@
+from array import array
+from multiprocessing import Pool
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .SessionIni import SessionIni
+
+STRING = "S"
+DWORD = "D"
+BINARY = "B"
+STRING_ARRAY = "Z"
+
+# DWORD 列中表示"选项不存在"和"值无法转换为 DWORD"的值，DWORD 本身只能是 0..0xFFFFFFFF
+_MISSING = -1
+_UNCONVERTIBLE = -2
+
+class InvalidValue:
+    """
+    InvalidValue 表示会话中存在但无法按 schema 读取的选项值，与表示缺失的None区分开。
+
+    例如 DWORD 选项在文件中以 S: 前缀保存、值无法解码，或者会话文件本身无法读取。
+
+    Attributes:
+        Value (Any): 读到的原始值，无法读取时为None
+        Error (str): 错误信息
+    """
+    __slots__ = ("Value", "Error")
+
+    def __init__(self, value: Any, error: str):
+        self.Value = value
+        self.Error = error
+
+    def __eq__(self, other):
+        return isinstance(other, InvalidValue) and (self.Value, self.Error) == (other.Value, other.Error)
+
+    def __hash__(self):
+        return hash(self.Error)
+
+    def __repr__(self):
+        return f"InvalidValue({self.Value!r}, {self.Error!r})"
+
+
+class OptionSpec:
+    """
+    OptionSpec 描述一个会话选项的类型和取值约束。
+
+    Attributes:
+        Name (str): 选项名称
+        Kind (str): 选项类型，STRING、DWORD、BINARY 或 STRING_ARRAY
+        Minimum (int): DWORD 选项的最小值，None 表示不限
+        Maximum (int): DWORD 选项的最大值，None 表示不限
+        Choices (Tuple[str, ...]): STRING 选项允许的值（不区分大小写），None 表示不限
+    """
+    __slots__ = ("Name", "Kind", "Minimum", "Maximum", "Choices")
+
+    def __init__(self, name: str, kind: str, minimum: Optional[int] = None, maximum: Optional[int] = None,
+                 choices: Optional[Sequence[str]] = None):
+        """
+        初始化 OptionSpec 对象
+
+        Args:
+            name (str): 选项名称
+            kind (str): 选项类型，STRING、DWORD、BINARY 或 STRING_ARRAY
+            minimum (int, optional): DWORD 选项的最小值。默认为None
+            maximum (int, optional): DWORD 选项的最大值。默认为None
+            choices (Sequence[str], optional): STRING 选项允许的值。默认为None
+
+        Raises:
+            ValueError: 如果类型未知
+        """
+        if kind not in (STRING, DWORD, BINARY, STRING_ARRAY):
+            raise ValueError(f"unknown option type: {kind!r}")
+        self.Name = name
+        self.Kind = kind
+        self.Minimum = minimum
+        self.Maximum = maximum
+        self.Choices = tuple(choices) if choices is not None else None
+
+    def __repr__(self):
+        return f"OptionSpec({self.Name!r}, {self.Kind!r})"
+
+    def Convert(self, value: Any):
+        """
+        把 GetOption 返回的值转换为该类型的 Python 值，不检查取值约束。
+
+        COM 接口返回的字符串数组和二进制值是元组，SessionIni 返回的是列表和 bytes，
+        两者转换后可以直接比较。
+
+        Args:
+            value (Any): 选项的值
+
+        Returns:
+            Union[str, int, bytes, List[str]]: 转换后的值
+
+        Raises:
+            ValueError: 如果值无法转换为该类型
+        """
+        if self.Kind == DWORD:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{self.Name}: expected a DWORD, got {value!r}") from None
+            if not 0 <= value <= 0xFFFFFFFF:
+                raise ValueError(f"{self.Name}: DWORD out of range: {value}")
+            return value
+        if self.Kind == BINARY:
+            try:
+                return bytes(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{self.Name}: expected binary data, got {value!r}") from None
+        if self.Kind == STRING_ARRAY:
+            if isinstance(value, str):
+                raise ValueError(f"{self.Name}: expected a string array, got {value!r}")
+            return [str(item) for item in value]
+        return str(value)
+
+    def Coerce(self, value: Any):
+        """
+        转换值（见 Convert）并检查取值约束。
+
+        Args:
+            value (Any): 选项的值
+
+        Returns:
+            Union[str, int, bytes, List[str]]: 转换后的值
+
+        Raises:
+            ValueError: 如果值无法转换或不满足约束
+        """
+        value = self.Convert(value)
+        if self.Kind == DWORD:
+            if self.Minimum is not None and value < self.Minimum:
+                raise ValueError(f"{self.Name}: {value} is less than {self.Minimum}")
+            if self.Maximum is not None and value > self.Maximum:
+                raise ValueError(f"{self.Name}: {value} is greater than {self.Maximum}")
+        elif self.Kind == STRING and self.Choices is not None:
+            if value.lower() not in (choice.lower() for choice in self.Choices):
+                raise ValueError(f"{self.Name}: {value!r} is not one of {', '.join(self.Choices)}")
+        return value
+
+
+class OptionSchema:
+    """
+    OptionSchema 是一组 OptionSpec，用于校验和批量读取会话选项。
+
+    示例：
+    schema = OptionSchema([OptionSpec("Hostname", STRING), OptionSpec("[SSH2] Port", DWORD, 1, 65535)])
+    errors = schema.Validate({"Hostname": "r1", "[SSH2] Port": 0})
+    """
+    __slots__ = ("_specs",)
+
+    def __init__(self, specs: Iterable[OptionSpec]):
+        """
+        初始化 OptionSchema 对象
+
+        Args:
+            specs (Iterable[OptionSpec]): 选项定义
+        """
+        self._specs = {spec.Name: spec for spec in specs}
+
+    @classmethod
+    def FromIni(cls, ini: SessionIni, names: Optional[Iterable[str]] = None) -> "OptionSchema":
+        """
+        按会话文件（通常是模板会话）中选项的类型前缀生成 OptionSchema。
+
+        Args:
+            ini (SessionIni): 会话文件
+            names (Iterable[str], optional): 只包含这些选项。默认为None，包含文件中的全部选项
+
+        Returns:
+            OptionSchema: 生成的 OptionSchema 对象
+        """
+        names = ini.Options if names is None else names
+        return cls(OptionSpec(name, ini.GetOptionType(name)) for name in names)
+
+    @property
+    def Names(self) -> List[str]:
+        """
+        返回所有选项名称。
+
+        Returns:
+            List[str]: 选项名称列表
+        """
+        return list(self._specs)
+
+    def __getitem__(self, name: str) -> OptionSpec:
+        return self._specs[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def Validate(self, options: Dict[str, Any]) -> List[str]:
+        """
+        校验一组选项值，忽略 schema 中没有定义的选项。
+
+        Args:
+            options (Dict[str, Any]): 选项名称到值的映射
+
+        Returns:
+            List[str]: 错误信息列表，全部有效时为空列表
+        """
+        errors = []
+        for name, value in options.items():
+            spec = self._specs.get(name)
+            if spec is None:
+                continue
+            try:
+                spec.Coerce(value)
+            except ValueError as e:
+                errors.append(str(e))
+        return errors
+
+
+SESSION_SCHEMA = OptionSchema([
+    OptionSpec("Hostname", STRING),
+    OptionSpec("Username", STRING),
+    OptionSpec("Protocol Name", STRING, choices=("SSH2", "SSH1", "Telnet", "Telnet/SSL", "RLogin", "Serial",
+                                                 "TAPI", "Raw", "SFTP", "Local Shell")),
+    OptionSpec("[SSH2] Port", DWORD, 1, 65535),
+    OptionSpec("Port", DWORD, 1, 65535),
+    OptionSpec("Emulation", STRING),
+    OptionSpec("Rows", DWORD, 1),
+    OptionSpec("Cols", DWORD, 1),
+    OptionSpec("Scrollback", DWORD),
+    OptionSpec("Log Filename V2", STRING),
+    OptionSpec("Start Log Upon Connect", DWORD, 0, 1),
+    OptionSpec("Idle NO-OP Check", DWORD, 0, 1),
+    OptionSpec("Idle NO-OP Delay", DWORD),
+    OptionSpec("Keyword Set", STRING_ARRAY),
+])
+
+
+def _read_row(job: Tuple[str, List[Tuple[str, str]]]) -> List[Any]:
+    # 缺失的选项为None；存在但无法读取的选项为 InvalidValue，不能与缺失混在一起
+    filename, specs = job
+    try:
+        ini = SessionIni.Load(filename)
+    except OSError as e:
+        return [InvalidValue(None, f"cannot read {filename}: {type(e).__name__}: {e}")] * len(specs)
+    row = []
+    for name, kind in specs:
+        try:
+            stored = ini.GetOptionType(name)
+        except KeyError:
+            row.append(None)
+            continue
+        try:
+            value = ini.GetOption(name)
+        except ValueError as e:
+            row.append(InvalidValue(None, f"{name}: cannot decode {stored} value: {e}"))
+            continue
+        if stored != kind:
+            row.append(InvalidValue(value, f"{name}: stored as type {stored}, expected {kind}"))
+        else:
+            row.append(value)
+    return row
+
+
+class OptionTable:
+    """
+    OptionTable 以列存储方式保存大量会话的选项值，用于快速比较模板和会话之间的差异。
+
+    每个选项一列：DWORD 列是 array("q")（缺失值为 -1），其他类型的列是 list（缺失值为None）。
+    不满足约束的值（如端口为0）照原样保存在列中，Diff 会报告这些值本身，
+    同时记录在 Invalid 中；无法转换为 DWORD 的原始值另外保存，读取列时还原。
+    类型前缀不符、无法解码或文件无法读取的值以 InvalidValue 保存，同样记录在 Invalid 中，不会被当作缺失。
+    Diff 对每一列先用一次 count 判断是否所有会话都与模板一致，该操作在 C 中完成；
+    只有存在差异的列才逐行定位不一致的会话。
+    配置漂移通常只出现在少数选项上，因此大部分列只需一次整列操作。
+
+    Attributes:
+        Paths (List[str]): 会话路径，顺序与每一列相同
+        Invalid (List[Tuple[str, str, Any, str]]): 不满足 schema 的值，每项为 (会话路径, 选项名称, 值, 错误信息)
+
+    示例：
+    table = OptionTable.FromIni(SESSION_SCHEMA, FindSessionFiles(sessions_dir))
+    template = SessionIni.Load(template_file)
+    for name, sessions in table.Diff({name: template.GetOption(name) for name in template.Options}).items():
+        print(name, len(sessions))
+    """
+    __slots__ = ("schema", "Paths", "Invalid", "_columns", "_unconvertible")
+
+    def __init__(self, schema: OptionSchema):
+        """
+        初始化空的 OptionTable 对象
+
+        Args:
+            schema (OptionSchema): 表中包含的选项
+        """
+        self.schema = schema
+        self.Paths = []
+        self.Invalid = []
+        self._columns = {name: array("q") if schema[name].Kind == DWORD else [] for name in schema.Names}
+        self._unconvertible = {}
+
+    @classmethod
+    def FromIni(cls, schema: OptionSchema, files: Dict[str, str], processes: Optional[int] = 0) -> "OptionTable":
+        """
+        从会话 .ini 文件批量读取选项。
+
+        Args:
+            schema (OptionSchema): 要读取的选项
+            files (Dict[str, str]): 会话路径到 .ini 文件路径的映射，如 FindSessionFiles 的返回值
+            processes (int, optional): 进程数，为None时使用 CPU 核数。默认为0，在当前进程中读取
+
+        Returns:
+            OptionTable: 读取结果
+        """
+        table = cls(schema)
+        specs = [(name, schema[name].Kind) for name in schema.Names]
+        jobs = [(filename, specs) for filename in files.values()]
+        if processes == 0:
+            rows = map(_read_row, jobs)
+        else:
+            with Pool(processes) as pool:
+                rows = pool.map(_read_row, jobs, 64)
+        for path, row in zip(files, rows):
+            table.Append(path, dict(zip(schema.Names, row)))
+        return table
+
+    @classmethod
+    def FromConfigurations(cls, schema: OptionSchema, crt, paths: Iterable[str]) -> "OptionTable":
+        """
+        通过 COM 接口读取会话选项。比 FromIni 慢得多，适用于无法直接访问会话文件的情况。
+
+        Args:
+            schema (OptionSchema): 要读取的选项
+            crt: CRT 对象
+            paths (Iterable[str]): 会话路径
+
+        Returns:
+            OptionTable: 读取结果
+        """
+        table = cls(schema)
+        for path in paths:
+            config = crt.OpenSessionConfiguration(path)
+            values = {}
+            for name in schema.Names:
+                try:
+                    values[name] = config.GetOption(name)
+                except Exception:
+                    values[name] = None
+            table.Append(path, values)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.Paths)
+
+    def Append(self, path: str, options: Dict[str, Any]) -> None:
+        """
+        追加一个会话的选项值。
+
+        无效的值不会被丢弃：照原样保存，并以 (会话路径, 选项名称, 值, 错误信息) 记录在 Invalid 中。
+
+        Args:
+            path (str): 会话路径
+            options (Dict[str, Any]): 选项名称到值的映射
+        """
+        index = len(self.Paths)
+        self.Paths.append(path)
+        for name, column in self._columns.items():
+            value = options.get(name)
+            if isinstance(value, InvalidValue):
+                self.Invalid.append((path, name, value.Value, value.Error))
+            elif value is not None:
+                spec = self.schema[name]
+                try:
+                    value = spec.Coerce(value)
+                except ValueError as e:
+                    self.Invalid.append((path, name, value, str(e)))
+                    try:
+                        value = spec.Convert(value)
+                    except ValueError:
+                        pass
+            if not isinstance(column, array):
+                column.append(value)
+            elif value is None:
+                column.append(_MISSING)
+            elif isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= 0xFFFFFFFF:
+                column.append(value)
+            else:
+                self._unconvertible[(name, index)] = value
+                column.append(_UNCONVERTIBLE)
+
+    def _value(self, name: str, column, index: int):
+        value = column[index]
+        if isinstance(column, array):
+            if value == _MISSING:
+                return None
+            if value == _UNCONVERTIBLE:
+                return self._unconvertible[(name, index)]
+        return value
+
+    def Column(self, name: str) -> List[Any]:
+        """
+        返回一个选项在所有会话中的值，顺序与 Paths 相同。
+
+        Args:
+            name (str): 选项名称
+
+        Returns:
+            List[Any]: 选项值列表，缺失的值为None，无法读取的值为 InvalidValue
+
+        Raises:
+            KeyError: 如果选项不在 schema 中
+        """
+        column = self._columns[name]
+        return [self._value(name, column, index) for index in range(len(column))]
+
+    def Row(self, path: str) -> Dict[str, Any]:
+        """
+        返回一个会话的全部选项值。
+
+        Args:
+            path (str): 会话路径
+
+        Returns:
+            Dict[str, Any]: 选项名称到值的映射，缺失的值为None，无法读取的值为 InvalidValue
+
+        Raises:
+            ValueError: 如果会话不在表中
+        """
+        index = self.Paths.index(path)
+        return {name: self._value(name, column, index) for name, column in self._columns.items()}
+
+    def Diff(self, template: Dict[str, Any]) -> Dict[str, List[Tuple[str, Any]]]:
+        """
+        比较所有会话与模板的差异，忽略不在 schema 中的模板选项。
+
+        Args:
+            template (Dict[str, Any]): 模板选项名称到值的映射
+
+        Returns:
+            Dict[str, List[Tuple[str, Any]]]: 有差异的选项名称到 (会话路径, 会话中的值) 列表的映射，
+                会话中缺失该选项时值为None，无效的值照原样返回，无法读取的值为 InvalidValue
+
+        Raises:
+            ValueError: 如果模板中的值本身无效，错误信息列出所有无效的选项
+        """
+        expected_values = {}
+        errors = []
+        for name, expected in template.items():
+            if name not in self._columns:
+                continue
+            try:
+                expected_values[name] = self.schema[name].Coerce(expected)
+            except ValueError as e:
+                errors.append(str(e))
+        if errors:
+            raise ValueError("invalid template values: " + "; ".join(errors))
+        drift = {}
+        count = len(self.Paths)
+        for name, expected in expected_values.items():
+            column = self._columns[name]
+            if column.count(expected) == count:
+                continue
+            drift[name] = [(self.Paths[index], self._value(name, column, index))
+                           for index, value in enumerate(column) if value != expected]
+        return drift
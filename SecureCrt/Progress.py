@@ -0,0 +1,176 @@
+import time
+from typing import Callable, Optional
+
+class Progress:
+    """
+    Progress 合并进度更新，并以限定的频率写入状态栏或选项卡标题。
+
+    在循环中每次迭代都调用 Session.SetStatusText 或设置 Tab.Caption 会明显拖慢循环。
+    Update 只记录进度值并比较一次时间，距离上一次写入不足 1 / max_rate 秒时不产生 COM 调用；
+    Finish 总是写入最终的进度。速率按写入时刻之间的指数移动平均计算，并据此估算剩余时间。
+
+    示例：
+    with Progress.ForStatusBar(crt.Session, total=len(hosts)) as progress:
+        for host in hosts:
+            ...
+            progress.Advance()
+
+    Attributes:
+        Done (int): 已完成的数量
+        Rate (float): 平滑后的速率（每秒完成的数量）
+        Writes (int): 实际写入的次数
+    """
+    __slots__ = ("writer", "total", "max_rate", "message", "smoothing", "Done", "Rate", "Writes",
+                 "_start", "_next_write", "_last_time", "_last_done")
+
+    def __init__(self, writer: Callable[[str], None], total: Optional[int] = None, max_rate: float = 4,
+                 message: str = "", smoothing: float = 0.3):
+        """
+        初始化 Progress 对象
+
+        Args:
+            writer (Callable[[str], None]): 写入进度文本的函数
+            total (int, optional): 总数。默认为None，表示总数未知，不显示百分比和剩余时间
+            max_rate (float, optional): 每秒最多写入的次数。默认为4
+            message (str, optional): 显示在进度前面的文字。默认为空字符串
+            smoothing (float, optional): 速率指数移动平均中新样本的权重。默认为0.3
+        """
+        self.writer = writer
+        self.total = total
+        self.max_rate = max_rate
+        self.message = message
+        self.smoothing = smoothing
+        self.Done = 0
+        self.Rate = 0.0
+        self.Writes = 0
+        self._start = time.monotonic()
+        self._next_write = self._start + 1 / max_rate
+        self._last_time = self._start
+        self._last_done = 0
+
+    @classmethod
+    def ForStatusBar(cls, session, **kwargs) -> "Progress":
+        """
+        创建写入会话状态栏的 Progress 对象。
+
+        Args:
+            session (Session): Session 对象
+            **kwargs: 传给 Progress 构造函数的其他参数
+
+        Returns:
+            Progress: Progress 对象
+        """
+        return cls(session.SetStatusText, **kwargs)
+
+    @classmethod
+    def ForCaption(cls, tab, **kwargs) -> "Progress":
+        """
+        创建写入选项卡标题的 Progress 对象，进度显示在原标题之后。
+
+        Args:
+            tab (Tab): Tab 对象
+            **kwargs: 传给 Progress 构造函数的其他参数
+
+        Returns:
+            Progress: Progress 对象
+        """
+        caption = tab.Caption
+
+        def writer(text: str) -> None:
+            tab.Caption = f"{caption} {text}"
+        return cls(writer, **kwargs)
+
+    @property
+    def Elapsed(self) -> float:
+        """
+        返回从创建到现在的秒数。
+
+        Returns:
+            float: 秒数
+        """
+        return time.monotonic() - self._start
+
+    @property
+    def Remaining(self) -> Optional[float]:
+        """
+        返回按当前速率估算的剩余秒数。
+
+        Returns:
+            float: 剩余秒数，总数未知或速率为0时返回None
+        """
+        if self.total is None or not self.Rate:
+            return None
+        return max(0, self.total - self.Done) / self.Rate
+
+    def Update(self, done: int, message: Optional[str] = None) -> None:
+        """
+        设置当前进度。距离上一次写入足够久时才写入。
+
+        Args:
+            done (int): 已完成的数量
+            message (str, optional): 新的提示文字。默认为None，保持不变
+        """
+        self.Done = done
+        if message is not None:
+            self.message = message
+        now = time.monotonic()
+        if now >= self._next_write:
+            self._write(now)
+
+    def Advance(self, count: int = 1) -> None:
+        """
+        把进度增加 count。
+
+        Args:
+            count (int, optional): 增加的数量。默认为1
+        """
+        self.Update(self.Done + count)
+
+    def Finish(self, message: Optional[str] = None) -> None:
+        """
+        立即写入最终进度。
+
+        Args:
+            message (str, optional): 最终的提示文字。默认为None，保持不变
+        """
+        if message is not None:
+            self.message = message
+        self._write(time.monotonic())
+
+    def Format(self) -> str:
+        """
+        返回当前进度的文本，如 "备份 120/500 24% 35.2/s 剩余 0:10"。
+
+        Returns:
+            str: 进度文本
+        """
+        parts = [self.message] if self.message else []
+        if self.total:
+            parts.append(f"{self.Done}/{self.total} {self.Done * 100 // self.total}%")
+        else:
+            parts.append(str(self.Done))
+        if self.Rate:
+            parts.append(f"{self.Rate:.1f}/s")
+        remaining = self.Remaining
+        if remaining is not None:
+            minutes, seconds = divmod(int(remaining + 0.5), 60)
+            parts.append(f"剩余 {minutes}:{seconds:02d}")
+        return " ".join(parts)
+
+    def _write(self, now: float) -> None:
+        elapsed = now - self._last_time
+        # 间隔过短的样本（如 Finish 紧跟在一次写入之后）误差很大，不计入速率
+        if elapsed >= 1 / self.max_rate:
+            sample = (self.Done - self._last_done) / elapsed
+            self.Rate = self.smoothing * sample + (1 - self.smoothing) * self.Rate if self.Rate else sample
+            self._last_time = now
+            self._last_done = self.Done
+        self.writer(self.Format())
+        self.Writes += 1
+        self._next_write = now + 1 / self.max_rate
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.Finish()
@@ -1,12 +1,124 @@
-from typing import List, Union, Optional, Any
+import time
+from typing import Iterator, List, Union, Optional, Any
+from .ScreenSnapshot import ScreenSnapshot
+from .ScreenDiff import ScreenDiff, ScreenChange
+from .Expect import ExpectMatcher, ExpectMatch
+from .Terminal import Terminal
+from .LineSender import LineSender, SendLinesReport
+from .CommandResult import CommandResult
+
+# 轮询时每次 ReadString 最多等待的毫秒数。不带参数的 ReadString() 在没有数据时会一直阻塞，
+# 不能用于需要超时或同时等待多个选项卡的循环
+_POLL_MILLISECONDS = 20
+# 作为 ReadString 分隔符的行尾。\r\n 和 \n 分别列出，由 MatchIndex 确定实际匹配的是哪一个
+_LINE_ENDINGS = ("\r\n", "\n")
+
+# 最多保留读取状态的屏幕数，超过时丢弃最久未使用的
+_MAX_READ_STATES = 64
+
+class _ReadState:
+    # 一个屏幕的读取状态。crt.GetTab() 等每次都会创建新的 Screen 包装对象，
+    # 因此状态按底层 COM 对象保存，包装同一屏幕的所有 Screen 对象共用
+    __slots__ = ("obj", "pending", "mark")
+
+    def __init__(self, obj):
+        self.obj = obj
+        # 上一次 Expect 匹配之后已读取但尚未处理的数据
+        self.pending = ""
+        # 屏幕上已经作为数据返回过的位置 (行, 列)，用于 ReadString 超时后读回不完整的行
+        self.mark = None
+
+
+_read_states: List[_ReadState] = []
+
+
+def _read_state(obj) -> _ReadState:
+    # pywin32 的 COM 对象按底层 IUnknown 比较相等，不能用作字典的键，因此按相等性查找
+    for index, state in enumerate(_read_states):
+        if state.obj is obj or state.obj == obj:
+            if index:
+                del _read_states[index]
+                _read_states.insert(0, state)
+            return state
+    state = _ReadState(obj)
+    _read_states.insert(0, state)
+    del _read_states[_MAX_READ_STATES:]
+    return state
+
+
+class _Wait:
+    # 一次进行中的 Expect 或 Run：逐块读取数据交给匹配器，并记录延迟。
+    # Screen、AsyncScreen 和 FanOut 共用它，只是在两次读取之间等待的方式不同。
+    __slots__ = ("screen", "matcher", "command", "delimiters", "case_insensitive", "start", "first_data", "match",
+                 "_synchronous")
+
+    def __init__(self, screen: "Screen", matcher: ExpectMatcher, command: Optional[str] = None,
+                 bCaseInsensitive: bool = False):
+        self.screen = screen
+        self.matcher = matcher
+        self.command = command
+        # 字符串模式同时作为 ReadString 的分隔符，出现提示符时立即返回，不必等到轮询超时
+        self.delimiters = list(_LINE_ENDINGS) + [pattern for pattern in matcher.patterns
+                                                 if isinstance(pattern, str) and pattern not in _LINE_ENDINGS]
+        self.case_insensitive = bCaseInsensitive
+        self.start = time.monotonic()
+        self.first_data = None
+        self.match = None
+        self._synchronous = None
+
+    def Collect(self, timeout_ms: int = _POLL_MILLISECONDS) -> bool:
+        # 最多等待 timeout_ms 毫秒读取一块数据并匹配，返回是否读到了数据；匹配之后剩余的数据留给下一次读取
+        chunk = self.screen._read_chunk(self.delimiters, self.case_insensitive, timeout_ms)
+        if not chunk:
+            return False
+        if self.first_data is None:
+            self.first_data = time.monotonic()
+        self.match = self.matcher.Feed(chunk)
+        if self.match is not None:
+            self.screen._pending = self.matcher.Remainder
+        return True
+
+    def Restore(self) -> None:
+        # 恢复命令开始之前的 Synchronous，可以重复调用
+        if self._synchronous is not None:
+            self.screen.obj.Synchronous = self._synchronous
+            self._synchronous = None
+
+    def Result(self) -> CommandResult:
+        end = time.monotonic()
+        self.Restore()
+        received = self.match.Before if self.match is not None else self.matcher.Buffer
+        first_byte = self.first_data - self.start if self.first_data is not None else None
+        return CommandResult(self.command, received, first_byte, end - self.start, self.match is None)
+
 
 class Screen:
     """
     Screen对象提供对SecureCRT终端屏幕的访问。
     通过Screen对象可以读取屏幕内容、发送命令、等待特定字符串等。
     """
+    __slots__ = ("obj", "_diff", "_state")
+
     def __init__(self, obj):
         self.obj = obj
+        self._diff = None
+        self._state = _read_state(obj)
+
+    @property
+    def _pending(self) -> str:
+        return self._state.pending
+
+    @_pending.setter
+    def _pending(self, value: str) -> None:
+        self._state.pending = value
+
+    @property
+    def _mark(self):
+        return self._state.mark
+
+    @_mark.setter
+    def _mark(self, value) -> None:
+        self._state.mark = value
 
     @property
     def CurrentColumn(self) -> int:
@@ -128,6 +240,109 @@ class Screen:
         """
         self.obj.Clear()
 
+    def Diff(self) -> List[ScreenChange]:
+        """
+        返回自上一次调用 Diff 以来屏幕上发生变化的行。
+
+        每次调用只通过一次 Get2 读取整个屏幕，并与上一次读取时保存的每行哈希比较，
+        屏幕没有变化时返回空列表。第一次调用会把所有行报告为变化。
+        适用于轮询 top、接口计数器等持续刷新的界面。
+
+        Returns:
+            List[ScreenChange]: 发生变化的行，包含行号、新旧内容和变化的列区间
+        """
+        if self._diff is None:
+            self._diff = ScreenDiff(self)
+        return self._diff.Poll()
+
+    def Expect(self, patterns, timeout: int = 0, bCaseInsensitive: bool = False,
+               bMilliseconds: bool = False) -> Optional[ExpectMatch]:
+        """
+        等待字符串或正则表达式模式中的一个出现在输入中。
+
+        与 WaitForStrings 不同，patterns 中可以同时包含字符串和已编译的正则表达式（re.compile），
+        并且返回匹配的索引、匹配文本、正则分组以及匹配之前收到的文本。
+        所有字符串模式由一个 Aho-Corasick 自动机在数据流上单遍匹配，
+        正则表达式只在新数据附近的窗口内搜索，长输出的处理时间与数据量成线性关系。
+
+        匹配之后已经读取的剩余数据会保留给下一次 Expect 调用。
+        超时时已读取的数据被丢弃，这与 WaitForStrings 的行为一致。
+
+        示例：
+        match = crt.Screen.Expect(["Password:", re.compile(r"(\S+)#\s*$")], 10)
+        if match and match.Index == 2:
+            hostname = match.Groups[0]
+
+        Args:
+            patterns: 字符串或已编译正则表达式，或它们的列表
+            timeout (int, optional): 等待超时的秒数或毫秒数。默认为0，表示无超时
+            bCaseInsensitive (bool, optional): 是否忽略大小写。默认为False，即区分大小写
+            bMilliseconds (bool, optional): timeout是否以毫秒为单位。默认为False，表示以秒为单位
+
+        Returns:
+            Optional[ExpectMatch]: 匹配结果，Index 从1开始；如果超时则返回None
+        """
+        deadline = None
+        if timeout:
+            deadline = time.monotonic() + (timeout / 1000.0 if bMilliseconds else timeout)
+        return self._wait(self._begin_expect(patterns, bCaseInsensitive), deadline).match
+
+    def _read_chunk(self, delimiters=_LINE_ENDINGS, bCaseInsensitive: bool = False,
+                    timeout_ms: int = _POLL_MILLISECONDS) -> str:
+        # 先返回上一次匹配之后剩余的数据，没有剩余数据时才从远程读取。
+        # 读取时带超时，没有数据时最多等待 timeout_ms 毫秒，不会阻塞调用方的轮询循环
+        data = self._pending
+        if data:
+            self._pending = ""
+            return data
+        return self._read_delimited(delimiters, bCaseInsensitive, timeout_ms)[0]
+
+    def _read_delimited(self, delimiters, bCaseInsensitive: bool, timeout_ms: int):
+        # 读取到 delimiters 中的任意一个为止，返回 (包含分隔符的数据, MatchIndex)；
+        # 超时返回从屏幕读回的不完整的行和0
+        data = self.obj.ReadString(list(delimiters), max(1, int(timeout_ms)), bCaseInsensitive, True)
+        index = self.obj.MatchIndex
+        if not index:
+            return self._read_back(), 0
+        delimiter = delimiters[index - 1]
+        # 换行之后从下一行的行首开始；其他分隔符（提示符）之后从光标位置开始
+        self._mark = None if delimiter in _LINE_ENDINGS else (self.obj.CurrentRow, self.obj.CurrentColumn)
+        return data + delimiter, index
+
+    def _read_back(self) -> str:
+        # ReadString 超时时丢弃已收到的不完整的行，从屏幕上光标所在行读回尚未返回过的部分
+        row = self.obj.CurrentRow
+        column = self.obj.CurrentColumn
+        start = self._mark[1] if self._mark is not None and self._mark[0] == row else 1
+        self._mark = (row, column)
+        if column <= start:
+            return ""
+        return self.obj.Get(row, start, row, column - 1)
+
+    def _begin_expect(self, patterns, bCaseInsensitive: bool = False) -> _Wait:
+        return _Wait(self, ExpectMatcher(patterns, bCaseInsensitive), bCaseInsensitive=bCaseInsensitive)
+
+    def _begin_command(self, cmd: str, prompt) -> _Wait:
+        # 打开 Synchronous、丢弃尚未处理的数据并发送命令；调用方最后通过 Result 或 Restore 恢复 Synchronous
+        wait = _Wait(self, ExpectMatcher(prompt), cmd)
+        wait._synchronous = self.obj.Synchronous
+        self.obj.Synchronous = True
+        try:
+            self._pending = ""
+            wait.start = time.monotonic()
+            self.obj.Send(cmd + "\r", False, True)
+        except BaseException:
+            wait.Restore()
+            raise
+        return wait
+
+    def _wait(self, wait: _Wait, deadline: Optional[float]) -> _Wait:
+        # 读取数据直到匹配或超时；没有数据时由 ReadString 的超时等待，不需要另外休眠
+        while True:
+            wait.Collect()
+            if wait.match is not None or (deadline is not None and time.monotonic() >= deadline):
+                return wait
+
     def Get(self, row1: int, col1: int, row2: int, col2: int) -> str:
         """
         返回屏幕指定矩形区域的字符串内容。
@@ -179,7 +394,8 @@ class Screen:
         """
         self.obj.Print()
 
-    def ReadString(self, strings=None, timeoutSeconds: int = 0, bCaseInsensitive: bool = False) -> str:
+    def ReadString(self, strings=None, timeoutSeconds: int = 0, bCaseInsensitive: bool = False,
+                   bMilliseconds: bool = False) -> str:
         """
         捕获从远程接收的数据。
         
@@ -204,11 +420,40 @@ class Screen:
             strings: 要等待的字符串或字符串列表
             timeoutSeconds (int, optional): 等待超时秒数。默认为0，表示无超时
             bCaseInsensitive (bool, optional): 是否忽略大小写。默认为False，即区分大小写
+            bMilliseconds (bool, optional): timeoutSeconds是否以毫秒为单位。默认为False，表示以秒为单位
             
         Returns:
             str: 捕获的数据字符串，如果超时则返回空字符串
         """
-        return self.obj.ReadString(strings, timeoutSeconds, bCaseInsensitive)
+        return self.obj.ReadString(strings, timeoutSeconds, bCaseInsensitive, bMilliseconds)
+
+    def Run(self, cmd: str, prompt, timeout: int = 30) -> CommandResult:
+        """
+        发送一条命令，等待提示符，并返回去除回显和提示符之后的命令输出。
+
+        执行期间临时将 Synchronous 设置为 True，以免错过命令的输出，结束后恢复原值。
+        发送命令之前尚未处理的数据会被丢弃。
+        返回结果中同时记录从发送到收到第一个字节的延迟和从发送到出现提示符的延迟，
+        可用于按设备类型调整批量操作的参数。
+
+        示例：
+        result = crt.Screen.Run("show version", "Router#")
+        crt.Dialog.MessageBox(result.Output)
+
+        Args:
+            cmd (str): 要执行的命令，不包含行尾的回车
+            prompt: 命令执行完成后出现的提示符，字符串或已编译的正则表达式
+            timeout (int, optional): 等待提示符的超时秒数。默认为30，0表示无超时
+
+        Returns:
+            CommandResult: 命令输出及延迟统计；超时时 TimedOut 为 True，Output 为已收到的全部输出
+        """
+        wait = self._begin_command(cmd, prompt)
+        try:
+            self._wait(wait, wait.start + timeout if timeout else None)
+            return wait.Result()
+        finally:
+            wait.Restore()
 
     def Send(self, string: str, bSendToScreenOnly: bool = False, bEncode: bool = True) -> None:
         """
@@ -245,6 +490,32 @@ class Screen:
         """
         self.obj.SendKeys(string)
 
+    def SendLines(self, lines: List[str], prompt, batch_size: int = 50, buffer_size: int = 1024,
+                  timeout: int = 10, retries: int = 2) -> SendLinesReport:
+        """
+        批量发送多行命令（例如数千行的配置），以提示符作为批次之间的确认。
+
+        与逐行调用 Send 和 WaitForString 相比，每个批次只调用一次 Send，
+        批次大小受 batch_size 行和 buffer_size 字符（设备输入缓冲区能容纳的大小）限制。
+        发送后逐行等待提示符并检查回显，未确认的行会被重传，详见 LineSender。
+
+        示例：
+        report = crt.Screen.SendLines(config_lines, re.compile(r"\(config[^)]*\)#"))
+        crt.Dialog.MessageBox(f"{report.LinesPerSecond:.0f} 行/秒")
+
+        Args:
+            lines (List[str]): 要发送的命令行，不包含行尾的回车
+            prompt: 每行执行完成后出现的提示符，字符串或已编译的正则表达式
+            batch_size (int, optional): 每批次最多发送的行数。默认为50
+            buffer_size (int, optional): 每批次最多发送的字符数。默认为1024
+            timeout (int, optional): 等待每行提示符的超时秒数。默认为10
+            retries (int, optional): 每行最多重传次数。默认为2
+
+        Returns:
+            SendLinesReport: 发送统计结果，包括每秒行数和重传行数
+        """
+        return LineSender(self, prompt, batch_size, buffer_size, timeout, retries).Send(lines)
+
     def SendSpecial(self, string: str) -> None:
         """
         发送内置的SecureCRT命令。
@@ -261,6 +532,97 @@ class Screen:
         """
         self.obj.SendSpecial(string)
 
+    def Snapshot(self) -> ScreenSnapshot:
+        """
+        一次性读取整个屏幕，返回可在本地查询的快照。
+
+        快照通过一次 Get2 调用获取全部 Rows × Columns 区域，
+        之后对快照的 Get、Get2、Row、Column 查询都不再跨进程调用 COM。
+        需要读取同一屏幕上多个区域时，应优先使用快照。
+
+        Returns:
+            ScreenSnapshot: 当前屏幕内容的快照
+        """
+        rows = self.obj.Rows
+        columns = self.obj.Columns
+        return ScreenSnapshot(self.obj.Get2(1, 1, rows, columns), rows, columns)
+
+    def Stream(self, chunk_hint: int = 65536, idle_timeout: int = 1,
+               terminators: Optional[List[str]] = None) -> Iterator[str]:
+        """
+        以较大的数据块流式读取从远程接收的数据。
+
+        不带参数的 ReadString() 每次 COM 调用往往只返回一个字符。
+        Stream 改为以换行符（以及 terminators 中的字符串）作为 ReadString 的分隔符，
+        每次 COM 调用读取一整行，再把多行合并为约 chunk_hint 个字符的数据块返回，
+        读取大量输出（如 show tech）时 COM 调用次数可减少几个数量级。
+
+        生成器在消费者处理数据块时暂停读取，读到的行先放入容量为 chunk_hint 的缓冲区，
+        缓冲区满时整块返回并清空，因此每个数据块不超过 chunk_hint 个字符，
+        内存中最多只保留一个数据块和一行正在读取的数据。
+        超过 idle_timeout 秒没有收到完整的行，或者收到 terminators 中的任意字符串
+        （例如命令提示符）时，返回剩余数据并结束。
+        超时结束时，ReadString 丢弃的最后一个不完整的行从屏幕上光标所在行读回，作为最后的数据返回。
+        每行需要一次 ReadString 和一次 MatchIndex 调用，由 MatchIndex 区分行尾、结束字符串和超时。
+
+        示例：
+        crt.Screen.Send("show tech\r")
+        with open("tech.txt", "w") as f:
+            for chunk in crt.Screen.Stream(terminators=["Router#"]):
+                f.write(chunk)
+
+        Args:
+            chunk_hint (int, optional): 每个数据块的最大字符数。默认为65536
+            idle_timeout (int, optional): 空闲超时秒数。默认为1
+            terminators (List[str], optional): 收到后即结束读取的字符串列表。默认为None
+
+        Returns:
+            Iterator[str]: 依次返回的数据块，包含换行符和匹配到的结束字符串
+        """
+        delimiters = list(_LINE_ENDINGS) + list(terminators or [])
+        chunk_hint = max(1, chunk_hint)
+        parts = []
+        size = 0
+        data = self._pending
+        self._pending = ""
+        while True:
+            if data:
+                parts.append(data)
+                size += len(data)
+                if size >= chunk_hint:
+                    # 缓冲区已满：按 chunk_hint 切分返回，不足一块的部分留在缓冲区中
+                    buffer = "".join(parts)
+                    end = len(buffer) - len(buffer) % chunk_hint
+                    for start in range(0, end, chunk_hint):
+                        yield buffer[start:start + chunk_hint]
+                    parts = [buffer[end:]] if end < len(buffer) else []
+                    size = len(buffer) - end
+            data, index = self._read_delimited(delimiters, False, idle_timeout * 1000)
+            if index == 0 or index > len(_LINE_ENDINGS):
+                break
+        if data:
+            parts.append(data)
+        if parts:
+            yield "".join(parts)
+
+    def Terminal(self) -> Terminal:
+        """
+        创建一个以当前屏幕内容和光标位置为初始状态的本地终端模型。
+
+        此方法会把 IgnoreEscape 设置为 False，使 ReadString 返回包含转义序列的原始数据。
+        之后把 ReadString 读取的数据传给 Terminal.Feed，
+        即可在本进程内通过 Terminal.Get、Get2、CurrentRow、CurrentColumn 获取屏幕内容，
+        不再为每次查询跨进程调用 COM。
+
+        Returns:
+            Terminal: 本地终端模型
+        """
+        self.obj.IgnoreEscape = False
+        snapshot = self.Snapshot()
+        terminal = Terminal(snapshot.Rows, snapshot.Columns)
+        terminal.Load(snapshot.Lines(), self.obj.CurrentRow, self.obj.CurrentColumn)
+        return terminal
+
     def WaitForCursor(self, timeout: int = 0, bMilliseconds: bool = False) -> bool:
         """
         等待光标位置改变。
@@ -0,0 +1,127 @@
+from array import array
+from typing import List, Tuple
+
+class ScreenChange:
+    """
+    ScreenChange 对象描述两次屏幕读取之间发生变化的一行。
+
+    Attributes:
+        Row (int): 行号，从1开始
+        Text (str): 该行当前的内容
+        Previous (str): 该行上一次读取时的内容
+        Cells (List[Tuple[int, int]]): 发生变化的列区间列表，每项为 (起始列, 结束列)，从1开始且包含两端
+    """
+    __slots__ = ("Row", "Text", "Previous", "Cells")
+
+    def __init__(self, row: int, text: str, previous: str, cells: List[Tuple[int, int]]):
+        self.Row = row
+        self.Text = text
+        self.Previous = previous
+        self.Cells = cells
+
+    def __repr__(self):
+        return f"ScreenChange(Row={self.Row}, Cells={self.Cells}, Text={self.Text!r})"
+
+
+def _changed_cells(previous: str, text: str) -> List[Tuple[int, int]]:
+    cells = []
+    width = max(len(previous), len(text))
+    previous = previous.ljust(width)
+    text = text.ljust(width)
+    start = None
+    for index in range(width):
+        if previous[index] != text[index]:
+            if start is None:
+                start = index + 1
+        elif start is not None:
+            cells.append((start, index))
+            start = None
+    if start is not None:
+        cells.append((start, width))
+    return cells
+
+
+class ScreenDiff:
+    """
+    ScreenDiff 对象跟踪屏幕内容的增量变化。
+
+    每次轮询只调用一次 Screen.Get2 读取整个屏幕，并保存每一行的哈希值。
+    屏幕完全没有变化时只需一次字符串比较即可返回；
+    有变化时只比较哈希不同的行，并返回这些行及其中变化的列区间。
+
+    示例：
+    diff = ScreenDiff(crt.Screen)
+    while True:
+        for change in diff.Poll():
+            process(change.Row, change.Text)
+        crt.Sleep(1000)
+    """
+    __slots__ = ("screen", "_text", "_rows", "_columns", "_lines", "_hashes")
+
+    def __init__(self, screen):
+        """
+        初始化 ScreenDiff 对象
+
+        Args:
+            screen: Screen 对象
+        """
+        self.screen = screen
+        self.Reset()
+
+    def Reset(self) -> None:
+        """
+        丢弃上一次读取的内容，下一次轮询将把所有行报告为变化。
+        """
+        self._text = None
+        self._rows = 0
+        self._columns = 0
+        self._lines = []
+        self._hashes = array("q")
+
+    def Poll(self) -> List[ScreenChange]:
+        """
+        读取当前屏幕并返回自上一次轮询以来发生变化的行。
+
+        第一次轮询（或调用 Reset 之后）会把所有行报告为变化。
+
+        Returns:
+            List[ScreenChange]: 发生变化的行，按行号排序
+        """
+        obj = self.screen.obj
+        rows = obj.Rows
+        columns = obj.Columns
+        return self.Update(obj.Get2(1, 1, rows, columns), rows, columns)
+
+    def Update(self, text: str, rows: int, columns: int) -> List[ScreenChange]:
+        """
+        使用已读取的屏幕内容更新状态，并返回发生变化的行。
+
+        Args:
+            text (str): Screen.Get2(1, 1, rows, columns) 返回的字符串
+            rows (int): 屏幕行数
+            columns (int): 屏幕列数
+
+        Returns:
+            List[ScreenChange]: 发生变化的行，按行号排序
+        """
+        if text == self._text and rows == self._rows and columns == self._columns:
+            return []
+        lines = text.split("\r\n")[:rows]
+        lines.extend([""] * (rows - len(lines)))
+        hashes = array("q", map(hash, lines))
+        if rows != self._rows or columns != self._columns:
+            previous_lines = [""] * rows
+            changed = range(rows)
+        else:
+            previous_lines = self._lines
+            previous_hashes = self._hashes
+            changed = [index for index in range(rows) if hashes[index] != previous_hashes[index]]
+        changes = [ScreenChange(index + 1, lines[index], previous_lines[index],
+                                _changed_cells(previous_lines[index], lines[index]))
+                   for index in changed]
+        self._text = text
+        self._rows = rows
+        self._columns = columns
+        self._lines = lines
+        self._hashes = hashes
+        return changes
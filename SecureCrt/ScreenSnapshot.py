@@ -0,0 +1,130 @@
+from array import array
+from typing import List
+
+class ScreenSnapshot:
+    """
+    ScreenSnapshot 对象保存某一时刻整个终端屏幕的内容。
+
+    快照通过一次 Screen.Get2 调用读取全部 Rows × Columns 区域，
+    所有行存放在一个连续的字符串缓冲区中，并用行偏移数组定位每一行。
+    之后的区域、行、列查询全部在本地完成，不再产生 COM 调用。
+
+    坐标语义与 Screen.Get / Screen.Get2 相同：行列编号从 1 开始，区域包含两端。
+
+    示例：
+    snap = crt.Screen.Snapshot()
+    header = snap.Get(1, 1, 1, 80)
+    body = snap.Get2(3, 1, 20, 40)
+    """
+    __slots__ = ("Rows", "Columns", "_buffer", "_offsets")
+
+    def __init__(self, text: str, rows: int, columns: int):
+        """
+        初始化 ScreenSnapshot 对象
+
+        Args:
+            text (str): Screen.Get2(1, 1, rows, columns) 返回的字符串，每行以\\r\\n结束
+            rows (int): 屏幕行数
+            columns (int): 屏幕列数
+        """
+        self.Rows = rows
+        self.Columns = columns
+        lines = text.split("\r\n")[:rows]
+        offsets = array("L", [0])
+        position = 0
+        for line in lines:
+            position += len(line)
+            offsets.append(position)
+        # Get2 返回的行数不足时，缺少的行视为空行
+        for _ in range(rows - len(lines)):
+            offsets.append(position)
+        self._buffer = "".join(lines)
+        self._offsets = offsets
+
+    def _line(self, row: int) -> str:
+        if row < 1 or row > self.Rows:
+            raise IndexError(f"row {row} out of range 1..{self.Rows}")
+        return self._buffer[self._offsets[row - 1]:self._offsets[row]]
+
+    def _check(self, row1: int, col1: int, row2: int, col2: int) -> None:
+        if not (1 <= row1 <= row2 <= self.Rows and 1 <= col1 <= col2 <= self.Columns):
+            raise IndexError(f"invalid region ({row1}, {col1}, {row2}, {col2}) "
+                             f"for {self.Rows}x{self.Columns} screen")
+
+    def Row(self, row: int) -> str:
+        """
+        返回指定行的内容，不包含行尾的\\r\\n。
+
+        Args:
+            row (int): 行号，从1开始
+
+        Returns:
+            str: 该行的内容
+        """
+        return self._line(row)
+
+    def Column(self, col: int) -> str:
+        """
+        返回指定列从上到下的全部字符，等价于 Get(1, col, Rows, col)。
+
+        Args:
+            col (int): 列号，从1开始
+
+        Returns:
+            str: 该列的字符，每行一个字符
+        """
+        return self.Get(1, col, self.Rows, col)
+
+    def Lines(self) -> List[str]:
+        """
+        返回所有行的内容列表。
+
+        Returns:
+            List[str]: 每行的内容，不包含行尾的\\r\\n
+        """
+        return [self._line(row) for row in range(1, self.Rows + 1)]
+
+    def Get(self, row1: int, col1: int, row2: int, col2: int) -> str:
+        """
+        返回快照中指定矩形区域的字符串内容，语义与 Screen.Get 相同。
+
+        每行都按区域宽度用空格补齐，各行之间不加分隔符。
+
+        Args:
+            row1 (int): 左上角行坐标
+            col1 (int): 左上角列坐标
+            row2 (int): 右下角行坐标
+            col2 (int): 右下角列坐标
+
+        Returns:
+            str: 指定区域的字符串内容
+
+        Raises:
+            IndexError: 如果区域超出屏幕范围
+        """
+        self._check(row1, col1, row2, col2)
+        width = col2 - col1 + 1
+        return "".join(self._line(row)[col1 - 1:col2].ljust(width)
+                       for row in range(row1, row2 + 1))
+
+    def Get2(self, row1: int, col1: int, row2: int, col2: int) -> str:
+        """
+        返回快照中指定矩形区域的字符串内容，语义与 Screen.Get2 相同。
+
+        每一行去掉行尾空格后以\\r\\n结尾，各行长度取决于该行的实际内容，与 Terminal.Get2 的结果一致。
+
+        Args:
+            row1 (int): 左上角行坐标
+            col1 (int): 左上角列坐标
+            row2 (int): 右下角行坐标
+            col2 (int): 右下角列坐标
+
+        Returns:
+            str: 指定区域的字符串内容，每行以\\r\\n结束
+
+        Raises:
+            IndexError: 如果区域超出屏幕范围
+        """
+        self._check(row1, col1, row2, col2)
+        return "".join(self._line(row)[col1 - 1:col2].rstrip(" ") + "\r\n"
+                       for row in range(row1, row2 + 1))
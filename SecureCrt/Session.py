@@ -1,5 +1,6 @@
 from typing import Any, Optional, Union
 from .Configuration import SessionConfiguration
+from .SessionSnapshot import SessionSnapshot
 from .Tab import Tab
 
 class Session:
@@ -11,6 +12,8 @@ class Session:
     
     SecureCRT 的 Session 对象通过顶级对象的 Session 属性访问。
     """
+    __slots__ = ("obj",)
+
     def __init__(self, obj):
         """
         初始化 Session 对象
@@ -355,6 +358,18 @@ class Session:
         """
         self.obj.SetStatusText(text)
 
+    def Snapshot(self) -> SessionSnapshot:
+        """
+        一次读取会话的全部常用属性并返回快照。
+
+        快照包含 Connected、Label、Locked、Logging、Path、LocalAddress、RemoteAddress 和 RemotePort，
+        之后访问这些属性不再产生 COM 调用。
+
+        Returns:
+            SessionSnapshot: 会话快照
+        """
+        return SessionSnapshot(self.obj)
+
     def Unlock(self, bPrompt: bool = False, strPassword: str = "", 
                bUnlockAllSessions: bool = False) -> None:
         """
@@ -0,0 +1,235 @@
+import bisect
+import fnmatch
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .SessionIni import SessionIni, FindSessionFiles
+
+_VERSION = 1
+
+class SessionRecord:
+    """
+    SessionRecord 对象保存索引中一个会话的可查询字段。
+
+    Attributes:
+        Path (str): 会话路径，如 "Routers/R1"，可用于 Session.Connect("/s Routers/R1")
+        Folder (str): 会话所在的文件夹，如 "Routers"，顶层会话为空字符串
+        Hostname (str): 主机名
+        Protocol (str): 协议名，如 "SSH2"
+        Port (int): 端口号，无法确定时为None
+        Username (str): 用户名
+    """
+    __slots__ = ("Path", "Folder", "Hostname", "Protocol", "Port", "Username")
+
+    def __init__(self, path: str, hostname: str, protocol: str, port: Optional[int], username: str):
+        self.Path = path
+        self.Folder = path.rpartition("/")[0]
+        self.Hostname = hostname
+        self.Protocol = protocol
+        self.Port = port
+        self.Username = username
+
+    def __repr__(self):
+        return (f"SessionRecord(Path={self.Path!r}, Hostname={self.Hostname!r}, Protocol={self.Protocol!r}, "
+                f"Port={self.Port}, Username={self.Username!r})")
+
+
+def _option(ini: SessionIni, name: str, default=None):
+    try:
+        return ini.GetOption(name)
+    except KeyError:
+        return default
+
+
+def _read_record(path: str, filename: str) -> SessionRecord:
+    ini = SessionIni.Load(filename)
+    protocol = _option(ini, "Protocol Name", "")
+    # SSH 会话的端口保存在带协议前缀的选项中，其他协议使用 "Port"
+    port = _option(ini, f"[{protocol}] Port") if protocol else None
+    if port is None:
+        port = _option(ini, "Port")
+    return SessionRecord(path, _option(ini, "Hostname", ""), protocol, port, _option(ini, "Username", ""))
+
+
+class SessionIndex:
+    """
+    SessionIndex 是 Sessions 目录的持久化索引，按主机名、协议、端口、用户名和文件夹查询会话。
+
+    逐个打开会话配置进行搜索非常慢。SessionIndex 扫描 Sessions 目录，
+    用 SessionIni 直接解析 .ini 文件，并把结果连同每个文件的修改时间和大小保存到磁盘。
+    之后的 Refresh 只重新解析修改时间或大小变化的文件，删除的文件会从索引中移除。
+    查询完全在内存中完成，会话路径按顺序保存，前缀查询使用二分查找。
+
+    示例：
+    index = SessionIndex(r"C:\\Users\\me\\AppData\\Roaming\\VanDyke\\Config\\Sessions")
+    index.Refresh()
+    for path in index.Find(hostname="10.1.*", protocol="SSH2"):
+        crt.Session.ConnectInTab(f"/s \\"{path}\\"")
+    """
+    __slots__ = ("sessions_dir", "index_path", "_records", "_stamps", "_paths", "_by_hostname")
+
+    def __init__(self, sessions_dir: str, index_path: Optional[str] = None):
+        """
+        初始化 SessionIndex 对象，并加载已保存的索引（如果存在）
+
+        Args:
+            sessions_dir (str): SecureCRT 配置目录下的 Sessions 目录
+            index_path (str, optional): 索引文件路径。默认为None，保存在 Sessions 目录旁的 SessionIndex.json
+        """
+        self.sessions_dir = os.path.abspath(sessions_dir)
+        self.index_path = index_path or os.path.join(os.path.dirname(self.sessions_dir), "SessionIndex.json")
+        self._records = {}
+        self._stamps = {}
+        self._paths = []
+        self._by_hostname = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != _VERSION or data.get("sessions_dir") != self.sessions_dir:
+            return
+        for path, (mtime, size, hostname, protocol, port, username) in data["sessions"].items():
+            self._records[path] = SessionRecord(path, hostname, protocol, port, username)
+            self._stamps[path] = (mtime, size)
+        self._reindex()
+
+    def Save(self) -> None:
+        """
+        把索引保存到 index_path。
+        """
+        sessions = {}
+        for path, record in self._records.items():
+            mtime, size = self._stamps[path]
+            sessions[path] = [mtime, size, record.Hostname, record.Protocol, record.Port, record.Username]
+        temporary = self.index_path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump({"version": _VERSION, "sessions_dir": self.sessions_dir, "sessions": sessions}, f,
+                      ensure_ascii=False)
+        os.replace(temporary, self.index_path)
+
+    def _scan(self) -> Dict[str, Tuple[str, int, int]]:
+        found = {}
+        for path, filename in FindSessionFiles(self.sessions_dir).items():
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                # 扫描过程中被删除的文件按已删除处理
+                continue
+            found[path] = (filename, stat.st_mtime_ns, stat.st_size)
+        return found
+
+    def _reindex(self) -> None:
+        self._paths = sorted(self._records)
+        self._by_hostname = {}
+        for path in self._paths:
+            self._by_hostname.setdefault(self._records[path].Hostname.lower(), []).append(path)
+
+    def Refresh(self, save: bool = True) -> Tuple[int, int, int]:
+        """
+        扫描 Sessions 目录，重新解析新增或修改过的会话文件，移除已删除的会话。
+
+        Args:
+            save (bool, optional): 有变化时是否保存索引。默认为True
+
+        Returns:
+            Tuple[int, int, int]: (新增, 更新, 删除) 的会话数量
+        """
+        found = self._scan()
+        added = updated = 0
+        for path, (filename, mtime, size) in found.items():
+            stamp = self._stamps.get(path)
+            if stamp == (mtime, size):
+                continue
+            try:
+                record = _read_record(path, filename)
+            except (OSError, ValueError):
+                continue
+            if stamp is None:
+                added += 1
+            else:
+                updated += 1
+            self._records[path] = record
+            self._stamps[path] = (mtime, size)
+        removed = [path for path in self._records if path not in found]
+        for path in removed:
+            del self._records[path]
+            del self._stamps[path]
+        if added or updated or removed:
+            self._reindex()
+            if save:
+                self.Save()
+        return added, updated, len(removed)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def Get(self, path: str) -> Optional[SessionRecord]:
+        """
+        返回指定会话的索引记录。
+
+        Args:
+            path (str): 会话路径
+
+        Returns:
+            SessionRecord: 索引记录，会话不存在时返回None
+        """
+        return self._records.get(path)
+
+    def FindByPrefix(self, prefix: str) -> List[str]:
+        """
+        返回路径以 prefix 开头的所有会话，如 "Routers/" 返回 Routers 文件夹（含子文件夹）中的会话。
+
+        Args:
+            prefix (str): 会话路径前缀
+
+        Returns:
+            List[str]: 按路径排序的会话路径
+        """
+        start = bisect.bisect_left(self._paths, prefix)
+        end = start
+        while end < len(self._paths) and self._paths[end].startswith(prefix):
+            end += 1
+        return self._paths[start:end]
+
+    def Find(self, path: str = "*", hostname: Optional[str] = None, protocol: Optional[str] = None,
+             port: Optional[int] = None, username: Optional[str] = None,
+             folder: Optional[str] = None) -> List[str]:
+        """
+        按字段查询会话。字符串条件支持 * 和 ? 通配符，且不区分大小写；所有条件同时满足才匹配。
+
+        Args:
+            path (str, optional): 会话路径的通配符模式。默认为 "*"
+            hostname (str, optional): 主机名或其通配符模式。默认为None，不限
+            protocol (str, optional): 协议名或其通配符模式。默认为None，不限
+            port (int, optional): 端口号。默认为None，不限
+            username (str, optional): 用户名或其通配符模式。默认为None，不限
+            folder (str, optional): 文件夹或其通配符模式。默认为None，不限
+
+        Returns:
+            List[str]: 按路径排序的会话路径
+        """
+        if hostname is not None and not any(char in hostname for char in "*?["):
+            # 不含通配符的主机名直接查字典
+            candidates = self._by_hostname.get(hostname.lower(), [])
+            hostname = None
+        else:
+            candidates = self._paths
+        tests = []
+        for attribute, pattern in (("Path", path), ("Hostname", hostname), ("Protocol", protocol),
+                                   ("Username", username), ("Folder", folder)):
+            if pattern is not None and pattern != "*":
+                tests.append((attribute, re.compile(fnmatch.translate(pattern), re.IGNORECASE).match))
+        result = []
+        for candidate in candidates:
+            record = self._records[candidate]
+            if port is not None and record.Port != port:
+                continue
+            if all(match(getattr(record, attribute) or "") for attribute, match in tests):
+                result.append(candidate)
+        return result
@@ -0,0 +1,352 @@
+import multiprocessing
+import os
+import re
+import sys
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+_OPTION = re.compile(rb'^([SDBZ]):"([^"]*)"=([^\r\n]*)(\r?\n)?$')
+
+class _IniOption:
+    __slots__ = ("kind", "name", "raw", "value", "parsed")
+
+    def __init__(self, kind: str, name: str, raw: bytes):
+        self.kind = kind
+        self.name = name
+        self.raw = raw
+        self.value = None
+        self.parsed = False
+
+
+class SessionIni:
+    """
+    SessionIni 直接读写 SecureCRT 会话的 .ini 文件，不经过 COM。
+
+    会话文件的每个选项是一行带类型前缀的文本：
+    S:"Name"=字符串，D:"Name"=8位十六进制整数，
+    B:"Name"=8位十六进制字节数，后跟以空格开头的十六进制字节行，
+    Z:"Name"=8位十六进制元素个数，后跟以空格开头的字符串行。
+
+    解析时保留每个选项的原始字节，只有被 SetOption 修改过的选项才重新生成，
+    其余内容（注释、未知行、行尾符、BOM）原样写回，因此未修改的文件可以逐字节还原。
+    GetOption/SetOption/Save 与 SessionConfiguration 的接口相同，
+    值的类型为：S → str，D → int，B → bytes，Z → List[str]。
+
+    示例：
+    ini = SessionIni.Load(r"C:\\Users\\me\\AppData\\Roaming\\VanDyke\\Config\\Sessions\\Routers\\R1.ini")
+    if ini.GetOption("Port") != 22:
+        ini.SetOption("Port", 22)
+        ini.Save()
+    """
+    __slots__ = ("path", "_entries", "_options", "_eol", "_modified")
+
+    def __init__(self, data: bytes = b"", path: Optional[str] = None):
+        """
+        初始化 SessionIni 对象
+
+        Args:
+            data (bytes, optional): .ini 文件的内容。默认为空
+            path (str, optional): .ini 文件路径，Save 默认写回此路径。默认为None
+        """
+        self.path = path
+        self._entries = []
+        self._options = {}
+        self._eol = b"\r\n"
+        self._modified = False
+        self._parse(data)
+
+    @classmethod
+    def Load(cls, path: str) -> "SessionIni":
+        """
+        读取并解析 .ini 文件。
+
+        Args:
+            path (str): .ini 文件路径
+
+        Returns:
+            SessionIni: 解析后的 SessionIni 对象
+        """
+        with open(path, "rb") as f:
+            return cls(f.read(), path)
+
+    def _parse(self, data: bytes) -> None:
+        lines = data.splitlines(keepends=True)
+        for line in lines:
+            if line.endswith(b"\n"):
+                self._eol = b"\r\n" if line.endswith(b"\r\n") else b"\n"
+                break
+        index = 0
+        count = len(lines)
+        while index < count:
+            line = lines[index]
+            # 文件开头的 UTF-8 BOM 作为独立的原样内容保留
+            if index == 0 and line.startswith(b"\xef\xbb\xbf"):
+                self._entries.append(line[:3])
+                line = line[3:]
+            match = _OPTION.match(line)
+            index += 1
+            if match is None:
+                self._entries.append(line)
+                continue
+            kind = match.group(1).decode("ascii")
+            end = index
+            if kind in "BZ":
+                try:
+                    size = int(match.group(3), 16)
+                except ValueError:
+                    size = 0
+                if kind == "Z":
+                    end = min(count, index + size)
+                else:
+                    remaining = size
+                    while remaining > 0 and end < count and lines[end].startswith(b" "):
+                        remaining -= len(lines[end].split())
+                        end += 1
+            option = _IniOption(kind, match.group(2).decode("utf-8"), line + b"".join(lines[index:end]))
+            index = end
+            self._entries.append(option)
+            self._options.setdefault(option.name, option)
+
+    @property
+    def Modified(self) -> bool:
+        """
+        返回自加载或上一次保存以来是否修改过选项。
+
+        Returns:
+            bool: 是否修改过
+        """
+        return self._modified
+
+    @property
+    def Options(self) -> List[str]:
+        """
+        返回文件中所有选项的名称，顺序与文件中相同。
+
+        Returns:
+            List[str]: 选项名称列表
+        """
+        return list(self._options)
+
+    def GetOptionType(self, OptionName: str) -> str:
+        """
+        返回选项的类型前缀。
+
+        Args:
+            OptionName (str): 选项名称
+
+        Returns:
+            str: "S"、"D"、"B" 或 "Z"
+
+        Raises:
+            KeyError: 如果选项不存在
+        """
+        return self._options[OptionName].kind
+
+    def GetOption(self, OptionName: str) -> Union[str, int, bytes, List[str]]:
+        """
+        返回选项的值。
+
+        Args:
+            OptionName (str): 选项名称
+
+        Returns:
+            Union[str, int, bytes, List[str]]: 按选项类型转换后的值
+
+        Raises:
+            KeyError: 如果选项不存在
+        """
+        option = self._options[OptionName]
+        if not option.parsed:
+            option.value = _decode(option.kind, option.raw)
+            option.parsed = True
+        return option.value
+
+    def SetOption(self, OptionName: str, Value: Union[str, int, bytes, List[str]]) -> None:
+        """
+        设置选项的值。
+
+        已有选项保持原来的类型；新选项按值的类型推断：
+        str → S，int → D，bytes → B，list/tuple → Z，并追加到文件末尾。
+
+        Args:
+            OptionName (str): 选项名称
+            Value (Union[str, int, bytes, List[str]]): 选项的值
+
+        Raises:
+            ValueError: 如果值无法按选项类型保存
+        """
+        option = self._options.get(OptionName)
+        if option is None:
+            option = _IniOption(_infer_kind(Value), OptionName, b"")
+            value = _normalize(option.kind, Value)
+            last = self._entries[-1] if self._entries else b"\n"
+            if not (last if isinstance(last, bytes) else last.raw).endswith(b"\n"):
+                self._entries.append(self._eol)
+            self._entries.append(option)
+            self._options[OptionName] = option
+        else:
+            value = _normalize(option.kind, Value)
+            # 值未变化时保留原始字节，避免改变十六进制大小写等格式
+            if self.GetOption(OptionName) == value:
+                return
+        option.raw = _encode(option.kind, OptionName, value, self._eol)
+        option.value = value
+        option.parsed = True
+        self._modified = True
+
+    def ToBytes(self) -> bytes:
+        """
+        返回文件的全部内容。
+
+        Returns:
+            bytes: .ini 文件内容
+        """
+        return b"".join(entry if isinstance(entry, bytes) else entry.raw for entry in self._entries)
+
+    def Save(self, SessionPath: str = "") -> None:
+        """
+        把内容写入文件。先写入临时文件再替换，写入过程中断不会损坏原文件。
+
+        Args:
+            SessionPath (str, optional): 目标文件路径。默认为空字符串，写回加载时的路径
+
+        Raises:
+            ValueError: 如果没有指定路径且对象不是从文件加载的
+        """
+        path = SessionPath or self.path
+        if not path:
+            raise ValueError("no path to save the session file to")
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as f:
+            f.write(self.ToBytes())
+        os.replace(temporary, path)
+        self._modified = False
+
+
+def _infer_kind(value) -> str:
+    if isinstance(value, int):
+        return "D"
+    if isinstance(value, (bytes, bytearray)):
+        return "B"
+    if isinstance(value, (list, tuple)):
+        return "Z"
+    return "S"
+
+
+def _normalize(kind: str, value):
+    if kind == "D":
+        value = int(value)
+        if not 0 <= value <= 0xFFFFFFFF:
+            raise ValueError(f"DWORD value out of range: {value}")
+        return value
+    if kind == "B":
+        return bytes(value)
+    if kind == "Z":
+        value = [str(item) for item in value]
+        if any("\n" in item or "\r" in item for item in value):
+            raise ValueError("string array items cannot contain line breaks")
+        return value
+    value = str(value)
+    if "\n" in value or "\r" in value:
+        raise ValueError("string values cannot contain line breaks")
+    return value
+
+
+def _decode(kind: str, raw: bytes):
+    lines = raw.splitlines()
+    text = _OPTION.match(lines[0]).group(3)
+    if kind == "S":
+        return text.decode("utf-8")
+    if kind == "D":
+        return int(text, 16)
+    if kind == "B":
+        return bytes.fromhex(b"".join(lines[1:]).decode("ascii"))
+    return [line[1:].decode("utf-8") for line in lines[1:]]
+
+
+def _encode(kind: str, name: str, value, eol: bytes) -> bytes:
+    prefix = f'{kind}:"{name}"='.encode("utf-8")
+    if kind == "S":
+        return prefix + value.encode("utf-8") + eol
+    if kind == "D":
+        return prefix + b"%08x" % value + eol
+    if kind == "B":
+        rows = [b" " + value[start:start + 16].hex(" ").encode("ascii") + eol
+                for start in range(0, len(value), 16)]
+        return prefix + b"%08x" % len(value) + eol + b"".join(rows)
+    return prefix + b"%08x" % len(value) + eol + b"".join(b" " + item.encode("utf-8") + eol for item in value)
+
+
+def _edit_file(job: Tuple[str, Callable[[SessionIni], object]]) -> Tuple[str, bool, str]:
+    path, edit = job
+    try:
+        ini = SessionIni.Load(path)
+        edit(ini)
+        if ini.Modified:
+            ini.Save()
+            return path, True, ""
+        return path, False, ""
+    except Exception as e:
+        return path, False, f"{type(e).__name__}: {e}"
+
+
+def BulkEdit(paths: Iterable[str], edit: Callable[[SessionIni], object], processes: Optional[int] = None,
+             chunksize: int = 16) -> List[Tuple[str, bool, str]]:
+    """
+    用进程池批量修改会话 .ini 文件，只写回被修改过的文件。
+
+    edit 会在子进程中执行，必须是模块顶层定义的函数（可以被 pickle）。
+    在 SecureCRT 内嵌的解释器中运行时，sys.executable 是 SecureCRT 本身，
+    子进程改用 sys.exec_prefix 下的 python.exe 启动；找不到可用的解释器时在当前进程中执行。
+
+    Args:
+        paths (Iterable[str]): .ini 文件路径
+        edit (Callable[[SessionIni], object]): 修改函数，参数为 SessionIni 对象
+        processes (int, optional): 进程数。默认为None，使用 CPU 核数；为0时在当前进程中执行
+        chunksize (int, optional): 每个进程每次领取的文件数。默认为16
+
+    Returns:
+        List[Tuple[str, bool, str]]: (路径, 是否写回, 错误信息) 列表，顺序与 paths 相同
+    """
+    jobs = [(path, edit) for path in paths]
+    executable = _pool_executable() if processes != 0 else None
+    if executable is None:
+        return [_edit_file(job) for job in jobs]
+    multiprocessing.set_executable(executable)
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(_edit_file, jobs, chunksize)
+
+
+def _pool_executable() -> Optional[str]:
+    # 返回用于启动子进程的 Python 解释器，找不到时返回 None
+    if os.path.basename(sys.executable or "").lower().startswith("python"):
+        return sys.executable
+    for candidate in (os.path.join(sys.exec_prefix, "python.exe"),
+                      os.path.join(sys.exec_prefix, "bin", "python3")):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def FindSessionFiles(sessions_dir: str) -> Dict[str, str]:
+    """
+    列出 Sessions 目录中的所有会话文件。
+
+    各目录的 __FolderData__.ini 和顶层的 Default.ini 不是普通会话，不包含在结果中。
+
+    Args:
+        sessions_dir (str): SecureCRT 配置目录下的 Sessions 目录
+
+    Returns:
+        Dict[str, str]: 会话路径（如 "Routers/R1"，可用于 Session.Connect("/s Routers/R1")）到文件路径的映射
+    """
+    sessions = {}
+    for root, _, files in os.walk(sessions_dir):
+        for name in files:
+            if not name.lower().endswith(".ini") or name == "__FolderData__.ini":
+                continue
+            if name == "Default.ini" and root == sessions_dir:
+                continue
+            full = os.path.join(root, name)
+            relative = os.path.relpath(full, sessions_dir)[:-4]
+            sessions[relative.replace(os.sep, "/")] = full
+    return sessions
@@ -0,0 +1,116 @@
+import time
+from typing import List, Optional
+
+class SessionSnapshot:
+    """
+    SessionSnapshot 对象保存某一时刻会话的全部常用属性。
+
+    报表脚本逐个读取 Session 属性时，每个属性都是一次 COM 调用。
+    快照一次读取全部属性，之后的访问都在本地完成。
+    未连接的会话无法读取地址和端口，这些属性为None。
+
+    示例：
+    snap = crt.Session.Snapshot()
+    if snap.Connected:
+        print(snap.RemoteAddress, snap.RemotePort)
+
+    Attributes:
+        Connected (bool): 会话是否已连接
+        Label (str): 会话标签
+        Locked (bool): 会话是否已锁定
+        Logging (bool): 是否正在记录日志
+        Path (str): 会话路径
+        LocalAddress (str): 本地 IP 地址，未连接时为None
+        RemoteAddress (str): 远程 IP 地址，未连接或无法获取时为None
+        RemotePort (int): 远程端口号，未连接时为None
+        Time (float): 读取快照的时间（time.monotonic()）
+    """
+    __slots__ = ("Connected", "Label", "Locked", "Logging", "Path", "LocalAddress", "RemoteAddress",
+                 "RemotePort", "Time")
+
+    def __init__(self, obj):
+        """
+        初始化 SessionSnapshot 对象
+
+        Args:
+            obj: SecureCRT Session 对象
+        """
+        self.Connected = bool(obj.Connected)
+        self.Label = obj.Label
+        self.Locked = bool(obj.Locked)
+        self.Logging = bool(obj.Logging)
+        self.Path = obj.Path
+        self.LocalAddress = None
+        self.RemoteAddress = None
+        self.RemotePort = None
+        if self.Connected:
+            # 通过 SOCKS5 代理连接时无法获取 IP 地址，读取失败的属性保持为None
+            for name in ("LocalAddress", "RemoteAddress", "RemotePort"):
+                try:
+                    setattr(self, name, getattr(obj, name))
+                except Exception:
+                    pass
+        self.Time = time.monotonic()
+
+    def __repr__(self):
+        return (f"SessionSnapshot(Path={self.Path!r}, Connected={self.Connected}, "
+                f"RemoteAddress={self.RemoteAddress!r}, RemotePort={self.RemotePort})")
+
+
+class SessionSnapshotCache:
+    """
+    SessionSnapshotCache 缓存所有选项卡的会话快照，在 ttl 秒内重复读取不会产生 COM 调用。
+
+    缓存按整个选项卡集合刷新：过期后的第一次访问读取全部选项卡的快照。
+    在 ttl 内打开或关闭的选项卡不会反映到缓存中，可以调用 Invalidate 强制刷新。
+
+    示例：
+    for index, snap in enumerate(crt.SessionSnapshots.All(), 1):
+        print(index, snap.Label, snap.Connected)
+    """
+    __slots__ = ("crt", "ttl", "_snapshots", "_time")
+
+    def __init__(self, crt, ttl: float = 5):
+        """
+        初始化 SessionSnapshotCache 对象
+
+        Args:
+            crt: CRT 对象
+            ttl (float, optional): 缓存有效秒数。默认为5
+        """
+        self.crt = crt
+        self.ttl = ttl
+        self._snapshots = None
+        self._time = 0.0
+
+    def Invalidate(self) -> None:
+        """
+        使缓存失效，下一次访问时重新读取。
+        """
+        self._snapshots = None
+
+    def All(self) -> List[SessionSnapshot]:
+        """
+        返回所有选项卡的会话快照，顺序与选项卡索引相同。
+
+        Returns:
+            List[SessionSnapshot]: 会话快照列表，第 i 个元素对应 GetTab(i + 1)
+        """
+        if self._snapshots is None or time.monotonic() - self._time >= self.ttl:
+            self._snapshots = [self.crt.GetTab(index).Session.Snapshot()
+                               for index in range(1, self.crt.GetTabCount() + 1)]
+            self._time = time.monotonic()
+        return self._snapshots
+
+    def Get(self, index: int) -> Optional[SessionSnapshot]:
+        """
+        返回指定选项卡的会话快照。
+
+        Args:
+            index (int): 选项卡索引，从1开始
+
+        Returns:
+            SessionSnapshot: 会话快照，索引超出范围时返回None
+        """
+        snapshots = self.All()
+        return snapshots[index - 1] if 1 <= index <= len(snapshots) else None
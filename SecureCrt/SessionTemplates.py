@@ -0,0 +1,315 @@
+import csv
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .OptionSchema import SESSION_SCHEMA
+from .SessionIni import SessionIni
+
+_VERSION = 1
+
+class TemplateSet:
+    """
+    TemplateSet 保存会话模板及其继承关系，并缓存解析后的选项集合。
+
+    每个模板是一组带类型的选项（类型前缀与会话 .ini 文件相同），可以继承一个父模板，
+    子模板的选项覆盖父模板的同名选项。Resolve 沿继承链合并一次后缓存结果，
+    之后为成千上万个主机生成会话时不再重复合并。
+
+    示例：
+    templates = TemplateSet()
+    templates.DefineFromIni("base", SessionIni.Load("templates/base.ini"))
+    templates.DefineFromIni("cisco-ios", SessionIni.Load("templates/cisco-ios.ini"), parent="base")
+    options = templates.Resolve("cisco-ios")
+    """
+    __slots__ = ("_templates", "_resolved", "_fingerprints")
+
+    def __init__(self):
+        self._templates = {}
+        self._resolved = {}
+        self._fingerprints = {}
+
+    def Define(self, name: str, options: Dict[str, Tuple[str, Any]], parent: Optional[str] = None) -> None:
+        """
+        定义或替换一个模板。
+
+        Args:
+            name (str): 模板名称
+            options (Dict[str, Tuple[str, Any]]): 选项名称到 (类型前缀, 值) 的映射，类型前缀为 "S"、"D"、"B" 或 "Z"
+            parent (str, optional): 父模板名称。默认为None
+        """
+        self._templates[name] = (parent, dict(options))
+        # 任何模板变化都可能影响其子模板，清空全部缓存
+        self._resolved.clear()
+        self._fingerprints.clear()
+
+    def DefineFromIni(self, name: str, ini: SessionIni, parent: Optional[str] = None) -> None:
+        """
+        用会话 .ini 文件中的全部选项定义模板。
+
+        Args:
+            name (str): 模板名称
+            ini (SessionIni): 模板会话文件
+            parent (str, optional): 父模板名称。默认为None
+        """
+        self.Define(name, {option: (ini.GetOptionType(option), ini.GetOption(option)) for option in ini.Options},
+                    parent)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._templates
+
+    def Resolve(self, name: str) -> Dict[str, Tuple[str, Any]]:
+        """
+        返回模板沿继承链合并后的选项。结果被缓存，调用方不应修改。
+
+        Args:
+            name (str): 模板名称
+
+        Returns:
+            Dict[str, Tuple[str, Any]]: 选项名称到 (类型前缀, 值) 的映射
+
+        Raises:
+            KeyError: 如果模板或其祖先未定义
+            ValueError: 如果继承关系存在循环
+        """
+        resolved = self._resolved.get(name)
+        if resolved is not None:
+            return resolved
+        chain = []
+        current = name
+        while current is not None:
+            if current in chain:
+                raise ValueError(f"template inheritance cycle: {' -> '.join(chain + [current])}")
+            chain.append(current)
+            current = self._templates[current][0]
+        resolved = {}
+        for template in reversed(chain):
+            resolved.update(self._templates[template][1])
+        self._resolved[name] = resolved
+        return resolved
+
+    def Fingerprint(self, name: str) -> str:
+        """
+        返回模板合并后选项的哈希值，任何祖先模板变化都会改变该值。
+
+        Args:
+            name (str): 模板名称
+
+        Returns:
+            str: 十六进制哈希值
+        """
+        fingerprint = self._fingerprints.get(name)
+        if fingerprint is None:
+            fingerprint = _hash(self.Resolve(name))
+            self._fingerprints[name] = fingerprint
+        return fingerprint
+
+
+def _hash(value: Any) -> str:
+    def default(item):
+        if isinstance(item, bytes):
+            return item.hex()
+        raise TypeError(type(item).__name__)
+    text = json.dumps(value, sort_keys=True, ensure_ascii=False, default=default)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _convert(kind: str, text: str):
+    if kind == "D":
+        # 只有明确的 0x 前缀按十六进制解析，"022" 这样带前导零的值按十进制解析
+        text = text.strip()
+        if text[:2].lower() == "0x":
+            return int(text[2:], 16)
+        return int(text, 10)
+    if kind == "B":
+        return bytes.fromhex(text)
+    if kind == "Z":
+        return text.split("|") if text else []
+    return text
+
+
+def ReadInventory(path: str, encoding: str = "utf-8-sig") -> List[Dict[str, str]]:
+    """
+    读取主机清单 CSV 文件。
+
+    必须包含 Path（会话路径，如 "Routers/R1"）和 Template（模板名称）两列，
+    其余列名是选项名称，如 Hostname、Username、[SSH2] Port，空单元格表示使用模板中的值。
+    选项类型依次取自模板、SESSION_SCHEMA 和已有的会话文件；DWORD 值按十进制解析，
+    以 0x 开头时按十六进制解析；字符串数组的元素用 "|" 分隔；二进制值写成十六进制。
+
+    Args:
+        path (str): CSV 文件路径
+        encoding (str, optional): 文件编码。默认为 "utf-8-sig"
+
+    Returns:
+        List[Dict[str, str]]: 每行一个字典
+
+    Raises:
+        ValueError: 如果缺少 Path 或 Template 列
+    """
+    with open(path, "r", encoding=encoding, newline="") as f:
+        reader = csv.DictReader(f)
+        missing = {"Path", "Template"} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"inventory is missing columns: {', '.join(sorted(missing))}")
+        return list(reader)
+
+
+class SyncReport:
+    """
+    SyncReport 对象汇总一次 SessionGenerator.Sync 的结果。
+
+    Attributes:
+        Created (List[str]): 新建的会话路径
+        Updated (List[str]): 内容发生变化并被写回的会话路径
+        Unchanged (int): 内容未变化、没有写入的会话数量
+        Failed (List[Tuple[str, str]]): (会话路径, 错误信息) 列表
+        Elapsed (float): 耗时（秒）
+    """
+    __slots__ = ("Created", "Updated", "Unchanged", "Failed", "Elapsed")
+
+    def __init__(self):
+        self.Created = []
+        self.Updated = []
+        self.Unchanged = 0
+        self.Failed = []
+        self.Elapsed = 0.0
+
+    def __repr__(self):
+        return (f"SyncReport(Created={len(self.Created)}, Updated={len(self.Updated)}, "
+                f"Unchanged={self.Unchanged}, Failed={len(self.Failed)}, Elapsed={self.Elapsed:.2f})")
+
+
+class SessionGenerator:
+    """
+    SessionGenerator 根据模板和主机清单批量生成或更新会话 .ini 文件。
+
+    每个会话的输入是模板合并后的选项加上清单中该行的覆盖值。
+    生成器把输入的哈希值连同写入后文件的修改时间和大小记录在清单文件中：
+    输入和文件都没有变化的会话直接跳过，不读取也不解析文件。
+    其余会话在已有文件上用 SessionIni 修改选项（保留文件中其他选项和格式），
+    只有生成的内容与原文件不同时才写回。
+
+    示例：
+    generator = SessionGenerator(templates, sessions_dir)
+    report = generator.Sync(ReadInventory("hosts.csv"))
+    """
+    __slots__ = ("templates", "sessions_dir", "manifest_path", "_manifest")
+
+    def __init__(self, templates: TemplateSet, sessions_dir: str, manifest_path: Optional[str] = None):
+        """
+        初始化 SessionGenerator 对象
+
+        Args:
+            templates (TemplateSet): 模板集合
+            sessions_dir (str): SecureCRT 配置目录下的 Sessions 目录
+            manifest_path (str, optional): 清单文件路径。默认为None，保存在 Sessions 目录旁的 SessionTemplates.json
+        """
+        self.templates = templates
+        self.sessions_dir = os.path.abspath(sessions_dir)
+        self.manifest_path = manifest_path or os.path.join(os.path.dirname(self.sessions_dir),
+                                                           "SessionTemplates.json")
+        self._manifest = {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == _VERSION and data.get("sessions_dir") == self.sessions_dir:
+                self._manifest = data["sessions"]
+        except (OSError, ValueError):
+            pass
+
+    def _save_manifest(self) -> None:
+        temporary = self.manifest_path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump({"version": _VERSION, "sessions_dir": self.sessions_dir, "sessions": self._manifest}, f,
+                      ensure_ascii=False)
+        os.replace(temporary, self.manifest_path)
+
+    def _kind(self, name: str, resolved: Dict[str, Tuple[str, Any]], ini: SessionIni) -> str:
+        if name in resolved:
+            return resolved[name][0]
+        if name in SESSION_SCHEMA:
+            return SESSION_SCHEMA[name].Kind
+        try:
+            return ini.GetOptionType(name)
+        except KeyError:
+            raise ValueError(f"unknown type for option {name!r}: not in the template, the schema "
+                             f"or the existing session file") from None
+
+    def _target(self, path: str) -> str:
+        parts = path.replace("\\", "/").split("/")
+        if not path or os.path.isabs(path) or os.path.splitdrive(path)[0] or \
+                any(part.strip() in ("", ".", "..") for part in parts):
+            raise ValueError(f"invalid session path: {path!r}")
+        filename = os.path.join(self.sessions_dir, *parts) + ".ini"
+        if os.path.commonpath([self.sessions_dir, os.path.abspath(filename)]) != self.sessions_dir:
+            raise ValueError(f"session path escapes the Sessions directory: {path!r}")
+        return filename
+
+    def _write(self, filename: str, template: str, overrides: Dict[str, str]) -> Optional[bool]:
+        try:
+            with open(filename, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = None
+        ini = SessionIni(data or b"", filename)
+        resolved = self.templates.Resolve(template)
+        options = {name: value for name, (_, value) in resolved.items()}
+        # 清单中的值都是字符串，按模板、schema、已有文件的顺序确定选项类型，无法确定时报错
+        for name, text in overrides.items():
+            options[name] = _convert(self._kind(name, resolved, ini), text)
+        for name, value in options.items():
+            ini.SetOption(name, value)
+        if data is not None and not ini.Modified:
+            return None
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        ini.Save()
+        return data is None
+
+    def Sync(self, rows: Iterable[Dict[str, str]]) -> SyncReport:
+        """
+        按清单生成或更新会话文件。
+
+        Args:
+            rows (Iterable[Dict[str, str]]): 清单中的行，如 ReadInventory 的返回值
+
+        Returns:
+            SyncReport: 同步结果
+        """
+        report = SyncReport()
+        start = time.monotonic()
+        changed = False
+        for row in rows:
+            path = (row.get("Path") or "").strip()
+            try:
+                filename = self._target(path)
+                template = row["Template"]
+                overrides = {name: value for name, value in row.items()
+                             if name not in ("Path", "Template") and value not in (None, "")}
+                key = _hash([self.templates.Fingerprint(template), overrides])
+                try:
+                    stat = os.stat(filename)
+                    stamp = [stat.st_mtime_ns, stat.st_size]
+                except FileNotFoundError:
+                    stamp = None
+                if stamp is not None and self._manifest.get(path) == [key] + stamp:
+                    report.Unchanged += 1
+                    continue
+                created = self._write(filename, template, overrides)
+                if created is None:
+                    report.Unchanged += 1
+                elif created:
+                    report.Created.append(path)
+                else:
+                    report.Updated.append(path)
+                stat = os.stat(filename)
+                self._manifest[path] = [key, stat.st_mtime_ns, stat.st_size]
+                changed = True
+            except (KeyError, ValueError, OSError) as e:
+                report.Failed.append((path, f"{type(e).__name__}: {e}"))
+        if changed:
+            self._save_manifest()
+        report.Elapsed = time.monotonic() - start
+        return report
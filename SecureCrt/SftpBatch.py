@@ -0,0 +1,268 @@
+import re
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+_TRANSFERRED = re.compile(r"(\d+) bytes transferred in (\d+(?:\.\d+)?) seconds?")
+_PROGRESS = re.compile(r"(\d{1,3})%")
+_ERROR = re.compile(r"(?i)(error|failed|cannot|can't|no such file|permission denied|not found)")
+
+class TransferResult:
+    """
+    TransferResult 对象记录 SftpBatch 中单个文件的传输结果。
+
+    Attributes:
+        Direction (str): "put" 表示上传，"get" 表示下载
+        Local (str): 本地路径
+        Remote (str): 远程路径
+        Ok (bool): 是否传输成功
+        Bytes (int): 传输的字节数
+        Seconds (float): 传输耗时（秒），优先使用 SFTP 输出中报告的时间
+        Error (str): 失败时的错误信息
+        Output (str): 该命令在 SFTP 选项卡中的全部输出
+    """
+    __slots__ = ("Direction", "Local", "Remote", "Ok", "Bytes", "Seconds", "Error", "Output")
+
+    def __init__(self, direction: str, local: str, remote: str):
+        self.Direction = direction
+        self.Local = local
+        self.Remote = remote
+        self.Ok = False
+        self.Bytes = 0
+        self.Seconds = 0.0
+        self.Error = ""
+        self.Output = ""
+
+    @property
+    def Throughput(self) -> float:
+        """
+        返回传输速率（字节/秒）。
+
+        Returns:
+            float: 字节/秒
+        """
+        return self.Bytes / self.Seconds if self.Seconds else 0.0
+
+    def __repr__(self):
+        return (f"TransferResult({self.Direction} {self.Local!r} {self.Remote!r}, Ok={self.Ok}, "
+                f"Bytes={self.Bytes}, Seconds={self.Seconds:.2f})")
+
+
+class TransferReport:
+    """
+    TransferReport 对象汇总一次 SftpBatch 批量传输的结果。
+
+    Attributes:
+        Results (List[TransferResult]): 每个文件的传输结果，顺序与提交顺序相同
+        Elapsed (float): 整个批次的耗时（秒）
+    """
+    __slots__ = ("Results", "Elapsed")
+
+    def __init__(self, results: List[TransferResult], elapsed: float):
+        self.Results = results
+        self.Elapsed = elapsed
+
+    @property
+    def Bytes(self) -> int:
+        """
+        返回成功传输的总字节数。
+
+        Returns:
+            int: 总字节数
+        """
+        return sum(result.Bytes for result in self.Results if result.Ok)
+
+    @property
+    def Throughput(self) -> float:
+        """
+        返回整个批次的总体传输速率（字节/秒）。
+
+        Returns:
+            float: 字节/秒
+        """
+        return self.Bytes / self.Elapsed if self.Elapsed else 0.0
+
+    @property
+    def Failed(self) -> List[TransferResult]:
+        """
+        返回传输失败的文件。
+
+        Returns:
+            List[TransferResult]: 失败的传输结果
+        """
+        return [result for result in self.Results if not result.Ok]
+
+
+def _quote(path: str) -> str:
+    return '"' + path.replace('"', '\\"') + '"'
+
+
+class SftpBatch:
+    """
+    SftpBatch 通过 SFTP 选项卡以流水线方式批量传输文件。
+
+    Tab.ConnectSftp 打开的 SFTP 选项卡继承父会话的认证。
+    逐个发送 put/get 并等待提示符时，每个文件都要付出一次往返延迟。
+    SftpBatch 始终保持最多 depth 条命令在途：每出现一个提示符就表示最早的命令已完成，
+    解析其输出中的进度和完成信息后立即发送下一条命令。
+
+    Open 打开 Screen.Synchronous 以免遗漏输出，Close（或 with 语句结束时）恢复原来的值并关闭选项卡。
+
+    示例：
+    with SftpBatch.Open(crt.GetScriptTab()) as batch:
+        report = batch.Put([("C:\\\\logs\\\\a.log", "/tmp/a.log"), ("C:\\\\logs\\\\b.log", "/tmp/b.log")])
+    crt.Dialog.MessageBox(f"{report.Throughput / 1024:.0f} KB/s")
+    """
+    __slots__ = ("tab", "screen", "prompt", "depth", "timeout", "_synchronous")
+
+    def __init__(self, tab, prompt: str = "sftp> ", depth: int = 8, timeout: int = 300):
+        """
+        初始化 SftpBatch 对象
+
+        Args:
+            tab (Tab): SFTP 选项卡
+            prompt (str, optional): SFTP 提示符。默认为 "sftp> "
+            depth (int, optional): 同时在途的命令数。默认为8
+            timeout (int, optional): 等待单条命令完成的超时秒数。默认为300
+        """
+        self.tab = tab
+        self.screen = tab.Screen
+        self.prompt = prompt
+        self.depth = max(1, depth)
+        self.timeout = timeout
+        # Open 修改 Synchronous 之前的值，Close 时恢复
+        self._synchronous = None
+
+    @classmethod
+    def Open(cls, tab, prompt: str = "sftp> ", depth: int = 8, timeout: int = 300) -> "SftpBatch":
+        """
+        基于已认证的选项卡打开 SFTP 选项卡，并等待 SFTP 提示符。
+
+        Args:
+            tab (Tab): 已连接的 SSH2 选项卡
+            prompt (str, optional): SFTP 提示符。默认为 "sftp> "
+            depth (int, optional): 同时在途的命令数。默认为8
+            timeout (int, optional): 等待单条命令完成的超时秒数。默认为300
+
+        Returns:
+            SftpBatch: 绑定到新 SFTP 选项卡的 SftpBatch 对象
+
+        Raises:
+            RuntimeError: 如果等待 SFTP 提示符超时
+        """
+        batch = cls(tab.ConnectSftp(), prompt, depth, timeout)
+        batch._synchronous = batch.screen.Synchronous
+        batch.screen.Synchronous = True
+        if batch.screen.Expect(prompt, 30) is None:
+            batch.Close()
+            raise RuntimeError("timed out waiting for the SFTP prompt")
+        return batch
+
+    def Close(self) -> None:
+        """
+        恢复 Screen.Synchronous 原来的值，并关闭 SFTP 选项卡。
+        """
+        try:
+            if self._synchronous is not None:
+                self.screen.Synchronous = self._synchronous
+                self._synchronous = None
+        finally:
+            self.tab.Close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.Close()
+
+    def Put(self, files: Sequence[Tuple[str, str]],
+            progress: Optional[Callable[[TransferResult, int], None]] = None) -> TransferReport:
+        """
+        批量上传文件。
+
+        Args:
+            files (Sequence[Tuple[str, str]]): (本地路径, 远程路径) 列表
+            progress (Callable, optional): 进度回调，参数为传输结果对象和百分比。默认为None
+
+        Returns:
+            TransferReport: 批量传输结果
+        """
+        return self.Transfer([("put", local, remote) for local, remote in files], progress)
+
+    def Get(self, files: Sequence[Tuple[str, str]],
+            progress: Optional[Callable[[TransferResult, int], None]] = None) -> TransferReport:
+        """
+        批量下载文件。
+
+        Args:
+            files (Sequence[Tuple[str, str]]): (远程路径, 本地路径) 列表
+            progress (Callable, optional): 进度回调，参数为传输结果对象和百分比。默认为None
+
+        Returns:
+            TransferReport: 批量传输结果
+        """
+        return self.Transfer([("get", local, remote) for remote, local in files], progress)
+
+    def Transfer(self, transfers: Sequence[Tuple[str, str, str]],
+                 progress: Optional[Callable[[TransferResult, int], None]] = None) -> TransferReport:
+        """
+        以流水线方式执行上传和下载。
+
+        Args:
+            transfers (Sequence[Tuple[str, str, str]]): (方向, 本地路径, 远程路径) 列表，方向为 "put" 或 "get"
+            progress (Callable, optional): 进度回调，参数为传输结果对象和百分比。默认为None
+
+        Returns:
+            TransferReport: 批量传输结果
+        """
+        results = [TransferResult(direction, local, remote) for direction, local, remote in transfers]
+        patterns = [self.prompt, _PROGRESS]
+        start = time.monotonic()
+        sent = 0
+        for index, result in enumerate(results):
+            while sent < len(results) and sent < index + self.depth:
+                self._send(results[sent])
+                sent += 1
+            started = time.monotonic()
+            output = []
+            while True:
+                match = self.screen.Expect(patterns, self.timeout)
+                if match is None:
+                    result.Error = "timed out"
+                    result.Output = "".join(output)
+                    # 提示符丢失后无法确定后续命令的输出边界，其余文件标记为失败
+                    for rest in results[index + 1:]:
+                        rest.Error = "not completed"
+                    return TransferReport(results, time.monotonic() - start)
+                output.append(match.Before + match.Text)
+                if match.Index == 2:
+                    if progress is not None:
+                        progress(result, int(match.Groups[0]))
+                    continue
+                break
+            self._parse(result, "".join(output)[:-len(self.prompt)], time.monotonic() - started)
+        return TransferReport(results, time.monotonic() - start)
+
+    def _send(self, result: TransferResult) -> None:
+        if result.Direction == "put":
+            command = f"put {_quote(result.Local)} {_quote(result.Remote)}"
+        else:
+            command = f"get {_quote(result.Remote)} {_quote(result.Local)}"
+        self.screen.Send(command + "\r")
+
+    @staticmethod
+    def _parse(result: TransferResult, output: str, elapsed: float) -> None:
+        result.Output = output
+        done = _TRANSFERRED.search(output)
+        if done:
+            result.Ok = True
+            result.Bytes = int(done.group(1))
+            result.Seconds = float(done.group(2)) or elapsed
+            return
+        result.Seconds = elapsed
+        failure = _ERROR.search(output)
+        if failure:
+            line_start = output.rfind("\n", 0, failure.start()) + 1
+            line_end = output.find("\n", failure.end())
+            result.Error = output[line_start:line_end if line_end >= 0 else None].strip()
+        else:
+            result.Error = "no transfer summary in output"
@@ -1,4 +1,5 @@
 from typing import Any
+from .Screen import Screen
 
 class Tab:
     """
@@ -7,6 +8,8 @@ class Tab:
     
     通过 Tab 对象可以访问选项卡的属性（如标题、索引）和方法（如激活、克隆、关闭等）。
     """
+    __slots__ = ("obj", "_screen", "_session")
+
     def __init__(self, obj):
         """
         初始化 Tab 对象
@@ -15,6 +18,9 @@ class Tab:
             obj: SecureCRT Tab 对象
         """
         self.obj = obj
+        # Screen 和 Session 包装对象在首次访问时创建并缓存，关闭选项卡时失效
+        self._screen = None
+        self._session = None
 
     @property
     def Caption(self) -> str:
@@ -64,8 +70,9 @@ class Tab:
         Returns:
             Screen: 与选项卡关联的 Screen 对象
         """
-        from .Screen import Screen
-        return Screen(self.obj.Screen)
+        if self._screen is None:
+            self._screen = Screen(self.obj.Screen)
+        return self._screen
     
     @property
     def Session(self):
@@ -78,8 +85,10 @@ class Tab:
         Returns:
             Session: 与选项卡关联的 Session 对象
         """
-        from .Session import Session
-        return Session(self.obj.Session)
+        if self._session is None:
+            from .Session import Session
+            self._session = Session(self.obj.Session)
+        return self._session
 
     def Activate(self):
         """
@@ -117,6 +126,8 @@ class Tab:
             None
         """
         self.obj.Close()
+        self._screen = None
+        self._session = None
 
     def ConnectSftp(self):
         """
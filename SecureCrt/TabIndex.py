@@ -0,0 +1,170 @@
+from typing import Dict, List, Optional
+
+class _TabEntry:
+    __slots__ = ("caption", "path", "remote_address")
+
+    def __init__(self, caption: str, path: str, remote_address: Optional[str]):
+        self.caption = caption
+        self.path = path
+        self.remote_address = remote_address
+
+
+class TabIndex:
+    """
+    TabIndex 按标题、会话路径和远程地址索引所有选项卡。
+
+    遍历 GetTab(1..GetTabCount()) 并读取 Caption、Session.Path、Session.RemoteAddress
+    每次查找每个选项卡需要三次 COM 调用。TabIndex 把这些键映射到选项卡索引，
+    查找时只需一次字典查询，再用一次 COM 调用确认命中的选项卡仍然匹配。
+
+    只有在 GetTabCount() 变化或命中的选项卡不再匹配时才重新读取：
+    新增的选项卡只读取新增部分，关闭选项卡导致索引移动时才完整重建。
+    索引中不存在的键不会触发重新读取；如果选项卡被改名或重新连接到其他主机，
+    可以调用 Rebuild 强制重建。
+
+    示例：
+    tabs = crt.TabIndex.FindByRemoteAddress("10.0.0.1")
+    if tabs:
+        tabs[0].Activate()
+    """
+    __slots__ = ("crt", "_entries", "_by_caption", "_by_path", "_by_remote_address")
+
+    def __init__(self, crt):
+        """
+        初始化 TabIndex 对象
+
+        Args:
+            crt: CRT 对象
+        """
+        self.crt = crt
+        self._entries = []
+        self._by_caption = {}
+        self._by_path = {}
+        self._by_remote_address = {}
+
+    def _read(self, index: int) -> _TabEntry:
+        tab = self.crt.GetTab(index)
+        session = tab.Session
+        try:
+            remote_address = session.RemoteAddress if session.Connected else None
+        except Exception:
+            remote_address = None
+        return _TabEntry(tab.Caption, session.Path, remote_address)
+
+    def _add(self, index: int, entry: _TabEntry) -> None:
+        self._by_caption.setdefault(entry.caption, []).append(index)
+        self._by_path.setdefault(entry.path, []).append(index)
+        if entry.remote_address:
+            self._by_remote_address.setdefault(entry.remote_address, []).append(index)
+
+    def _remove(self, index: int, entry: _TabEntry) -> None:
+        for mapping, key in ((self._by_caption, entry.caption), (self._by_path, entry.path),
+                             (self._by_remote_address, entry.remote_address)):
+            indices = mapping.get(key)
+            if indices and index in indices:
+                indices.remove(index)
+                if not indices:
+                    del mapping[key]
+
+    def Rebuild(self) -> None:
+        """
+        重新读取所有选项卡并重建索引。
+        """
+        self._entries = []
+        self._by_caption = {}
+        self._by_path = {}
+        self._by_remote_address = {}
+        for index in range(1, self.crt.GetTabCount() + 1):
+            entry = self._read(index)
+            self._entries.append(entry)
+            self._add(index, entry)
+
+    def Refresh(self) -> None:
+        """
+        根据 GetTabCount() 的变化增量更新索引。
+
+        选项卡数量增加且原有最后一个选项卡的标题未变时，只读取新增的选项卡；
+        数量减少或原有选项卡已移动时完整重建。
+        """
+        count = self.crt.GetTabCount()
+        known = len(self._entries)
+        if count == known:
+            return
+        if known and count > known and self.crt.GetTab(known).Caption == self._entries[known - 1].caption:
+            for index in range(known + 1, count + 1):
+                entry = self._read(index)
+                self._entries.append(entry)
+                self._add(index, entry)
+        else:
+            self.Rebuild()
+
+    def _update(self, index: int) -> None:
+        self._remove(index, self._entries[index - 1])
+        entry = self._read(index)
+        self._entries[index - 1] = entry
+        self._add(index, entry)
+
+    def _lookup(self, mapping: Dict[str, List[int]], key: str, current):
+        tabs = []
+        stale = []
+        for index in mapping.get(key, ()):
+            tab = self.crt.GetTab(index)
+            if current(tab) == key:
+                tabs.append(tab)
+            else:
+                stale.append(index)
+        return tabs, stale
+
+    def _find(self, mapping_name: str, key: str, current) -> List:
+        self.Refresh()
+        tabs, stale = self._lookup(getattr(self, mapping_name), key, current)
+        if not stale:
+            return tabs
+        # 命中的选项卡已变化（重命名、重新连接等），更新这些条目；
+        # 如果更新后键已不存在，它可能转移到了其他选项卡上，完整重建后再查
+        for index in stale:
+            self._update(index)
+        if not getattr(self, mapping_name).get(key):
+            self.Rebuild()
+        return self._lookup(getattr(self, mapping_name), key, current)[0]
+
+    def FindByCaption(self, caption: str) -> List:
+        """
+        查找标题为 caption 的所有选项卡。
+
+        Args:
+            caption (str): 选项卡标题
+
+        Returns:
+            List[Tab]: 匹配的选项卡列表
+        """
+        return self._find("_by_caption", caption, lambda tab: tab.Caption)
+
+    def FindByPath(self, path: str) -> List:
+        """
+        查找 Session.Path 为 path 的所有选项卡（包括克隆的选项卡）。
+
+        Args:
+            path (str): 会话路径
+
+        Returns:
+            List[Tab]: 匹配的选项卡列表
+        """
+        return self._find("_by_path", path, lambda tab: tab.Session.Path)
+
+    def FindByRemoteAddress(self, address: str) -> List:
+        """
+        查找已连接到远程地址 address 的所有选项卡。
+
+        Args:
+            address (str): 远程主机的 IP 地址
+
+        Returns:
+            List[Tab]: 匹配的选项卡列表
+        """
+        def current(tab):
+            try:
+                return tab.Session.RemoteAddress
+            except Exception:
+                return None
+        return self._find("_by_remote_address", address, current)
@@ -0,0 +1,219 @@
+import time
+from contextlib import contextmanager
+
+class _PooledTab:
+    __slots__ = ("tab", "path", "released")
+
+    def __init__(self, tab, path: str):
+        self.tab = tab
+        self.path = path
+        self.released = time.monotonic()
+
+
+class TabPool:
+    """
+    TabPool 是基于 Tab.Clone 的已认证选项卡池，按 Session.Path 分组。
+
+    Tab.Clone 创建的选项卡继承父会话的认证，不需要重新登录。
+    TabPool 为每个会话路径预先克隆若干选项卡，按需借出和归还，
+    借出前用 Session.Connected 检查健康状态，并用 Tab.Close 关闭断开或空闲过久的选项卡。
+    池中（包括借出的）选项卡总数不超过 max_tabs，从而避免脚本泄漏选项卡。
+
+    示例：
+    pool = TabPool(max_tabs=20)
+    pool.Register(crt.GetScriptTab(), 4)
+    with pool.Lease(crt.GetScriptTab().Session.Path) as tab:
+        tab.Screen.Run("show version", "#")
+    pool.Close()
+    """
+    __slots__ = ("max_tabs", "max_idle", "_sources", "_idle", "_leased")
+
+    def __init__(self, max_tabs: int = 32, max_idle: float = 600):
+        """
+        初始化 TabPool 对象
+
+        Args:
+            max_tabs (int, optional): 池中选项卡总数上限，包括借出的选项卡。默认为32
+            max_idle (float, optional): 空闲选项卡的最长保留秒数，超过后被关闭。默认为600
+        """
+        self.max_tabs = max_tabs
+        self.max_idle = max_idle
+        self._sources = {}
+        self._idle = {}
+        # 借出的选项卡。同一个选项卡可能被包装成不同的 Tab 对象，按 COM 对象比较，不能按 id() 查找
+        self._leased = []
+
+    @property
+    def Count(self) -> int:
+        """
+        返回池中选项卡的总数，包括借出的选项卡。
+
+        Returns:
+            int: 选项卡总数
+        """
+        return sum(len(tabs) for tabs in self._idle.values()) + len(self._leased)
+
+    def Register(self, source, size: int = 0) -> str:
+        """
+        注册一个已认证的选项卡作为克隆来源，并预先克隆 size 个选项卡。
+
+        来源选项卡本身不会被借出或关闭。
+        池按 Session.Path 区分来源，每个路径只能有一个来源选项卡；
+        再次注册同一个选项卡只会追加克隆。通过 crt.Session.Connect 临时连接的会话
+        路径都是 "Default"，连接不同主机时需要分别使用不同的 TabPool。
+
+        Args:
+            source (Tab): 已连接并完成认证的选项卡
+            size (int, optional): 预先克隆的选项卡数量。默认为0
+
+        Returns:
+            str: 来源选项卡的 Session.Path，作为借出时的键
+
+        Raises:
+            ValueError: 如果该路径已经注册了另一个来源选项卡
+        """
+        path = source.Session.Path
+        registered = self._sources.get(path)
+        if registered is not None and not self._same(registered, source):
+            raise ValueError(f"session path {path!r} is already registered with another source tab")
+        self._sources[path] = source
+        self._idle.setdefault(path, [])
+        for _ in range(size):
+            if self.Count >= self.max_tabs:
+                break
+            self._idle[path].append(_PooledTab(source.Clone(), path))
+        return path
+
+    def _healthy(self, tab) -> bool:
+        try:
+            return bool(tab.Session.Connected)
+        except Exception:
+            return False
+
+    def _close(self, tab) -> None:
+        try:
+            tab.Close()
+        except Exception:
+            pass
+
+    def Acquire(self, path: str):
+        """
+        借出一个指定会话路径的已认证选项卡。
+
+        优先借出空闲选项卡（断开的空闲选项卡会被关闭并丢弃）；没有空闲选项卡时，
+        如果未达到总数上限，则从来源选项卡克隆一个新选项卡，
+        否则先关闭其他路径中空闲最久的选项卡以腾出位置。
+
+        Args:
+            path (str): 会话路径，即 Register 返回的 Session.Path
+
+        Returns:
+            Tab: 借出的选项卡
+
+        Raises:
+            KeyError: 如果该路径没有注册来源选项卡
+            RuntimeError: 如果所有选项卡都已借出且达到总数上限
+        """
+        if path not in self._sources:
+            raise KeyError(path)
+        idle = self._idle[path]
+        while idle:
+            pooled = idle.pop()
+            if self._healthy(pooled.tab):
+                self._leased.append(pooled)
+                return pooled.tab
+            self._close(pooled.tab)
+        if self.Count >= self.max_tabs and not self._evict_oldest():
+            raise RuntimeError(f"tab pool exhausted ({self.max_tabs} tabs leased)")
+        pooled = _PooledTab(self._sources[path].Clone(), path)
+        self._leased.append(pooled)
+        return pooled.tab
+
+    def _evict_oldest(self) -> bool:
+        oldest = None
+        for tabs in self._idle.values():
+            for pooled in tabs:
+                if oldest is None or pooled.released < oldest.released:
+                    oldest = pooled
+        if oldest is None:
+            return False
+        self._idle[oldest.path].remove(oldest)
+        self._close(oldest.tab)
+        return True
+
+    def _same(self, a, b) -> bool:
+        # pywin32 的 COM 对象按底层 IUnknown 比较相等
+        return a is b or getattr(a, "obj", a) == getattr(b, "obj", b)
+
+    def Release(self, tab) -> None:
+        """
+        归还借出的选项卡。已断开的选项卡会被直接关闭。
+
+        可以传入另一个包装同一选项卡的 Tab 对象，如 crt.GetTab(index) 的返回值。
+
+        Args:
+            tab (Tab): Acquire 借出的选项卡
+
+        Raises:
+            KeyError: 如果该选项卡不是从池中借出的，或者已经归还
+        """
+        for index, pooled in enumerate(self._leased):
+            if self._same(pooled.tab, tab):
+                del self._leased[index]
+                break
+        else:
+            raise KeyError(f"tab was not leased from this pool: {tab!r}")
+        if self._healthy(tab):
+            pooled.released = time.monotonic()
+            self._idle[pooled.path].append(pooled)
+        else:
+            self._close(tab)
+
+    @contextmanager
+    def Lease(self, path: str):
+        """
+        以 with 语句借出选项卡，退出时自动归还。
+
+        Args:
+            path (str): 会话路径
+
+        Returns:
+            Tab: 借出的选项卡
+        """
+        tab = self.Acquire(path)
+        try:
+            yield tab
+        finally:
+            self.Release(tab)
+
+    def Evict(self) -> int:
+        """
+        关闭已断开或空闲超过 max_idle 秒的空闲选项卡。
+
+        Returns:
+            int: 关闭的选项卡数量
+        """
+        now = time.monotonic()
+        closed = 0
+        for path, tabs in self._idle.items():
+            keep = []
+            for pooled in tabs:
+                if now - pooled.released > self.max_idle or not self._healthy(pooled.tab):
+                    self._close(pooled.tab)
+                    closed += 1
+                else:
+                    keep.append(pooled)
+            self._idle[path] = keep
+        return closed
+
+    def Close(self) -> None:
+        """
+        关闭池中所有空闲和借出的选项卡。来源选项卡不会被关闭。
+        """
+        for tabs in self._idle.values():
+            for pooled in tabs:
+                self._close(pooled.tab)
+            tabs.clear()
+        for pooled in self._leased:
+            self._close(pooled.tab)
+        self._leased.clear()
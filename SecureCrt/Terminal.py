@@ -0,0 +1,322 @@
+import unicodedata
+from typing import List, Optional
+from .AnsiParser import AnsiParser, TEXT, CONTROL, ESC, CSI
+
+class Terminal:
+    """
+    Terminal 对象是一个在本地运行的 VT100/xterm 屏幕模型。
+
+    它解析 ReadString 读取的原始数据流（需要 Screen.IgnoreEscape 为 False），
+    自行维护字符网格、光标位置和滚动区域，
+    因此 Get、Get2、CurrentRow、CurrentColumn 可以在本进程内直接回答，无需跨进程调用 COM。
+
+    支持光标移动、清屏/清行、插入/删除行和字符、滚动区域（DECSTBM）、
+    光标保存/恢复、自动换行、备用屏幕（?47、?1047、?1049）以及全角字符；颜色等显示属性被忽略。
+    切换到备用屏幕时保存主屏幕的内容，切换回来时恢复，
+    因此 vi、top 等全屏程序退出后，主屏幕上原有的内容仍然可以读取。
+
+    示例：
+    term = crt.Screen.Terminal()
+    while True:
+        term.Feed(crt.Screen.ReadString(["\\n"], 1))
+        if term.Get(1, 1, 1, 10) == "Tasks: ...":
+            ...
+    """
+    __slots__ = ("Rows", "Columns", "CurrentRow", "CurrentColumn", "_cells", "_top", "_bottom",
+                 "_saved", "_wrap_pending", "_alternate", "_parser")
+
+    def __init__(self, rows: int = 24, columns: int = 80):
+        """
+        初始化 Terminal 对象
+
+        Args:
+            rows (int, optional): 屏幕行数。默认为24
+            columns (int, optional): 屏幕列数。默认为80
+        """
+        self.Rows = rows
+        self.Columns = columns
+        self._parser = AnsiParser()
+        self.Reset()
+
+    def Reset(self) -> None:
+        """
+        清空屏幕，光标回到左上角，滚动区域恢复为整个屏幕。
+        """
+        self._cells = [self._blank() for _ in range(self.Rows)]
+        self.CurrentRow = 1
+        self.CurrentColumn = 1
+        self._top = 1
+        self._bottom = self.Rows
+        self._saved = (1, 1)
+        self._wrap_pending = False
+        self._alternate = None
+        self._parser.Reset()
+
+    def Load(self, lines: List[str], row: int = 1, column: int = 1) -> None:
+        """
+        用已有的屏幕内容初始化字符网格和光标位置，例如 Screen.Snapshot().Lines()。
+
+        Args:
+            lines (List[str]): 每行的内容
+            row (int, optional): 光标行位置。默认为1
+            column (int, optional): 光标列位置。默认为1
+        """
+        self._cells = [self._blank() for _ in range(self.Rows)]
+        for index, line in enumerate(lines[:self.Rows]):
+            cells = self._cells[index]
+            for position, char in enumerate(line[:self.Columns]):
+                cells[position] = char
+        self.CurrentRow = min(max(row, 1), self.Rows)
+        self.CurrentColumn = min(max(column, 1), self.Columns)
+        self._wrap_pending = False
+
+    def _blank(self) -> List[str]:
+        return [" "] * self.Columns
+
+    def Feed(self, data: str) -> None:
+        """
+        输入从 ReadString 读取的原始数据，更新屏幕模型。
+
+        Args:
+            data (str): 包含转义序列的原始数据
+        """
+        for token in self._parser.Feed(data):
+            kind = token[0]
+            if kind == TEXT:
+                self._print(token[1])
+            elif kind == CONTROL:
+                self._control(token[1])
+            elif kind == CSI:
+                self._csi(token[1], token[2], token[3], token[4])
+            elif kind == ESC:
+                self._esc(token[1], token[2])
+
+    def _check(self, row1: int, col1: int, row2: int, col2: int) -> None:
+        if not (1 <= row1 <= row2 <= self.Rows and 1 <= col1 <= col2 <= self.Columns):
+            raise IndexError(f"invalid region ({row1}, {col1}, {row2}, {col2}) "
+                             f"for {self.Rows}x{self.Columns} screen")
+
+    def Get(self, row1: int, col1: int, row2: int, col2: int) -> str:
+        """
+        返回屏幕模型中指定矩形区域的字符串内容，语义与 Screen.Get 相同。
+
+        Args:
+            row1 (int): 左上角行坐标
+            col1 (int): 左上角列坐标
+            row2 (int): 右下角行坐标
+            col2 (int): 右下角列坐标
+
+        Returns:
+            str: 指定区域的字符串内容
+
+        Raises:
+            IndexError: 如果区域超出屏幕范围
+        """
+        self._check(row1, col1, row2, col2)
+        return "".join("".join(self._cells[row - 1][col1 - 1:col2]) for row in range(row1, row2 + 1))
+
+    def Get2(self, row1: int, col1: int, row2: int, col2: int) -> str:
+        """
+        返回屏幕模型中指定矩形区域的字符串内容，每行以\\r\\n结束，语义与 Screen.Get2 相同。
+
+        Args:
+            row1 (int): 左上角行坐标
+            col1 (int): 左上角列坐标
+            row2 (int): 右下角行坐标
+            col2 (int): 右下角列坐标
+
+        Returns:
+            str: 指定区域的字符串内容，每行以\\r\\n结束
+
+        Raises:
+            IndexError: 如果区域超出屏幕范围
+        """
+        self._check(row1, col1, row2, col2)
+        return "".join("".join(self._cells[row - 1][col1 - 1:col2]).rstrip(" ") + "\r\n"
+                       for row in range(row1, row2 + 1))
+
+    def _print(self, text: str) -> None:
+        columns = self.Columns
+        for char in text:
+            width = 2 if unicodedata.east_asian_width(char) in "WF" else 1
+            if self._wrap_pending or self.CurrentColumn + width - 1 > columns:
+                self.CurrentColumn = 1
+                self._linefeed()
+                self._wrap_pending = False
+            cells = self._cells[self.CurrentRow - 1]
+            cells[self.CurrentColumn - 1] = char
+            if width == 2:
+                # 全角字符占用两列，第二列留空以保持列对齐
+                cells[self.CurrentColumn] = ""
+            if self.CurrentColumn + width - 1 >= columns:
+                self.CurrentColumn = columns
+                self._wrap_pending = True
+            else:
+                self.CurrentColumn += width
+
+    def _linefeed(self) -> None:
+        if self.CurrentRow == self._bottom:
+            self._scroll_up(1)
+        elif self.CurrentRow < self.Rows:
+            self.CurrentRow += 1
+
+    def _reverse_linefeed(self) -> None:
+        if self.CurrentRow == self._top:
+            self._scroll_down(1)
+        elif self.CurrentRow > 1:
+            self.CurrentRow -= 1
+
+    def _scroll_up(self, count: int, top: Optional[int] = None) -> None:
+        top = self._top if top is None else top
+        count = min(count, self._bottom - top + 1)
+        del self._cells[top - 1:top - 1 + count]
+        # 删除后区域底部前移了 count 行，空行插在区域内，不能把区域下方的行带进来
+        position = self._bottom - count
+        self._cells[position:position] = [self._blank() for _ in range(count)]
+
+    def _scroll_down(self, count: int, top: Optional[int] = None) -> None:
+        top = self._top if top is None else top
+        count = min(count, self._bottom - top + 1)
+        del self._cells[self._bottom - count:self._bottom]
+        for _ in range(count):
+            self._cells.insert(top - 1, self._blank())
+
+    def _move(self, row: int, column: int) -> None:
+        self.CurrentRow = min(max(row, 1), self.Rows)
+        self.CurrentColumn = min(max(column, 1), self.Columns)
+        self._wrap_pending = False
+
+    def _control(self, char: str) -> None:
+        if char == "\r":
+            self.CurrentColumn = 1
+            self._wrap_pending = False
+        elif char in "\n\x0b\x0c":
+            self._linefeed()
+            self._wrap_pending = False
+        elif char == "\b":
+            if self.CurrentColumn > 1:
+                self.CurrentColumn -= 1
+            self._wrap_pending = False
+        elif char == "\t":
+            self.CurrentColumn = min((self.CurrentColumn - 1) // 8 * 8 + 9, self.Columns)
+
+    def _esc(self, intermediates: str, final: str) -> None:
+        if intermediates:
+            return
+        if final == "7":
+            self._saved = (self.CurrentRow, self.CurrentColumn)
+        elif final == "8":
+            self._move(*self._saved)
+        elif final == "D":
+            self._linefeed()
+        elif final == "E":
+            self.CurrentColumn = 1
+            self._linefeed()
+        elif final == "M":
+            self._reverse_linefeed()
+        elif final == "c":
+            self.Reset()
+
+    def _erase(self, row: int, start: int, end: int) -> None:
+        cells = self._cells[row - 1]
+        for index in range(start - 1, end):
+            cells[index] = " "
+
+    def _switch_screen(self, alternate: bool, cursor: bool) -> None:
+        # 进入备用屏幕时保存主屏幕的字符网格（?1049 同时保存光标），得到一个空白的备用屏幕；
+        # 离开时丢弃备用屏幕，恢复主屏幕。重复进入或离开时不做任何处理
+        if alternate and self._alternate is None:
+            self._alternate = (self._cells, (self.CurrentRow, self.CurrentColumn) if cursor else None)
+            self._cells = [self._blank() for _ in range(self.Rows)]
+        elif not alternate and self._alternate is not None:
+            self._cells, saved = self._alternate
+            self._alternate = None
+            if saved is not None:
+                self._move(*saved)
+
+    def _csi(self, prefix: str, params: tuple, intermediates: str, final: str) -> None:
+        if intermediates:
+            return
+        first = params[0] if params else 0
+        count = first or 1
+        row = self.CurrentRow
+        column = self.CurrentColumn
+        if prefix:
+            # DEC 私有模式（如 ?25h）不影响字符网格，只处理备用屏幕的切换
+            if prefix == "?" and final in "hl":
+                for mode in params:
+                    if mode in (47, 1047, 1049):
+                        self._switch_screen(final == "h", mode == 1049)
+            return
+        if final == "A":
+            self._move(max(row - count, self._top if row >= self._top else 1), column)
+        elif final == "B":
+            self._move(min(row + count, self._bottom if row <= self._bottom else self.Rows), column)
+        elif final == "C":
+            self._move(row, column + count)
+        elif final == "D":
+            self._move(row, column - count)
+        elif final == "E":
+            self._move(row + count, 1)
+        elif final == "F":
+            self._move(row - count, 1)
+        elif final in "G`":
+            self._move(row, count)
+        elif final == "d":
+            self._move(count, column)
+        elif final in "Hf":
+            self._move(count, params[1] if len(params) > 1 and params[1] else 1)
+        elif final == "J":
+            if first == 0:
+                self._erase(row, column, self.Columns)
+                for index in range(row + 1, self.Rows + 1):
+                    self._erase(index, 1, self.Columns)
+            elif first == 1:
+                for index in range(1, row):
+                    self._erase(index, 1, self.Columns)
+                self._erase(row, 1, column)
+            elif first in (2, 3):
+                for index in range(1, self.Rows + 1):
+                    self._erase(index, 1, self.Columns)
+        elif final == "K":
+            if first == 0:
+                self._erase(row, column, self.Columns)
+            elif first == 1:
+                self._erase(row, 1, column)
+            elif first == 2:
+                self._erase(row, 1, self.Columns)
+        elif final == "X":
+            self._erase(row, column, min(column + count - 1, self.Columns))
+        elif final == "@":
+            cells = self._cells[row - 1]
+            count = min(count, self.Columns - column + 1)
+            cells[column - 1:column - 1] = [" "] * count
+            del cells[self.Columns:]
+        elif final == "P":
+            cells = self._cells[row - 1]
+            count = min(count, self.Columns - column + 1)
+            del cells[column - 1:column - 1 + count]
+            cells.extend([" "] * count)
+        elif final == "L":
+            if self._top <= row <= self._bottom:
+                self._scroll_down(count, row)
+                self.CurrentColumn = 1
+        elif final == "M":
+            if self._top <= row <= self._bottom:
+                self._scroll_up(count, row)
+                self.CurrentColumn = 1
+        elif final == "S":
+            self._scroll_up(count)
+        elif final == "T":
+            self._scroll_down(count)
+        elif final == "r":
+            top = first or 1
+            bottom = params[1] if len(params) > 1 and params[1] else self.Rows
+            if 1 <= top < bottom <= self.Rows:
+                self._top = top
+                self._bottom = bottom
+                self._move(1, 1)
+        elif final == "s":
+            self._saved = (row, column)
+        elif final == "u":
+            self._move(*self._saved)
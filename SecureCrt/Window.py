@@ -9,6 +9,8 @@ class Window:
     
     SecureCRT 的 Window 对象通过顶级对象的 Window 属性访问。
     """
+    __slots__ = ("obj",)
+
     def __init__(self, obj):
         """
         初始化 Window 对象
@@ -0,0 +1,75 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+import asyncio
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.AsyncScreen import AsyncScreen, AsyncTab
+from SecureCrt.Screen import Screen
+from TS_fakescreen import FakeScreen
+
+def check_responsive():
+    # 一个选项卡没有任何输出，另一个在0.1秒后出现提示符：
+    # 等待不能阻塞事件循环，没有输出的选项卡必须按时超时
+    silent = FakeScreen()
+    busy = FakeScreen()
+    busy.Receive("hostname\r\nR1\r\n$ ", 0.1)
+    ticks = []
+
+    async def ticker():
+        for _ in range(30):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def run():
+        return await asyncio.gather(AsyncScreen(Screen(silent)).Expect("$ ", 0.3),
+                                    AsyncScreen(Screen(busy)).Expect("$ ", 0.3), ticker())
+
+    start = time.perf_counter()
+    silent_match, busy_match, _ = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    gap = max((b - a for a, b in zip(ticks, ticks[1:])), default=0.0)
+    ok = silent_match is None and busy_match is not None and elapsed < 1 and gap < 0.1 and \
+        silent.BlockedCalls == busy.BlockedCalls == 0
+    return (f"测试替身: 耗时 {elapsed:.2f} 秒，事件循环最长停顿 {gap * 1000:.0f} 毫秒，"
+            f"阻塞的 ReadString 调用 {silent.BlockedCalls + busy.BlockedCalls} 次，{'正确' if ok else '错误'}")
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        command = _crt.Dialog.Prompt("请输入要在所有已连接选项卡上执行的命令:", "AsyncScreen测试", "sleep 1; hostname")
+        prompt = _crt.Dialog.Prompt("请输入命令提示符:", "AsyncScreen测试", "$ ")
+        script_index = _crt.GetScriptTab().Index
+        tabs = []
+        for i in range(1, _crt.GetTabCount() + 1):
+            tab = _crt.GetTab(i)
+            if tab.Index != script_index and tab.Session.Connected:
+                tabs.append(AsyncTab(tab))
+
+        async def run_all():
+            return await asyncio.gather(*(tab.Run(command, prompt, 30) for tab in tabs))
+
+        start = time.perf_counter()
+        results = asyncio.run(run_all())
+        elapsed = time.perf_counter() - start
+        lines = [f"选项卡 {tab.tab.Index}: 提示符延迟 {result.PromptLatency:.2f} 秒，超时={result.TimedOut}"
+                 for tab, result in zip(tabs, results)]
+        lines.append(f"\n{len(tabs)} 个选项卡并发执行总耗时: {elapsed:.2f} 秒")
+        lines.append(f"各选项卡延迟之和: {sum(result.PromptLatency for result in results):.2f} 秒")
+        lines.append(check_responsive())
+        _crt.Dialog.MessageBox("\n".join(lines), "AsyncScreen测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
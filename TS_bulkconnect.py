@@ -0,0 +1,41 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.BulkConnect import BulkConnect
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        text = _crt.Dialog.Prompt("请输入要连接的目标（用逗号分隔）:", "BulkConnect测试",
+                                  "/telnet 127.0.0.1 23,/telnet 127.0.0.1 2323,/s Default")
+        targets = [target.strip() for target in text.split(",") if target.strip()]
+        concurrency = int(_crt.Dialog.Prompt("同时进行的连接数:", "BulkConnect测试", "8"))
+        start = time.perf_counter()
+        reports = BulkConnect(_crt, concurrency=concurrency, timeout=15, retries=1).Connect(targets)
+        elapsed = time.perf_counter() - start
+        lines = [f"{report.Target}: {'成功' if report.Connected else '失败'}，尝试 {report.Attempts} 次，"
+                 f"耗时 {report.Elapsed:.2f} 秒 {report.Error}" for report in reports]
+        lines.append(f"\n总耗时: {elapsed:.2f} 秒")
+        _crt.Dialog.MessageBox("\n".join(lines), "BulkConnect测试结果", [64, 0, 0])
+
+        if _crt.Dialog.MessageBox("是否关闭新建的选项卡?", "BulkConnect测试", [32 + 4, 0, 0]) == 6:
+            for report in reports:
+                if report.Tab is not None and report.Tab.Index != _crt.GetScriptTab().Index:
+                    report.Tab.Close()
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
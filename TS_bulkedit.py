@@ -0,0 +1,74 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.SessionIni import BulkEdit, FindSessionFiles
+
+def enable_noop(ini):
+    # 子进程按名称导入此函数，因此必须定义在模块顶层
+    ini.SetOption("Idle NO-OP Check", 1)
+
+def copy_sessions(sessions_dir, target):
+    # 在副本上测试，不修改真实的会话文件
+    shutil.copytree(sessions_dir, target)
+    sessions = FindSessionFiles(target)
+    return [sessions[path] for path in sorted(sessions)]
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        default_dir = os.path.join(os.environ.get("APPDATA", ""), "VanDyke", "Config", "Sessions")
+        sessions_dir = _crt.Dialog.Prompt("请输入 Sessions 目录:", "BulkEdit测试", default_dir)
+        workdir = tempfile.mkdtemp(prefix="BulkEdit")
+        try:
+            serial_files = copy_sessions(sessions_dir, os.path.join(workdir, "serial"))
+            pool_files = copy_sessions(sessions_dir, os.path.join(workdir, "pool"))
+
+            start = time.perf_counter()
+            serial = BulkEdit(serial_files, enable_noop, processes=0)
+            serial_elapsed = time.perf_counter() - start
+
+            # processes=None：使用 CPU 核数个子进程
+            start = time.perf_counter()
+            pooled = BulkEdit(pool_files, enable_noop)
+            pool_elapsed = time.perf_counter() - start
+
+            # 两种方式的写回结果和文件内容必须相同
+            mismatched = []
+            for (serial_file, serial_saved, serial_error), (pool_file, pool_saved, pool_error) in zip(serial, pooled):
+                with open(serial_file, "rb") as f:
+                    serial_data = f.read()
+                with open(pool_file, "rb") as f:
+                    pool_data = f.read()
+                if (serial_saved, serial_error) != (pool_saved, pool_error) or serial_data != pool_data:
+                    mismatched.append(os.path.relpath(pool_file, os.path.join(workdir, "pool")))
+            errors = [f"{os.path.basename(path)}: {error}" for path, _, error in pooled if error]
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        result = [f"会话文件: {len(pool_files)} 个",
+                  f"当前进程: {serial_elapsed:.3f} 秒，写回 {sum(saved for _, saved, _ in serial)} 个",
+                  f"进程池: {pool_elapsed:.3f} 秒，写回 {sum(saved for _, saved, _ in pooled)} 个",
+                  f"结果不一致: {len(mismatched)} 个"] + mismatched[:10]
+        result += [f"错误: {len(errors)} 个"] + errors[:10]
+        _crt.Dialog.MessageBox("\n".join(result), "BulkEdit测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+# 进程池的子进程会重新导入此脚本，只有主进程执行测试
+if __name__ == "__main__":
+    main()
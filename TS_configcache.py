@@ -0,0 +1,58 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+
+OPTIONS = ["Hostname", "Port", "Username", "Protocol Name", "Emulation", "Rows", "Cols",
+           "Scrollback", "Log Filename V2", "Start Log Upon Connect", "Idle NO-OP Check", "Idle NO-OP Delay"]
+
+def provision(config):
+    # 典型的配置脚本：先检查再修改，修改前后各读取一次，最后保存。
+    # 写入的都是原值，因此不会真正改变会话配置。
+    calls = 0
+    for name in OPTIONS:
+        config.GetOption(name)
+        calls += 1
+    for name in OPTIONS:
+        value = config.GetOption(name)
+        config.SetOption(name, value)
+        config.GetOption(name)
+        calls += 3
+    config.Save()
+    return calls + 1
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        paths = _crt.Dialog.Prompt("请输入会话路径，多个路径用逗号分隔:", "CachedConfiguration测试", "Default")
+        result = []
+        for path in [path.strip() for path in paths.split(",") if path.strip()]:
+            start = time.perf_counter()
+            direct_calls = provision(_crt.OpenSessionConfiguration(path))
+            direct = time.perf_counter() - start
+
+            start = time.perf_counter()
+            cached_config = _crt.OpenSessionConfiguration(path).Cached()
+            provision(cached_config)
+            cached = time.perf_counter() - start
+
+            result.append(f"{path}: 直接调用 {direct_calls} 次 COM / {direct:.3f} 秒，"
+                          f"缓存后 {cached_config.ComCalls} 次 COM / {cached:.3f} 秒，"
+                          f"每个会话节省 {direct_calls - cached_config.ComCalls} 次调用")
+        _crt.Dialog.MessageBox("\n".join(result), "CachedConfiguration测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
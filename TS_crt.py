@@ -0,0 +1,54 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.Screen import Screen
+from SecureCrt.Session import Session
+
+def bench(func, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1e6
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        count = int(_crt.Dialog.Prompt("每项测试的访问次数:", "包装对象缓存测试", "10000"))
+        tab = _crt.GetScriptTab()
+
+        # 缓存后多次访问应返回同一个包装对象
+        assert _crt.Screen is _crt.Screen
+        assert _crt.Session is _crt.Session
+        assert tab.Screen is tab.Screen
+        assert tab.Session is tab.Session
+
+        # 对比每次重建包装对象（旧行为）与使用缓存包装对象的单次访问开销
+        results = [
+            ("crt.Screen（重建）", bench(lambda: Screen(crt.Screen), count)), #type: ignore
+            ("_crt.Screen（缓存）", bench(lambda: _crt.Screen, count)),
+            ("crt.Session（重建）", bench(lambda: Session(crt.Session), count)), #type: ignore
+            ("_crt.Session（缓存）", bench(lambda: _crt.Session, count)),
+            ("tab.Screen（重建）", bench(lambda: Screen(tab.obj.Screen), count)),
+            ("tab.Screen（缓存）", bench(lambda: tab.Screen, count)),
+            ("Screen(crt.Screen).Rows", bench(lambda: Screen(crt.Screen).Rows, count)), #type: ignore
+            ("_crt.Screen.Rows", bench(lambda: _crt.Screen.Rows, count)),
+        ]
+        message = "\n".join(f"{name}: {cost:.2f} 微秒/次" for name, cost in results)
+        _crt.Dialog.MessageBox(message, "包装对象缓存测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
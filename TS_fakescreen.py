@@ -0,0 +1,101 @@
+import bisect
+import time
+
+class FakeScreen:
+    """
+    模拟 Screen COM 对象的测试替身，供各 TS 脚本共用。
+
+    远程输出按到达时间排队，ReadString 的行为与 SecureCRT 相同：
+    不带参数时一直阻塞到有数据为止；带分隔符时返回分隔符之前的数据并设置 MatchIndex，
+    超时返回空字符串并丢弃已收到的数据，这些数据仍显示在屏幕上，可以通过 Get 读回。
+    子类重写 Send 来模拟设备对输入的响应。
+
+    Attributes:
+        BlockedCalls (int): 没有数据时调用不带超时的 ReadString 的次数，这样的调用会阻塞到数据到达为止
+    """
+    def __init__(self, block: float = 5.0):
+        self.Synchronous = False
+        self.MatchIndex = 0
+        self.CurrentRow = 1
+        self.CurrentColumn = 1
+        self.BlockedCalls = 0
+        self.block = block
+        self.output = []
+        self._sequence = 0
+        self._buffer = ""
+        self._lines = {}
+
+    def Receive(self, text: str, delay: float = 0.0, at: float = None) -> None:
+        # 远程在 delay 秒之后（或 at 时刻）发出 text
+        self._sequence += 1
+        bisect.insort(self.output, ((time.monotonic() + delay) if at is None else at, self._sequence, text))
+
+    def Send(self, string, bSendToScreenOnly=False, bEncode=True):
+        pass
+
+    def Get(self, row1, col1, row2, col2):
+        return self._lines.get(row1, "").ljust(col2)[col1 - 1:col2]
+
+    def _arrive(self) -> None:
+        now = time.monotonic()
+        while self.output and self.output[0][0] <= now:
+            self._buffer += self.output.pop(0)[2]
+
+    def _display(self, text: str) -> None:
+        for char in text:
+            if char == "\n":
+                self.CurrentRow += 1
+                self.CurrentColumn = 1
+            elif char == "\r":
+                self.CurrentColumn = 1
+            else:
+                line = self._lines.get(self.CurrentRow, "").ljust(self.CurrentColumn - 1)
+                column = self.CurrentColumn
+                self._lines[self.CurrentRow] = line[:column - 1] + char + line[column:]
+                self.CurrentColumn += 1
+
+    def _consume(self, length: int) -> str:
+        data = self._buffer[:length]
+        self._buffer = self._buffer[length:]
+        self._display(data)
+        return data
+
+    def ReadString(self, strings=None, timeout=0, bCaseInsensitive=False, bMilliseconds=False):
+        deadline = None
+        if timeout:
+            deadline = time.monotonic() + (timeout / 1000.0 if bMilliseconds else timeout)
+        if isinstance(strings, str):
+            strings = [strings]
+        self._arrive()
+        if deadline is None and not self._buffer:
+            self.BlockedCalls += 1
+        while True:
+            self._arrive()
+            if not strings:
+                if self._buffer:
+                    return self._consume(len(self._buffer))
+            else:
+                text = self._buffer.lower() if bCaseInsensitive else self._buffer
+                best = None
+                for index, string in enumerate(strings, 1):
+                    position = text.find(string.lower() if bCaseInsensitive else string)
+                    if position >= 0 and (best is None or position + len(string) < best[1]):
+                        best = (index, position + len(string), position)
+                if best is not None:
+                    self.MatchIndex = best[0]
+                    data = self._consume(best[2])
+                    self._consume(best[1] - best[2])
+                    return data
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                self.MatchIndex = 0
+                self._consume(len(self._buffer))
+                return ""
+            wake = self.output[0][0] if self.output else None
+            if deadline is not None:
+                wake = deadline if wake is None else min(wake, deadline)
+            if wake is None:
+                # 真实设备上会一直阻塞；测试替身阻塞 block 秒后返回，以便测试能够结束并发现问题
+                time.sleep(self.block)
+                return ""
+            time.sleep(max(0.0, min(wake - now, 0.005)))
@@ -0,0 +1,65 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.FanOut import FanOut
+from SecureCrt.Tab import Tab
+from TS_fakescreen import FakeScreen
+
+class FakeDevice(FakeScreen):
+    """
+    按固定延迟回显命令并输出提示符的 Screen 测试替身；delay 为None时不产生任何输出。
+    """
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+
+    def Send(self, string, bSendToScreenOnly=False, bEncode=True):
+        if self.delay is not None:
+            self.Receive(string.replace("\r", "\r\n") + "ok\r\n$ ", self.delay)
+
+class FakeTab:
+    def __init__(self, screen):
+        self.Screen = screen
+
+def check_timeouts():
+    # 一个没有输出的设备不能拖住其他设备，它自己的超时也必须按时生效
+    tabs = [Tab(FakeTab(FakeDevice(delay))) for delay in (None, 0.05, 0.2)]
+    start = time.perf_counter()
+    order = [(round(time.perf_counter() - start, 2), result.TimedOut)
+             for _, result in FanOut(tabs, "$ ", 0.5).Iterate("show clock")]
+    blocked = sum(tab.Screen.obj.BlockedCalls for tab in tabs)
+    ok = [timed_out for _, timed_out in order] == [False, False, True] and \
+        order[0][0] < 0.2 and order[2][0] < 1 and not blocked
+    return f"测试替身: 完成时间与是否超时 {order}，阻塞的 ReadString 调用 {blocked} 次，{'正确' if ok else '错误'}"
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        command = _crt.Dialog.Prompt("请输入要在所有已连接选项卡上执行的命令:", "FanOut测试", "sleep 1; hostname")
+        prompt = _crt.Dialog.Prompt("请输入命令提示符:", "FanOut测试", "$ ")
+        start = time.perf_counter()
+        results = _crt.FanOut(command, prompt, timeout=30)
+        elapsed = time.perf_counter() - start
+        lines = [f"选项卡 {tab.Index}: 首字节 {result.FirstByteLatency}，提示符延迟 {result.PromptLatency:.2f} 秒，"
+                 f"超时={result.TimedOut}" for tab, result in results]
+        lines.append(f"\n{len(results)} 个选项卡总耗时: {elapsed:.2f} 秒")
+        lines.append(f"各选项卡延迟之和: {sum(result.PromptLatency for _, result in results):.2f} 秒")
+        lines.append(check_timeouts())
+        _crt.Dialog.MessageBox("\n".join(lines), "FanOut测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
@@ -0,0 +1,43 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.HealthMonitor import HealthMonitor
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        duration = float(_crt.Dialog.Prompt("请输入监视的秒数（期间可手动断开其他选项卡）:", "HealthMonitor测试", "60"))
+        script_tab = _crt.GetScriptTab()
+        monitor = HealthMonitor(min_interval=1, max_interval=30, crt=_crt)
+        for index in range(1, _crt.GetTabCount() + 1):
+            tab = _crt.GetTab(index)
+            if tab.Index != script_tab.Index:
+                monitor.Add(tab)
+                # GetTab 每次返回新的包装对象，同一选项卡不能被重复监视
+                monitor.Add(_crt.GetTab(index))
+        watched = len(monitor._watched)
+        start = time.perf_counter()
+        def on_event(event):
+            script_tab.Session.SetStatusText(f"{event.Tab.Caption}: {event.Kind}")
+        monitor.Run(duration, on_event)
+        elapsed = time.perf_counter() - start
+        result = [f"选项卡 {event.Tab.Index} {event!r}" for event in monitor.Events]
+        result.append(f"\n监视 {watched} 个选项卡 {elapsed:.0f} 秒，共 {len(monitor.Events)} 个事件")
+        _crt.Dialog.MessageBox("\n".join(result), "HealthMonitor测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
@@ -0,0 +1,48 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.LogRotator import LogRotator
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        session = _crt.GetScriptTab().Session
+        screen = _crt.GetScriptTab().Screen
+        command = _crt.Dialog.Prompt("请输入产生大量输出的命令:", "LogRotator测试", "seq 1 200000")
+        prompt = _crt.Dialog.Prompt("请输入命令提示符:", "LogRotator测试", "$ ")
+        rotator = LogRotator(max_bytes=256 * 1024)
+        path = rotator.Add(session, os.path.join(get_script_path(), "TS_logrotator.log"))
+        screen.Synchronous = True
+        screen.Send(command + "\r")
+        segments = []
+        checks = 0
+        start = time.perf_counter()
+        while not screen.WaitForString(prompt, 1):
+            segments += rotator.Check()
+            checks += 1
+        segments += rotator.Check()
+        elapsed = time.perf_counter() - start
+        rotator.Close(stop_logging=True)
+        screen.Synchronous = False
+        result = [f"日志文件: {path}", f"检查次数: {checks}", f"轮转次数: {len(segments)}", f"耗时: {elapsed:.2f} 秒"]
+        result += [f"{segment}.gz: {os.path.getsize(segment + '.gz')} 字节" for segment in segments
+                   if os.path.exists(segment + ".gz")]
+        result += rotator.Errors
+        _crt.Dialog.MessageBox("\n".join(result), "LogRotator测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
@@ -0,0 +1,44 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.LogTail import LogTail
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        session = _crt.GetScriptTab().Session
+        screen = _crt.GetScriptTab().Screen
+        command = _crt.Dialog.Prompt("请输入产生大量输出的命令:", "LogTail测试", "seq 1 20000")
+        prompt = _crt.Dialog.Prompt("请输入命令提示符:", "LogTail测试", "$ ")
+        if not session.Logging:
+            session.LogFileName = os.path.join(get_script_path(), "TS_logtail.log")
+            session.Log(True)
+        tail = LogTail.FromSession(session, start_at_end=True)
+        screen.Send(command + "\r")
+        start = time.perf_counter()
+        count = 0
+        # 提示符所在行没有换行符，不会作为完整行返回，因此以空闲超时结束
+        for line in tail.Lines(timeout=2, poll_interval=0.05):
+            count += 1
+        elapsed = time.perf_counter() - start - 2
+        tail.Close()
+        screen.WaitForString(prompt, 1)
+        _crt.Dialog.MessageBox(f"日志文件: {tail.path}\n读取行数: {count}\n读取字节: {tail.Offset}\n"
+                               f"耗时: {elapsed:.2f} 秒", "LogTail测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
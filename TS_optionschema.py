@@ -0,0 +1,70 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import tempfile
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.SessionIni import SessionIni, FindSessionFiles
+from SecureCrt.OptionSchema import OptionSchema, OptionSpec, OptionTable, InvalidValue, DWORD
+
+def check_invalid():
+    # 以 S: 保存的 DWORD 选项和无法读取的文件必须报告为无效，而不是缺失
+    schema = OptionSchema([OptionSpec("[SSH2] Port", DWORD, 1, 65535), OptionSpec("Idle NO-OP Delay", DWORD)])
+    with tempfile.TemporaryDirectory() as directory:
+        files = {}
+        for path, content in (("good", 'D:"[SSH2] Port"=00000016\r\n'), ("string", 'S:"[SSH2] Port"=22\r\n')):
+            files[path] = os.path.join(directory, path + ".ini")
+            with open(files[path], "w", newline="") as f:
+                f.write(content)
+        files["unreadable"] = os.path.join(directory, "missing.ini")
+        table = OptionTable.FromIni(schema, files)
+    ports = table.Column("[SSH2] Port")
+    invalid = {(path, name) for path, name, _, _ in table.Invalid}
+    ok = ports[0] == 22 and isinstance(ports[1], InvalidValue) and ports[1].Value == "22" and \
+        isinstance(ports[2], InvalidValue) and table.Column("Idle NO-OP Delay")[0] is None and \
+        invalid == {("string", "[SSH2] Port"), ("unreadable", "[SSH2] Port"), ("unreadable", "Idle NO-OP Delay")}
+    return f"类型不符与无法读取的值: {ports!r} {'正确' if ok else '错误'}"
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        default_dir = os.path.join(os.environ.get("APPDATA", ""), "VanDyke", "Config", "Sessions")
+        sessions_dir = _crt.Dialog.Prompt("请输入 Sessions 目录:", "OptionSchema测试", default_dir)
+        sessions = FindSessionFiles(sessions_dir)
+        template_path = _crt.Dialog.Prompt("请输入作为模板的会话路径:", "OptionSchema测试", next(iter(sessions), ""))
+        template = SessionIni.Load(sessions[template_path])
+        # 主机名、用户名等每个会话各不相同，不参与比较
+        names = [name for name in template.Options if name not in ("Hostname", "Username", "Password V2")]
+        schema = OptionSchema.FromIni(template, names)
+
+        start = time.perf_counter()
+        table = OptionTable.FromIni(schema, sessions)
+        load_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        drift = table.Diff({name: template.GetOption(name) for name in names})
+        diff_elapsed = time.perf_counter() - start
+
+        result = [f"{len(table)} 个会话 × {len(schema)} 个选项",
+                  f"读取: {load_elapsed:.2f} 秒，比较: {diff_elapsed * 1000:.1f} 毫秒",
+                  f"与模板 {template_path} 不一致的选项: {len(drift)} 个",
+                  f"不满足类型或约束的值: {len(table.Invalid)} 个",
+                  check_invalid()]
+        for name, mismatched in sorted(drift.items(), key=lambda item: -len(item[1]))[:15]:
+            result.append(f"{name}: {len(mismatched)} 个会话，如 {mismatched[0][0]} = {mismatched[0][1]!r}")
+        _crt.Dialog.MessageBox("\n".join(result), "OptionSchema测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
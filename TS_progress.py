@@ -0,0 +1,53 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.Progress import Progress
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        total = int(_crt.Dialog.Prompt("请输入循环次数:", "Progress测试", "20000"))
+        session = _crt.GetScriptTab().Session
+        tab = _crt.GetScriptTab()
+
+        start = time.perf_counter()
+        for index in range(1, total + 1):
+            session.SetStatusText(f"直接写入 {index}/{total}")
+        direct = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with Progress.ForStatusBar(session, total=total, message="状态栏") as progress:
+            for _ in range(total):
+                progress.Advance()
+        status = time.perf_counter() - start
+
+        caption = tab.Caption
+        start = time.perf_counter()
+        with Progress.ForCaption(tab, total=total, max_rate=2) as caption_progress:
+            for _ in range(total):
+                caption_progress.Advance()
+        titled = time.perf_counter() - start
+        tab.Caption = caption
+
+        result = [f"每次都调用 SetStatusText: {direct:.3f} 秒（{total} 次写入）",
+                  f"Progress 状态栏: {status:.3f} 秒（{progress.Writes} 次写入）",
+                  f"Progress 标题: {titled:.3f} 秒（{caption_progress.Writes} 次写入）",
+                  f"最终进度: {progress.Format()}"]
+        _crt.Dialog.MessageBox("\n".join(result), "Progress测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
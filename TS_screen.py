@@ -2,13 +2,46 @@
 # $interface = "1.0"
 
 import os
+import re
 import sys
+import time
 
 def get_script_path():
   return os.path.split(os.path.realpath(__file__))[0]
 sys.path.append(get_script_path())
 
 from SecureCrt.CRT import CRT
+from TS_fakescreen import FakeScreen
+from SecureCrt.ScreenDiff import ScreenDiff
+from SecureCrt.AnsiParser import AnsiParser
+from SecureCrt.Screen import Screen
+from SecureCrt.ScreenSnapshot import ScreenSnapshot
+from SecureCrt.Terminal import Terminal
+
+class SlowDevice(FakeScreen):
+    """
+    模拟慢速设备的 Screen COM 对象：每批次有固定往返延迟，每行有处理延迟，
+    输入缓冲区溢出的行会被丢弃，用于测试 SendLines 的批次确认和重传。
+    """
+    def __init__(self, rtt=0.02, per_line=0.001, buffer=2048, prompt="R1(config)#"):
+        super().__init__()
+        self.rtt = rtt
+        self.per_line = per_line
+        self.buffer = buffer
+        self.prompt = prompt
+        self.ready = 0.0
+
+    def Send(self, string, bSendToScreenOnly=False, bEncode=True):
+        used = 0
+        at = max(time.monotonic(), self.ready) + self.rtt
+        for line in string.split("\r")[:-1]:
+            used += len(line) + 1
+            if used > self.buffer:
+                continue
+            at += self.per_line
+            self.Receive(line + "\r\n" + self.prompt, at=at)
+        self.ready = at
+
 
 def main():
     _crt = CRT(crt) #type: ignore
@@ -23,8 +56,16 @@ def main():
         5. 测试ReadString方法
         6. 测试清屏操作
         7. 测试所有属性
+        8. 测试Snapshot方法
+        9. 测试Diff方法及性能（60行 x 200列）
+        10. 测试Expect方法
+        11. 测试Stream方法及性能
+        12. 测试AnsiParser转义序列解析性能
+        13. 测试Terminal本地屏幕模型
+        14. 测试SendLines批量发送性能（模拟慢速设备）
+        15. 测试Run方法
         0. 退出
-        请选择要测试的功能(0-7): """
+        请选择要测试的功能(0-15): """
         
         while True:
             choice = _crt.Dialog.Prompt(menu, "Screen测试", "1")
@@ -95,6 +136,193 @@ def main():
                 ]
                 _crt.Dialog.MessageBox("\n".join(props), "Screen属性测试")
                 
+            elif choice == "8":
+                # 测试Snapshot方法，快照的查询结果应与直接调用Get/Get2一致
+                rows, cols = _crt.Screen.Rows, _crt.Screen.Columns
+                snap = _crt.Screen.Snapshot()
+                regions = [(1, 1, rows, cols), (1, 1, 1, cols), (2, 3, min(rows, 5), min(cols, 20))]
+                mismatches = []
+                for region in regions:
+                    if snap.Get(*region) != _crt.Screen.Get(*region):
+                        mismatches.append(f"Get{region}")
+                    if snap.Get2(*region) != _crt.Screen.Get2(*region):
+                        mismatches.append(f"Get2{region}")
+                message = f"快照尺寸: {snap.Columns}列 x {snap.Rows}行\n第1行: {snap.Row(1)}\n"
+                message += "不一致的区域:\n" + "\n".join(mismatches) if mismatches else "所有区域与Get/Get2一致"
+                # 行尾空格：快照和 Terminal 的 Get2 都应去掉区域内每行末尾的空格
+                lines = ["ab   x", "cd    ", ""]
+                local = ScreenSnapshot("".join(line.ljust(6) + "\r\n" for line in lines), 3, 6)
+                term = Terminal(3, 6)
+                term.Load(lines, 1, 1)
+                trimmed = local.Get2(1, 1, 3, 4)
+                message += f"\nGet2行尾空格: {trimmed!r} "
+                message += "与Terminal一致" if trimmed == term.Get2(1, 1, 3, 4) == "ab\r\ncd\r\n\r\n" else "与Terminal不一致"
+                _crt.Dialog.MessageBox(message, "Snapshot测试")
+                
+            elif choice == "9":
+                # 测试Diff方法：先在真实屏幕上轮询，再用合成的60行x200列屏幕测量性能
+                _crt.Screen.Diff()
+                _crt.Screen.Send("echo diff-test\r")
+                _crt.Screen.WaitForString("diff-test", 5)
+                changed_rows = [change.Row for change in _crt.Screen.Diff()]
+
+                rows, cols, count = 60, 200, 1000
+                base = [f"{row:4d} " + "x" * (cols - 5) for row in range(rows)]
+                screens = []
+                for i in range(count):
+                    lines = list(base)
+                    lines[i % rows] = f"{i:10d}".ljust(cols, "y")
+                    screens.append("\r\n".join(lines) + "\r\n")
+                unchanged = "\r\n".join(base) + "\r\n"
+
+                diff = ScreenDiff(_crt.Screen)
+                diff.Update(unchanged, rows, cols)
+                start = time.perf_counter()
+                for _ in range(count):
+                    diff.Update(unchanged, rows, cols)
+                idle_cost = (time.perf_counter() - start) / count * 1e6
+                start = time.perf_counter()
+                for text in screens:
+                    diff.Update(text, rows, cols)
+                diff_cost = (time.perf_counter() - start) / count * 1e6
+
+                # 对比每次逐行比较整个屏幕的朴素实现
+                previous = unchanged.split("\r\n")
+                start = time.perf_counter()
+                for text in screens:
+                    current = text.split("\r\n")
+                    [index for index, line in enumerate(current) if line != previous[index]]
+                    previous = current
+                naive_cost = (time.perf_counter() - start) / count * 1e6
+
+                message = f"真实屏幕发生变化的行: {changed_rows}\n\n"
+                message += f"无变化轮询: {idle_cost:.2f} 微秒/次\n"
+                message += f"单行变化轮询: {diff_cost:.2f} 微秒/次\n"
+                message += f"朴素逐行比较: {naive_cost:.2f} 微秒/次"
+                _crt.Dialog.MessageBox(message, "Diff测试")
+                
+            elif choice == "10":
+                # 测试Expect方法：同时等待字符串和正则表达式
+                _crt.Screen.Send("echo expect-test-12345\r")
+                match = _crt.Screen.Expect(["no-such-text", re.compile(r"expect-test-(\d+)\r")], 5)
+                if match:
+                    message = f"匹配索引: {match.Index}\n匹配文本: {match.Text!r}\n分组: {match.Groups}\n"
+                    message += f"匹配之前的文本: {match.Before!r}"
+                else:
+                    message = "未匹配，已超时"
+                # 匹配之后剩余的数据按屏幕保存，另一个包装同一屏幕的 Screen 对象（如 crt.GetTab() 的返回值）也能读到
+                device = FakeScreen()
+                device.Receive("R1# R2#\r\n")
+                first = Screen(device).Expect(re.compile(r"R\d#"), 1)
+                second = Screen(device).Expect(re.compile(r"R\d#"), 1)
+                shared = (first and first.Text, second and second.Text) == ("R1#", "R2#")
+                message += f"\n剩余数据在Screen对象之间共享: {'正确' if shared else '错误'}"
+                _crt.Dialog.MessageBox(message, "Expect测试")
+                
+            elif choice == "11":
+                # 测试Stream方法：读取大量输出，统计吞吐量和数据块数量
+                command = _crt.Dialog.Prompt("请输入产生大量输出的命令:", "Stream测试", "seq 1 200000")
+                prompt = _crt.Dialog.Prompt("请输入命令提示符:", "Stream测试", "$ ")
+                _crt.Screen.Synchronous = True
+                _crt.Screen.Send(command + "\r")
+                start = time.perf_counter()
+                chunks = 0
+                total = 0
+                for chunk in _crt.Screen.Stream(terminators=[prompt]):
+                    chunks += 1
+                    total += len(chunk)
+                elapsed = time.perf_counter() - start
+                _crt.Screen.Synchronous = False
+                message = f"共读取 {total} 个字符，{chunks} 个数据块\n"
+                message += f"耗时 {elapsed:.2f} 秒，吞吐量 {total / elapsed / 1024:.1f} KB/s"
+                _crt.Dialog.MessageBox(message, "Stream测试")
+                
+            elif choice == "12":
+                # 测试AnsiParser：用带颜色的合成输出按4KB分块测量吞吐量（MB/s）
+                line = "\x1b[32mGigabitEthernet0/1\x1b[0m is up, \x1b]0;title\x07line protocol is \x1b[1;31mup\x1b[0m\r\n"
+                data = line * 50000
+                results = []
+                for method in ("Strip", "Feed"):
+                    parser = AnsiParser()
+                    start = time.perf_counter()
+                    for i in range(0, len(data), 4096):
+                        getattr(parser, method)(data[i:i + 4096])
+                    elapsed = time.perf_counter() - start
+                    results.append(f"{method}: {len(data) / elapsed / 1e6:.2f} MB/s")
+                stripped = AnsiParser().Strip(data[:len(line)])
+                message = f"去除转义序列后的一行: {stripped!r}\n" + "\n".join(results)
+                _crt.Dialog.MessageBox(message, "AnsiParser测试")
+                
+            elif choice == "13":
+                # 测试Terminal：用原始数据流驱动本地模型，并与真实屏幕对比
+                command = _crt.Dialog.Prompt("请输入要执行的命令:", "Terminal测试", "ls -l --color=always")
+                prompt = _crt.Dialog.Prompt("请输入命令提示符:", "Terminal测试", "$ ")
+                ignore_escape = _crt.Screen.IgnoreEscape
+                _crt.Screen.Synchronous = True
+                term = _crt.Screen.Terminal()
+                _crt.Screen.Send(command + "\r")
+                for chunk in _crt.Screen.Stream(terminators=[prompt]):
+                    term.Feed(chunk)
+                _crt.Screen.Synchronous = False
+                _crt.Screen.IgnoreEscape = ignore_escape
+                rows, cols = term.Rows, term.Columns
+                same = term.Get(1, 1, rows, cols) == _crt.Screen.Get(1, 1, rows, cols)
+                message = f"本地光标: 行={term.CurrentRow}, 列={term.CurrentColumn}\n"
+                message += f"真实光标: 行={_crt.Screen.CurrentRow}, 列={_crt.Screen.CurrentColumn}\n"
+                message += "屏幕内容一致" if same else "屏幕内容不一致"
+                # 滚动区域：在第1-3行内上滚2行，区域下方的行不能被带进区域
+                region = Terminal(5, 10)
+                region.Load(["r1", "r2", "r3", "r4", "r5"], 1, 1)
+                region.Feed("\x1b[1;3r\x1b[2S")
+                scrolled = region.Get2(1, 1, 5, 10).split("\r\n")[:5]
+                region.Load(["r1", "r2", "r3", "r4", "r5"], 1, 1)
+                region.Feed("\x1b[1;3r\x1b[1;1H\x1b[2M")
+                deleted = region.Get2(1, 1, 5, 10).split("\r\n")[:5]
+                expected = ["r3", "", "", "r4", "r5"]
+                message += f"\n区域滚动(CSI S): {scrolled} {'正确' if scrolled == expected else '错误'}"
+                message += f"\n区域删除行(CSI M): {deleted} {'正确' if deleted == expected else '错误'}"
+                # 备用屏幕：全屏程序退出后恢复主屏幕的内容和光标
+                screen = Terminal(5, 10)
+                screen.Feed("r1\r\nr2\x1b[?1049h\x1b[Hvi\x1b[?1049l")
+                restored = (screen.Get2(1, 1, 2, 10), screen.CurrentRow, screen.CurrentColumn)
+                expected = ("r1\r\nr2\r\n", 2, 3)
+                message += f"\n备用屏幕(?1049): {restored} {'正确' if restored == expected else '错误'}"
+                # 超出屏幕范围的区域与 ScreenSnapshot 一样抛出 IndexError，而不是按负数下标读取最后一行
+                try:
+                    screen.Get(0, 1, 1, 10)
+                    bounds_ok = False
+                except IndexError:
+                    bounds_ok = True
+                message += f"\nGet越界检查: {'正确' if bounds_ok else '错误'}"
+                _crt.Dialog.MessageBox(message, "Terminal测试")
+                
+            elif choice == "14":
+                # 测试SendLines：对比逐行发送与批量发送，并测试缓冲区溢出时的重传
+                lines = [f"interface GigabitEthernet0/{i}" for i in range(300)]
+                results = []
+                reports = []
+                for name, device, batch_size in [("逐行发送", SlowDevice(), 1),
+                                                 ("批量发送", SlowDevice(), 50),
+                                                 ("批量发送（设备缓冲区512字节）", SlowDevice(buffer=512), 50)]:
+                    report = Screen(device).SendLines(lines, "R1(config)#", batch_size, timeout=1)
+                    results.append(f"{name}: {report.LinesPerSecond:.0f} 行/秒，"
+                                   f"{report.Batches} 批次，重传 {report.Retransmitted} 行，失败 {len(report.Failed)} 行")
+                    reports.append(report)
+                # 缓冲区溢出时批次自动缩小，不应比逐行发送更慢
+                overflow_ok = reports[2].LinesPerSecond > reports[0].LinesPerSecond and reports[2].Retransmitted < len(lines) // 3
+                results.append(f"缓冲区溢出时自适应批次: {'正确' if overflow_ok else '错误'}")
+                _crt.Dialog.MessageBox("\n".join(results), "SendLines测试")
+                
+            elif choice == "15":
+                # 测试Run方法：输出中不应包含命令回显和提示符
+                command = _crt.Dialog.Prompt("请输入要执行的命令:", "Run测试", "uname -a")
+                prompt = _crt.Dialog.Prompt("请输入命令提示符:", "Run测试", "$ ")
+                result = _crt.Screen.Run(command, prompt, 10)
+                message = f"输出:\n{result.Output}\n\n"
+                message += f"首字节延迟: {result.FirstByteLatency}\n提示符延迟: {result.PromptLatency:.3f} 秒\n"
+                message += f"超时: {result.TimedOut}"
+                _crt.Dialog.MessageBox(message, "Run测试")
+                
             else:
                 _crt.Dialog.MessageBox("无效选择，请重试", "错误", [16, 0, 0])
         
@@ -0,0 +1,49 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.SessionIndex import SessionIndex
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        default_dir = os.path.join(os.environ.get("APPDATA", ""), "VanDyke", "Config", "Sessions")
+        sessions_dir = _crt.Dialog.Prompt("请输入 Sessions 目录:", "SessionIndex测试", default_dir)
+        hostname = _crt.Dialog.Prompt("请输入要查找的主机名（支持 * 和 ?）:", "SessionIndex测试", "*")
+
+        start = time.perf_counter()
+        index = SessionIndex(sessions_dir)
+        load_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        added, updated, removed = index.Refresh()
+        refresh_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        paths = index.Find(hostname=hostname)
+        find_elapsed = time.perf_counter() - start
+
+        result = [f"索引文件: {index.index_path}",
+                  f"加载索引: {load_elapsed * 1000:.1f} 毫秒",
+                  f"刷新: {refresh_elapsed * 1000:.1f} 毫秒（新增 {added}，更新 {updated}，删除 {removed}，共 {len(index)} 个会话）",
+                  f"查询 hostname={hostname!r}: {find_elapsed * 1000:.2f} 毫秒，{len(paths)} 个结果"]
+        result += [repr(index.Get(path)) for path in paths[:10]]
+        _crt.Dialog.MessageBox("\n".join(result), "SessionIndex测试结果", [64, 0, 0])
+        if paths and _crt.Dialog.MessageBox(f"连接到 {paths[0]}?", "SessionIndex测试", [32 + 4, 0, 0]) == 6:
+            _crt.Session.ConnectInTab(f"/s \"{paths[0]}\"")
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
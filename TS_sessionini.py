@@ -0,0 +1,57 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.SessionIni import SessionIni, FindSessionFiles
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        default_dir = os.path.join(os.environ.get("APPDATA", ""), "VanDyke", "Config", "Sessions")
+        sessions_dir = _crt.Dialog.Prompt("请输入 Sessions 目录:", "SessionIni测试", default_dir)
+        sessions = FindSessionFiles(sessions_dir)
+
+        # 逐字节还原：解析后不修改，输出必须与原文件完全相同
+        start = time.perf_counter()
+        mismatched = []
+        for path, filename in sessions.items():
+            with open(filename, "rb") as f:
+                data = f.read()
+            if SessionIni(data, filename).ToBytes() != data:
+                mismatched.append(path)
+        parse_elapsed = time.perf_counter() - start
+
+        # 与 COM 接口对比前若干个会话的选项值
+        options = ["Hostname", "Port", "Protocol Name", "Username"]
+        differences = []
+        sample = list(sessions.items())[:20]
+        start = time.perf_counter()
+        for path, filename in sample:
+            ini = SessionIni.Load(filename)
+            config = _crt.OpenSessionConfiguration(path)
+            for name in options:
+                if name in ini.Options and str(ini.GetOption(name)) != str(config.GetOption(name)):
+                    differences.append(f"{path} {name}: {ini.GetOption(name)!r} != {config.GetOption(name)!r}")
+        compare_elapsed = time.perf_counter() - start
+
+        result = [f"会话文件: {len(sessions)} 个，解析并还原耗时 {parse_elapsed:.3f} 秒",
+                  f"还原不一致: {len(mismatched)} 个"] + mismatched[:10]
+        result += [f"与 COM 对比 {len(sample)} 个会话耗时 {compare_elapsed:.3f} 秒，不一致: {len(differences)} 项"]
+        result += differences[:10]
+        _crt.Dialog.MessageBox("\n".join(result), "SessionIni测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
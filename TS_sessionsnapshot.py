@@ -0,0 +1,51 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+
+def read_properties(session):
+    values = [session.Connected, session.Label, session.Locked, session.Logging, session.Path]
+    if session.Connected:
+        try:
+            values += [session.LocalAddress, session.RemoteAddress, session.RemotePort]
+        except Exception:
+            pass
+    return values
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        rounds = 10
+        count = _crt.GetTabCount()
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for index in range(1, count + 1):
+                read_properties(_crt.GetTab(index).Session)
+        direct = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            snapshots = _crt.SessionSnapshots.All()
+        cached = time.perf_counter() - start
+
+        result = [f"{snap.Label}: Connected={snap.Connected} {snap.RemoteAddress}:{snap.RemotePort}" for snap in snapshots]
+        result.append(f"\n{count} 个选项卡 × {rounds} 次报表")
+        result.append(f"逐个读取属性: {direct:.3f} 秒")
+        result.append(f"SessionSnapshots（TTL {_crt.SessionSnapshots.ttl} 秒）: {cached:.3f} 秒")
+        _crt.Dialog.MessageBox("\n".join(result), "SessionSnapshot测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
@@ -0,0 +1,47 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.SessionIni import SessionIni
+from SecureCrt.SessionTemplates import TemplateSet, SessionGenerator, ReadInventory
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        default_dir = os.path.join(os.environ.get("APPDATA", ""), "VanDyke", "Config", "Sessions")
+        sessions_dir = _crt.Dialog.Prompt("请输入 Sessions 目录:", "SessionTemplates测试", default_dir)
+        templates_dir = _crt.Dialog.Prompt("请输入模板目录（每个 .ini 文件是一个模板，base.ini 是其他模板的父模板）:",
+                                           "SessionTemplates测试", os.path.join(get_script_path(), "templates"))
+        inventory = _crt.Dialog.Prompt("请输入主机清单 CSV 文件（包含 Path、Template 列）:", "SessionTemplates测试",
+                                       os.path.join(get_script_path(), "hosts.csv"))
+
+        templates = TemplateSet()
+        names = [name[:-4] for name in os.listdir(templates_dir) if name.lower().endswith(".ini")]
+        for name in names:
+            ini = SessionIni.Load(os.path.join(templates_dir, name + ".ini"))
+            templates.DefineFromIni(name, ini, None if name == "base" or "base" not in names else "base")
+
+        generator = SessionGenerator(templates, sessions_dir)
+        rows = ReadInventory(inventory)
+        first = generator.Sync(rows)
+        second = generator.Sync(rows)
+        result = [f"模板: {len(names)} 个，清单: {len(rows)} 行",
+                  f"第一次同步: {first!r}",
+                  f"第二次同步（应全部跳过）: {second!r}"]
+        result += [f"{path}: {error}" for path, error in first.Failed[:10]]
+        _crt.Dialog.MessageBox("\n".join(result), "SessionTemplates测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
@@ -0,0 +1,88 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from TS_fakescreen import FakeScreen
+from SecureCrt.Tab import Tab
+from SecureCrt.SftpBatch import SftpBatch
+
+class FakeSftpScreen(FakeScreen):
+    """
+    模拟 SFTP 选项卡 Screen COM 对象的测试替身：
+    按顺序处理收到的 put/get 命令，每条命令的输出在发送后至少经过一个往返延迟才到达，
+    输出进度行、完成行和 "sftp> " 提示符；名称包含 missing 的文件返回错误。
+    """
+    def __init__(self, rtt=0.05, bytes_per_second=10 * 1024 * 1024, size=256 * 1024):
+        super().__init__()
+        self.rtt = rtt
+        self.bytes_per_second = bytes_per_second
+        self.size = size
+        self.Receive("sftp> ", at=0.0)
+        self.ready = 0.0
+
+    def Send(self, string, bSendToScreenOnly=False, bEncode=True):
+        for command in string.split("\r")[:-1]:
+            at = max(time.monotonic() + self.rtt, self.ready)
+            name = command.split('"')[1]
+            if "missing" in name:
+                text = f"{command}\r\n{name}: No such file or directory\r\nsftp> "
+            else:
+                seconds = self.size / self.bytes_per_second
+                at += seconds
+                text = (f"{command}\r\nUploading {name}\r\n  50%\r  100% {self.size // 1024}KB\r\n"
+                        f"{name}: {self.size} bytes transferred in {seconds:.2f} seconds\r\nsftp> ")
+            self.Receive(text, at=at)
+            self.ready = at
+
+
+class FakeSftpTab:
+    def __init__(self, screen):
+        self.Screen = screen
+
+    def Close(self):
+        pass
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        files = [(f"C:\\temp\\file{i}.bin", f"/tmp/file{i}.bin") for i in range(40)]
+        files.append(("C:\\temp\\missing.bin", "/tmp/missing.bin"))
+        lines = ["测试替身（40个文件，往返延迟50毫秒）:"]
+        for depth in (1, 8):
+            batch = SftpBatch(Tab(FakeSftpTab(FakeSftpScreen())), depth=depth, timeout=10)
+            batch.screen.Expect("sftp> ", 5)
+            percents = []
+            report = batch.Put(files, lambda result, percent: percents.append(percent))
+            lines.append(f"depth={depth}: 耗时 {report.Elapsed:.2f} 秒，总体 {report.Throughput / 1024:.0f} KB/s，"
+                         f"失败 {len(report.Failed)} 个（{report.Failed[0].Error if report.Failed else ''}），"
+                         f"进度回调 {len(percents)} 次")
+        _crt.Dialog.MessageBox("\n".join(lines), "SftpBatch测试结果", [64, 0, 0])
+
+        if _crt.Dialog.MessageBox("是否在当前会话上测试真实的SFTP批量上传?", "SftpBatch测试", [32 + 4, 0, 0]) == 6:
+            local = _crt.Dialog.FileOpenDialog("选择要上传的文件")
+            if local:
+                remote_dir = _crt.Dialog.Prompt("远程目录:", "SftpBatch测试", "/tmp")
+                # with 语句结束时恢复 Synchronous 并关闭 SFTP 选项卡
+                with SftpBatch.Open(_crt.GetScriptTab()) as batch:
+                    name = os.path.basename(local)
+                    report = batch.Put([(local, f"{remote_dir}/{i}_{name}") for i in range(5)])
+                result = [f"{item.Remote}: {'成功' if item.Ok else item.Error} {item.Throughput / 1024:.0f} KB/s"
+                          for item in report.Results]
+                result.append(f"总体: {report.Throughput / 1024:.0f} KB/s，耗时 {report.Elapsed:.2f} 秒")
+                _crt.Dialog.MessageBox("\n".join(result), "SftpBatch测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
@@ -0,0 +1,53 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    try:
+        result = []
+        start = time.perf_counter()
+        _crt.TabIndex.Rebuild()
+        result.append(f"建立索引耗时: {time.perf_counter() - start:.3f} 秒（{_crt.GetTabCount()} 个选项卡）")
+
+        script_tab = _crt.GetScriptTab()
+        caption = script_tab.Caption
+        path = script_tab.Session.Path
+
+        # 使用索引查找
+        start = time.perf_counter()
+        by_caption = _crt.TabIndex.FindByCaption(caption)
+        by_path = _crt.TabIndex.FindByPath(path)
+        indexed = time.perf_counter() - start
+
+        # 逐个遍历选项卡查找，用于对比
+        start = time.perf_counter()
+        scanned = [i for i in range(1, _crt.GetTabCount() + 1)
+                   if _crt.GetTab(i).Caption == caption or _crt.GetTab(i).Session.Path == path]
+        scan = time.perf_counter() - start
+
+        result.append(f"按标题 {caption!r} 找到: {[tab.Index for tab in by_caption]}")
+        result.append(f"按路径 {path!r} 找到: {[tab.Index for tab in by_path]}")
+        result.append(f"遍历找到: {scanned}")
+        result.append(f"索引查找耗时: {indexed * 1000:.2f} 毫秒，遍历查找耗时: {scan * 1000:.2f} 毫秒")
+        if script_tab.Session.Connected:
+            address = script_tab.Session.RemoteAddress
+            result.append(f"按远程地址 {address} 找到: {[tab.Index for tab in _crt.TabIndex.FindByRemoteAddress(address)]}")
+        _crt.Dialog.MessageBox("\n".join(result), "TabIndex测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    return
+
+main()
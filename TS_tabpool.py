@@ -0,0 +1,54 @@
+# $language = "Python3"
+# $interface = "1.0"
+
+import os
+import sys
+import time
+
+def get_script_path():
+  return os.path.split(os.path.realpath(__file__))[0]
+sys.path.append(get_script_path())
+
+from SecureCrt.CRT import CRT
+from SecureCrt.TabPool import TabPool
+
+def main():
+    _crt = CRT(crt) #type: ignore
+    pool = TabPool(max_tabs=4, max_idle=60)
+    try:
+        source = _crt.GetScriptTab()
+        if not source.Session.Connected:
+            _crt.Dialog.MessageBox("请在已连接的会话中运行此脚本", "TabPool测试", [48, 0, 0])
+            return
+        start = time.perf_counter()
+        path = pool.Register(source, 2)
+        warm = time.perf_counter() - start
+        result = [f"会话路径: {path}", f"预克隆2个选项卡耗时: {warm:.2f} 秒", f"池中选项卡数: {pool.Count}"]
+
+        # 重复借出和归还，应复用已克隆的选项卡而不再重新连接
+        start = time.perf_counter()
+        for _ in range(10):
+            with pool.Lease(path) as tab:
+                tab.Session.SetStatusText("TabPool测试")
+        result.append(f"借出/归还10次耗时: {time.perf_counter() - start:.3f} 秒，池中选项卡数: {pool.Count}")
+
+        # 超过上限时应引发异常
+        leased = [pool.Acquire(path) for _ in range(4)]
+        try:
+            pool.Acquire(path)
+            result.append("错误：超过上限时未引发异常")
+        except RuntimeError as e:
+            result.append(f"超过上限: {e}")
+        for tab in leased:
+            pool.Release(tab)
+        _crt.Dialog.MessageBox("\n".join(result), "TabPool测试结果", [64, 0, 0])
+    except Exception as e:
+        errcode = _crt.GetLastError()
+        errmessage = _crt.GetLastErrorMessage()
+        _crt.ClearLastError()
+        _crt.Dialog.MessageBox(f"Error Code: {errcode}\nError Message: {errmessage if errcode!=0 else e}", "Error Cleared", [16, 0, 0])
+    finally:
+        pool.Close()
+    return
+
+main()